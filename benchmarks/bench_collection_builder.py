@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Mesure du coût d'accumulation des polygones lors de la génération d'une collection.
+
+La génération récursive de Collection.random est reproduite avec des polygones
+déjà construits, pour isoler le coût de l'accumulation :
+- concaténations successives de collections (ancienne méthode) ;
+- ajouts dans un CollectionBuilder.
+La génération complète par Collection.random est ensuite chronométrée.
+"""
+
+import argparse
+import time
+
+from geometry.collection import Collection, CollectionBuilder
+from geometry.shapes.rectangle import Rectangle
+from geometry.vertice import Vertice
+
+DIVISIONS = 4
+
+
+def accumulate_by_concatenation(polygons):
+    """
+    Accumule les polygones récursivement par concaténations de collections.
+
+    Args:
+        polygons (list[Polygon]):
+            Polygones à accumuler.
+    Returns:
+        Collection:
+            Collection contenant les polygones.
+    """
+    if not polygons:
+        return Collection()
+
+    collection = Collection([polygons[0]])
+    rest = polygons[1:]
+    share = len(rest) % DIVISIONS + len(rest) // DIVISIONS
+    for start in range(0, len(rest), max(share, 1)):
+        collection += accumulate_by_concatenation(rest[start:start + share])
+    return collection
+
+
+def accumulate_with_builder(polygons, builder, start=0, stop=None):
+    """
+    Accumule les polygones récursivement dans un constructeur de collection.
+
+    Args:
+        polygons (list[Polygon]):
+            Polygones à accumuler.
+        builder (CollectionBuilder):
+            Constructeur de collection.
+        start, stop (int):
+            Tranche des polygones à accumuler.
+    """
+    stop = len(polygons) if stop is None else stop
+    if start >= stop:
+        return
+
+    builder.append(polygons[start])
+    start += 1
+    share = (stop - start) % DIVISIONS + (stop - start) // DIVISIONS
+    for first in range(start, stop, max(share, 1)):
+        accumulate_with_builder(polygons, builder, first, min(first + share, stop))
+
+
+def timed(function, *args):
+    """
+    Retourne la durée d'exécution d'une fonction et son résultat.
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100_000, help="Nombre de polygones. (par défaut à 10^5)")
+    parser.add_argument("--skip-random", action="store_true", help="Ne pas chronométrer Collection.random.")
+    arguments = parser.parse_args()
+
+    polygons = [Rectangle(Vertice(index % 1000, index // 1000), 1., 1.) for index in range(arguments.count)]
+
+    def concatenate():
+        result = accumulate_by_concatenation(polygons)
+        result.buffers()
+        return result
+
+    # Les deux méthodes produisent une collection dont les tampons sont calculés.
+    duration, collection = timed(concatenate)
+    print(f"concaténations   : {duration:8.3f} s ({len(collection)} polygones)")
+
+    def build():
+        builder = CollectionBuilder(len(polygons))
+        accumulate_with_builder(polygons, builder)
+        return builder.build()
+
+    duration, collection = timed(build)
+    print(f"CollectionBuilder: {duration:8.3f} s ({len(collection)} polygones)")
+
+    if not arguments.skip_random:
+        for polygon_type in ("rectangle", "polygon"):
+            duration, collection = timed(Collection.random, {'type': polygon_type, 'count': arguments.count})
+            print(f"Collection.random ({polygon_type}): {duration:8.3f} s ({len(collection)} polygones)")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Mesure du calcul de la surface couverte par des rectangles (Collection.union_area).
+
+Le balayage avec arbre de segments, exact, est comparé à la rastérisation de la
+couverture (Collection.covered_mask) à plusieurs résolutions, dont l'erreur relative
+est affichée.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from geometry.collection import Collection
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=10_000, help="Nombre de rectangles. (par défaut à 10000)")
+    parser.add_argument("--resolutions", type=int, nargs="+", default=[256, 1024, 4096],
+                        help="Côtés des grilles de rastérisation. (par défaut à 256 1024 4096)")
+    parser.add_argument("--seed", type=int, default=0, help="Graine aléatoire. (par défaut à 0)")
+    arguments = parser.parse_args()
+
+    rng = np.random.default_rng(arguments.seed)
+    space = np.array([Collection.DEFAULT_RANDOM_SPACE_WIDTH, Collection.DEFAULT_RANDOM_SPACE_LENGTH])
+    corners = rng.random((arguments.count, 2)) * space
+    dimensions = rng.random((arguments.count, 2)) * space / 20
+    coordinates = (corners[:, None, :] + dimensions[:, None, :] * [[0, 0], [1, 0], [1, 1], [0, 1]]).reshape(-1, 2)
+    offsets = np.arange(0, 4 * arguments.count + 1, 4)
+    collection = Collection.from_buffers(coordinates, offsets,
+                                         (np.arange(arguments.count), dimensions[:, ::-1].copy()))
+
+    start = time.perf_counter()
+    area = collection.union_area()
+    duration = time.perf_counter() - start
+    print(f"balayage        : {duration:8.3f} s, aire {area:.2f}")
+
+    window = (*collection.bounds()[:, :2].min(axis=0), *collection.bounds()[:, 2:].max(axis=0))
+    pixel_area = (window[2] - window[0]) * (window[3] - window[1])
+    for resolution in arguments.resolutions:
+        start = time.perf_counter()
+        mask = collection.covered_mask((resolution, resolution), window)
+        duration = time.perf_counter() - start
+        raster_area = mask.mean() * pixel_area
+        print(f"grille {resolution:>5}² : {duration:8.3f} s, erreur relative {abs(raster_area - area) / area:.2e}")
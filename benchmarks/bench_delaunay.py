@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Mesure de la triangulation de Delaunay incrémentale (DelaunayTriangulation).
+
+Des points uniformes sont triangulés pour plusieurs tailles. Sont mesurés :
+- la durée de construction par point, qui ne croît qu'en O(log n) ;
+- le nombre de nœuds de la structure de localisation par point ;
+- l'ajout d'un petit nombre de points à une triangulation existante, comparé à
+  la reconstruction complète.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from geometry.utilities.delaunay import DelaunayTriangulation
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", type=int, nargs="+", default=[1000, 10_000, 50_000],
+                        help="Nombres de points. (par défaut à 1000 10000 50000)")
+    parser.add_argument("--added", type=int, default=100, help="Nombre de points ajoutés. (par défaut à 100)")
+    parser.add_argument("--seed", type=int, default=0, help="Graine aléatoire. (par défaut à 0)")
+    arguments = parser.parse_args()
+
+    rng = np.random.default_rng(arguments.seed)
+    for count in arguments.counts:
+        points = rng.random((count + arguments.added, 2))
+
+        start = time.perf_counter()
+        triangulation = DelaunayTriangulation(points[:count], rng)
+        duration = time.perf_counter() - start
+        print(f"n = {count:7d} : construction {duration:7.3f} s ({duration / count * 1e6:5.1f} µs/point),"
+              f" {len(triangulation.vertices) / count:.1f} nœuds/point")
+
+        start = time.perf_counter()
+        triangulation.add(points[count:], rng)
+        added = time.perf_counter() - start
+        start = time.perf_counter()
+        rebuilt = DelaunayTriangulation(points, rng)
+        rebuild = time.perf_counter() - start
+        print(f"            ajout de {arguments.added} points {added:7.3f} s, reconstruction {rebuild:7.3f} s")
+
+        assert len(triangulation) == len(rebuilt)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Mesure du temps d'import des modules de la librairie dans un interpréteur neuf.
+
+Pour chaque module, l'import seul est chronométré, puis l'import suivi d'un
+calcul d'aire, qui ne doit charger aucune dépendance lourde.
+"""
+
+import statistics
+import subprocess
+import sys
+
+MODULES = [
+    "geometry.vertice",
+    "geometry.segment",
+    "geometry.shapes.polygon",
+    "geometry.shapes.rectangle",
+    "geometry.collection",
+]
+
+HEAVY_MODULES = ["numpy", "cv2", "largestinteriorrectangle", "numba"]
+
+RUNS = 7
+
+SCRIPT = """
+import sys
+import time
+
+start = time.perf_counter()
+import {module}
+from geometry.shapes.polygon import Polygon
+from geometry.vertice import Vertice
+Polygon([Vertice(0, 0), Vertice(1, 0), Vertice(0, 1)]).area()
+elapsed = time.perf_counter() - start
+
+from geometry.utilities.lazy import is_loaded
+loaded = [name for name in {heavy!r} if name in sys.modules and is_loaded(sys.modules[name])]
+print(elapsed, ",".join(loaded))
+"""
+
+
+def measure(module):
+    """
+    Retourne la durée médiane d'import d'un module et les dépendances lourdes chargées.
+
+    Args:
+        module (str):
+            Nom complet du module.
+    Returns:
+        tuple(float, str):
+            Durée médiane en secondes, dépendances lourdes chargées.
+    """
+    durations = []
+    loaded = ""
+    for _ in range(RUNS):
+        output = subprocess.run([sys.executable, "-c", SCRIPT.format(module=module, heavy=HEAVY_MODULES)],
+                                capture_output=True, text=True, check=True).stdout.split()
+        durations.append(float(output[0]))
+        loaded = output[1] if len(output) > 1 else ""
+
+    return statistics.median(durations), loaded
+
+
+if __name__ == "__main__":
+    print(f"{'module':<30}{'import (ms)':>12}  dépendances lourdes chargées")
+    for name in MODULES:
+        duration, heavy = measure(name)
+        print(f"{name:<30}{duration * 1000:>12.1f}  {heavy or '-'}")
+
+    # Référence : coût d'un import complet des dépendances lourdes
+    duration, _ = measure("numpy, largestinteriorrectangle")
+    print(f"{'numpy + largestinteriorrectangle':<30}{duration * 1000:>12.1f}")
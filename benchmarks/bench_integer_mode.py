@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Mesure du mode entier des collections (Collection.astype(numpy.int32)).
+
+Des polygones simples à coordonnées entières sont générés dans l'espace par défaut,
+puis stockés en float64 et en int32. Sont comparés :
+- la mémoire occupée par les tampons de coordonnées ;
+- la recherche des paires de polygones qui se chevauchent (prédicats d'orientation
+  exacts en arithmétique entière pour le mode entier) ;
+- le calcul des plus grands rectangles intérieurs, qui utilise directement les
+  tampons int32, sans conversion.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from geometry.collection import Collection
+
+
+def measure(label, function):
+    """
+    Affiche la durée d'un appel et retourne son résultat.
+    """
+    start = time.perf_counter()
+    result = function()
+    print(f"{label:42s}: {time.perf_counter() - start:8.3f} s")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=2000, help="Nombre de polygones. (par défaut à 2000)")
+    parser.add_argument("--seed", type=int, default=0, help="Graine aléatoire. (par défaut à 0)")
+    arguments = parser.parse_args()
+
+    rng = np.random.default_rng(arguments.seed)
+    space = np.array([Collection.DEFAULT_RANDOM_SPACE_WIDTH, Collection.DEFAULT_RANDOM_SPACE_LENGTH])
+    # Triangles et quadrilatères convexes qui se chevauchent, à sommets entiers
+    counts = rng.integers(3, 5, arguments.count)
+    offsets = np.zeros(arguments.count + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    owners = np.repeat(np.arange(arguments.count), counts)
+    angles = (np.arange(offsets[-1]) - offsets[owners]) * 2 * np.pi / counts[owners]
+    centers = rng.random((arguments.count, 2)) * space
+    radii = rng.random(arguments.count) * space.min() / 50 + 5
+    coordinates = np.round(centers[owners] + radii[owners, None] * np.stack([np.cos(angles), np.sin(angles)], axis=1))
+
+    floating = Collection.from_buffers(coordinates, offsets)
+    integer = floating.astype(np.int32)
+    print(f"tampons de coordonnées : float64 {floating.buffers()[0].nbytes / 1e6:.2f} Mo,"
+          f" int32 {integer.buffers()[0].nbytes / 1e6:.2f} Mo")
+
+    expected = measure("overlapping_pairs (float64)", floating.overlapping_pairs)
+    pairs = measure("overlapping_pairs (int32)", integer.overlapping_pairs)
+    assert np.array_equal(pairs, expected)
+
+    # Compilation préalable de la librairie largestinteriorrectangle
+    floating[[0]].largest_interior_rectangles()
+    expected = measure("largest_interior_rectangles (float64)", floating.largest_interior_rectangles)
+    rectangles = measure("largest_interior_rectangles (int32)", integer.largest_interior_rectangles)
+    assert np.array_equal(rectangles, expected)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Mesure de la somme de Minkowski de polygones convexes (Polygon.minkowski_sum, Collection.minkowski_sum).
+
+La fusion d'arêtes est comparée à l'enveloppe convexe des sommes de toutes les paires
+de sommets, en O(nm log nm) :
+- pour deux polygones de n sommets ;
+- pour le gonflement de toute une collection d'obstacles convexes par un même noyau.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from geometry.collection import Collection
+from geometry.shapes.polygon import Polygon, convex_hull_points
+from geometry.shapes.rectangle import Rectangle
+from geometry.vertice import Vertice
+
+
+def regular_polygon(vertices_count, radius, phase=0.):
+    """
+    Retourne un polygone régulier convexe centré à l'origine.
+    """
+    angles = phase + np.arange(vertices_count) * 2 * np.pi / vertices_count
+    return Polygon([Vertice(radius * np.cos(angle), radius * np.sin(angle)) for angle in angles])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vertices", type=int, default=1000,
+                        help="Nombre de sommets des deux polygones. (par défaut à 1000)")
+    parser.add_argument("--count", type=int, default=5000, help="Nombre d'obstacles. (par défaut à 5000)")
+    parser.add_argument("--kernel", type=int, default=16, help="Nombre de sommets du noyau. (par défaut à 16)")
+    arguments = parser.parse_args()
+
+    first, second = regular_polygon(arguments.vertices, 10.), regular_polygon(arguments.vertices, 3., phase=0.1)
+    start = time.perf_counter()
+    first.minkowski_sum(second)
+    merge_duration = time.perf_counter() - start
+    start = time.perf_counter()
+    pairs = (first.coordinates()[:, None] + second.coordinates()[None]).reshape(-1, 2)
+    convex_hull_points(pairs)
+    hull_duration = time.perf_counter() - start
+    print(f"deux polygones de {arguments.vertices} sommets : fusion {merge_duration:8.3f} s,"
+          f" enveloppe des paires {hull_duration:8.3f} s")
+
+    # Un polygone convexe de n sommets entiers demande une boîte d'au moins n de côté : l'espace est agrandi.
+    space = Rectangle(Vertice(), 4 * Collection.DEFAULT_RANDOM_SPACE_LENGTH, 4 * Collection.DEFAULT_RANDOM_SPACE_WIDTH)
+    obstacles = Collection.random({'type': 'convex', 'count': arguments.count, 'placement': 'grid',
+                                   'space': {'space': space}})
+    obstacles.buffers()
+    kernel = regular_polygon(arguments.kernel, 5.)
+    start = time.perf_counter()
+    obstacles.minkowski_sum(kernel)
+    merge_duration = time.perf_counter() - start
+    kernel_coordinates = kernel.coordinates()
+    start = time.perf_counter()
+    for polygon in obstacles.polygons:
+        convex_hull_points((polygon.coordinates()[:, None] + kernel_coordinates[None]).reshape(-1, 2))
+    hull_duration = time.perf_counter() - start
+    print(f"{arguments.count} obstacles, noyau de {arguments.kernel} sommets : fusion {merge_duration:8.3f} s,"
+          f" enveloppe des paires {hull_duration:8.3f} s")
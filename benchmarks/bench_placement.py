@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Mesure du coût de placement des polygones par Collection.random.
+
+Les deux méthodes de placement sont chronométrées pour des nombres croissants
+de polygones :
+- subdivisions récursives du plus grand rectangle intérieur (par défaut) ;
+- grille de hachage uniforme des boîtes englobantes ('grid').
+"""
+
+import argparse
+import time
+
+from geometry.collection import Collection
+
+
+def timed(function, *args):
+    """
+    Retourne la durée d'exécution d'une fonction et son résultat.
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", type=int, nargs="+", default=[100, 1000, 10_000],
+                        help="Nombres de polygones. (par défaut à 10^2 10^3 10^4)")
+    parser.add_argument("--type", default="simple", help="Type de polygones. (par défaut à 'simple')")
+    parser.add_argument("--density", type=float, default=0.5, help="Densité visée en placement 'grid'.")
+    parser.add_argument("--skip-subdivision", action="store_true", help="Ne pas chronométrer les subdivisions.")
+    arguments = parser.parse_args()
+
+    placements = ("grid",) if arguments.skip_subdivision else ("subdivision", "grid")
+    for count in arguments.counts:
+        for placement in placements:
+            options = {'type': arguments.type, 'count': count, 'placement': placement, 'density': arguments.density}
+            duration, collection = timed(Collection.random, options)
+            print(f"{placement:<11} {count:>8} polygones : {duration:8.3f} s")
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Mesure de la jointure spatiale points-polygones (Collection.locate_points).
+
+Des points aléatoires sont localisés dans une collection de polygones placés en grille.
+La jointure indexée est comparée à la boucle naïve qui applique le test de croisement
+vectorisé (collision.points_in_polygon) à chaque polygone, sur une partie des points.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from geometry.collection import Collection
+from geometry.utilities import collision
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=10_000, help="Nombre de polygones. (par défaut à 10000)")
+    parser.add_argument("--points", type=int, default=1_000_000, help="Nombre de points. (par défaut à 10^6)")
+    parser.add_argument("--reference-points", type=int, default=10_000,
+                        help="Nombre de points de la boucle naïve. (par défaut à 10000)")
+    parser.add_argument("--seed", type=int, default=0, help="Graine aléatoire. (par défaut à 0)")
+    arguments = parser.parse_args()
+
+    collection = Collection.random({'type': 'simple', 'count': arguments.count, 'placement': 'grid'})
+    coordinates, offsets = collection.buffers()
+    bounds = collection.bounds()
+
+    rng = np.random.default_rng(arguments.seed)
+    lower, upper = np.nanmin(bounds[:, :2], axis=0), np.nanmax(bounds[:, 2:], axis=0)
+    points = lower + rng.random((arguments.points, 2)) * (upper - lower)
+
+    start = time.perf_counter()
+    located = collection.locate_points(points)
+    duration = time.perf_counter() - start
+    print(f"jointure indexée : {arguments.points / duration:12.0f} points/s"
+          f" ({np.count_nonzero(located >= 0)} points dans un polygone)")
+
+    reference = points[:arguments.reference_points]
+    expected = np.full(len(reference), -1)
+    start = time.perf_counter()
+    for index in reversed(range(len(collection))):
+        expected[collision.points_in_polygon(reference, coordinates[offsets[index]:offsets[index + 1]])] = index
+    duration = time.perf_counter() - start
+    print(f"boucle naïve     : {len(reference) / duration:12.0f} points/s")
+
+    assert np.array_equal(located[:len(reference)], expected)
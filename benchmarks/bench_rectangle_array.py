@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Mesure de l'ensemble de rectangles contigu (RectangleArray).
+
+Des rectangles aléatoires, qui se chevauchent, sont tirés dans l'espace par défaut. Sont comparés :
+- la mémoire occupée par les objets Rectangle et par les quatre tableaux ;
+- la recherche des paires de rectangles qui se chevauchent, avec leurs aires
+  d'intersection, par rapport à Collection.overlapping_pairs().
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from geometry.collection import Collection
+from geometry.shapes.rectangle import RectangleArray
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=20_000, help="Nombre de rectangles. (par défaut à 20000)")
+    parser.add_argument("--seed", type=int, default=0, help="Graine aléatoire. (par défaut à 0)")
+    arguments = parser.parse_args()
+
+    rng = np.random.default_rng(arguments.seed)
+    space = np.array([Collection.DEFAULT_RANDOM_SPACE_WIDTH, Collection.DEFAULT_RANDOM_SPACE_LENGTH])
+    corners = rng.random((arguments.count, 2)) * space
+    dimensions = rng.random((arguments.count, 2)) * space / 100
+    rectangles = RectangleArray(corners[:, 0], corners[:, 1], dimensions[:, 0], dimensions[:, 1])
+
+    tracemalloc.start()
+    collection = Collection(rectangles.to_collection().polygons)
+    objects_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    arrays_size = sum(values.nbytes for values in (rectangles.x, rectangles.y, rectangles.widths, rectangles.lengths))
+    print(f"mémoire : objets Rectangle {objects_size / arguments.count:6.0f} o/rectangle,"
+          f" tableaux {arrays_size / arguments.count:6.0f} o/rectangle")
+
+    start = time.perf_counter()
+    pairs, areas = rectangles.overlaps()
+    duration = time.perf_counter() - start
+    print(f"RectangleArray.overlaps      : {duration:8.3f} s, {len(pairs)} paires")
+
+    start = time.perf_counter()
+    expected = collection.overlapping_pairs()
+    duration = time.perf_counter() - start
+    print(f"Collection.overlapping_pairs : {duration:8.3f} s, {len(expected)} paires (bords inclus)")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Mesure de l'effet du tri spatial (Collection.sort_spatially) sur les requêtes spatiales.
+
+Une même collection est chronométrée dans l'ordre de génération, puis triée le long
+des courbes de Morton et de Hilbert :
+- requêtes par fenêtre : sélection des polygones dont la boîte englobante coupe une
+  fenêtre aléatoire, puis lecture de leurs coordonnées ;
+- export par tuiles : chaque tuile d'une grille reçoit les polygones dont le centre y
+  tombe, encodés au format binaire.
+
+Le nombre moyen de plages d'indices consécutifs par requête correspond au nombre de
+lectures nécessaires pour charger la sélection depuis un fichier trié de la même manière.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from geometry.collection import Collection
+from geometry.formats import encode_chunk
+from geometry.shapes.rectangle import Rectangle
+from geometry.vertice import Vertice
+
+
+def ranges_count(indices):
+    """
+    Retourne le nombre de plages d'indices consécutifs d'une sélection triée.
+    """
+    return int(len(indices) > 0) + int(np.count_nonzero(np.diff(indices) != 1))
+
+
+def window_queries(collection, windows):
+    """
+    Retourne la durée des requêtes par fenêtre et le nombre moyen de plages par requête.
+    """
+    bounds = collection.bounds()
+    ranges = 0
+    start = time.perf_counter()
+    for x_min, y_min, x_max, y_max in windows.tolist():
+        hits = np.flatnonzero((bounds[:, 0] <= x_max) & (bounds[:, 2] >= x_min)
+                              & (bounds[:, 1] <= y_max) & (bounds[:, 3] >= y_min))
+        collection[hits].buffers()
+        ranges += ranges_count(hits)
+    return time.perf_counter() - start, ranges / len(windows)
+
+
+def tiled_export(collection, tiles):
+    """
+    Retourne la durée de l'export par tuiles, le nombre d'octets écrits et le nombre moyen de plages par tuile.
+    """
+    bounds = collection.bounds()
+    centers = (bounds[:, :2] + bounds[:, 2:]) / 2
+    lower, upper = centers.min(axis=0), centers.max(axis=0)
+    cells = np.minimum(((centers - lower) / (upper - lower) * tiles).astype(np.int64), tiles - 1)
+    tile_indices = cells[:, 1] * tiles + cells[:, 0]
+
+    size, ranges = 0, 0
+    start = time.perf_counter()
+    for tile in range(tiles * tiles):
+        hits = np.flatnonzero(tile_indices == tile)
+        size += len(encode_chunk(*collection[hits].buffers(), 'binary'))
+        ranges += ranges_count(hits)
+    return time.perf_counter() - start, size, ranges / (tiles * tiles)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=20_000, help="Nombre de polygones. (par défaut à 20000)")
+    parser.add_argument("--queries", type=int, default=2000, help="Nombre de fenêtres. (par défaut à 2000)")
+    parser.add_argument("--window", type=float, default=0.05,
+                        help="Côté des fenêtres, en fraction de l'espace. (par défaut à 0.05)")
+    parser.add_argument("--tiles", type=int, default=16, help="Nombre de tuiles par côté. (par défaut à 16)")
+    parser.add_argument("--seed", type=int, default=0, help="Graine aléatoire. (par défaut à 0)")
+    arguments = parser.parse_args()
+
+    # Un polygone convexe de n sommets entiers demande une boîte d'au moins n de côté : l'espace est agrandi.
+    space_length, space_width = 4 * Collection.DEFAULT_RANDOM_SPACE_LENGTH, 4 * Collection.DEFAULT_RANDOM_SPACE_WIDTH
+    generated = Collection.random({'type': 'convex', 'count': arguments.count, 'placement': 'grid',
+                                   'form': {'min_vertices_count': 3, 'max_vertices_count': 8},
+                                   'space': {'space': Rectangle(Vertice(), space_length, space_width)}})
+    buffers = generated.buffers()
+
+    rng = np.random.default_rng(arguments.seed)
+    sides = arguments.window * np.array([space_width, space_length])
+    corners = rng.random((arguments.queries, 2)) * (np.array([space_width, space_length]) - sides)
+    windows = np.hstack([corners, corners + sides])
+
+    for curve in (None, 'morton', 'hilbert'):
+        collection = Collection.from_buffers(*buffers)
+        sort_duration = 0.
+        if curve is not None:
+            start = time.perf_counter()
+            collection.sort_spatially(curve)
+            sort_duration = time.perf_counter() - start
+
+        query_duration, query_ranges = window_queries(collection, windows)
+        export_duration, size, tile_ranges = tiled_export(collection, arguments.tiles)
+        print(f"{curve or 'génération':<10} tri : {sort_duration:6.3f} s"
+              f" | fenêtres : {arguments.queries / query_duration:8.0f} requêtes/s, {query_ranges:7.1f} plages"
+              f" | tuiles : {size / export_duration / 1e6:7.1f} Mo/s, {tile_ranges:7.1f} plages")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Mesure du coût de transfert d'une collection vers des processus.
+
+Trois transports sont comparés pour une collection de 10^6 sommets (par défaut) :
+- sérialisation objet par objet (un Vertice par sommet, comme auparavant) ;
+- sérialisation compacte de la collection (tampons contigus) ;
+- SharedCollection (mémoire partagée, seul le nom du bloc est sérialisé).
+Le transfert complet vers un groupe de processus est ensuite chronométré.
+"""
+
+import argparse
+import multiprocessing
+import pickle
+import time
+
+import numpy as np
+
+from geometry.collection import Collection
+from geometry.shared import SharedCollection
+
+VERTICES_PER_POLYGON = 8
+
+
+def total_bounds(collection):
+    """
+    Tâche exécutée par les processus : somme des boîtes englobantes.
+    """
+    return float(collection.bounds().sum())
+
+
+def timed(function, *args):
+    """
+    Retourne la durée d'exécution d'une fonction et son résultat.
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vertices", type=int, default=1_000_000, help="Nombre de sommets. (par défaut à 10^6)")
+    parser.add_argument("--workers", type=int, default=4, help="Nombre de processus. (par défaut à 4)")
+    arguments = parser.parse_args()
+
+    polygons_count = arguments.vertices // VERTICES_PER_POLYGON
+    rng = np.random.default_rng(0)
+    coordinates = rng.uniform(0, 1000, (polygons_count * VERTICES_PER_POLYGON, 2))
+    offsets = np.arange(polygons_count + 1) * VERTICES_PER_POLYGON
+    collection = Collection.from_buffers(coordinates, offsets)
+    _ = collection.polygons
+
+    print(f"{polygons_count} polygones, {len(coordinates)} sommets")
+
+    # Sérialisation objet par objet
+    duration_dumps, data = timed(pickle.dumps, [polygon.vertices for polygon in collection.polygons])
+    duration_loads, _ = timed(pickle.loads, data)
+    print(f"objet par objet  : dumps {duration_dumps:7.3f} s, loads {duration_loads:7.3f} s, "
+          f"{len(data) / 1e6:8.1f} Mo")
+
+    # Sérialisation compacte
+    duration_dumps, data = timed(pickle.dumps, collection)
+    duration_loads, restored = timed(pickle.loads, data)
+    duration_polygons, _ = timed(lambda: restored.polygons)
+    print(f"tampons contigus : dumps {duration_dumps:7.3f} s, loads {duration_loads:7.3f} s, "
+          f"{len(data) / 1e6:8.1f} Mo (création des polygones : {duration_polygons:.3f} s)")
+
+    # Mémoire partagée
+    duration_create, shared = timed(SharedCollection.create, collection)
+    with shared:
+        duration_dumps, data = timed(pickle.dumps, shared)
+        duration_loads, attached = timed(pickle.loads, data)
+        attached.close()
+        print(f"mémoire partagée : dumps {duration_dumps:7.3f} s, loads {duration_loads:7.3f} s, "
+              f"{len(data) / 1e6:8.1f} Mo (création du bloc : {duration_create:.3f} s)")
+
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(arguments.workers) as pool:
+            # Démarrage des processus hors mesure
+            pool.map(total_bounds, [Collection()] * arguments.workers)
+
+            tasks = [Collection.from_buffers(coordinates, offsets)] * arguments.workers
+            duration, _ = timed(pool.map, total_bounds, tasks)
+            print(f"{arguments.workers} processus, tampons contigus : {duration:7.3f} s")
+
+            duration, _ = timed(pool.map, total_bounds, [shared] * arguments.workers)
+            print(f"{arguments.workers} processus, mémoire partagée : {duration:7.3f} s")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Mesure des transformations affines vectorisées (Collection.translate, Collection.rotate).
+
+La translation sommet par sommet (Vertice.__add__, comme le faisait le constructeur de
+Rectangle) est comparée à la translation de la collection en un produit matriciel sur le
+tampon de coordonnées, puis à une rotation avec un angle et un centre par polygone.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from geometry.collection import Collection
+from geometry.vertice import Vertice
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=20_000, help="Nombre de polygones. (par défaut à 20000)")
+    parser.add_argument("--seed", type=int, default=0, help="Graine aléatoire. (par défaut à 0)")
+    arguments = parser.parse_args()
+
+    collection = Collection.random({'type': 'simple', 'count': arguments.count, 'placement': 'grid'})
+    vertices_count = len(collection.buffers()[0])
+    offset = Vertice(3., 4.)
+
+    start = time.perf_counter()
+    for polygon in collection.polygons:
+        polygon.vertices = [vertice + offset for vertice in polygon.vertices]
+    duration = time.perf_counter() - start
+    print(f"sommet par sommet        : {vertices_count / duration:13.0f} sommets/s")
+    collection.invalidate()
+
+    # Les tampons sont construits une fois à partir des polygones déjà créés.
+    start = time.perf_counter()
+    collection.buffers()
+    duration = time.perf_counter() - start
+    print(f"construction des tampons : {vertices_count / duration:13.0f} sommets/s")
+
+    start = time.perf_counter()
+    collection.translate(3., 4., inplace=True)
+    duration = time.perf_counter() - start
+    print(f"translation vectorisée   : {vertices_count / duration:13.0f} sommets/s")
+
+    rng = np.random.default_rng(arguments.seed)
+    bounds = collection.bounds()
+    start = time.perf_counter()
+    collection.rotate(rng.random(len(collection)) * 2 * np.pi, (bounds[:, :2] + bounds[:, 2:]) / 2, inplace=True)
+    duration = time.perf_counter() - start
+    print(f"rotation par polygone    : {vertices_count / duration:13.0f} sommets/s")
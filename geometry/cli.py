@@ -0,0 +1,500 @@
+"""
+Implémentation de la commande 'geometry'.
+
+Sous-commandes :
+- generate : génère une collection aléatoire (voir Collection.random) ;
+- stats : calcule l'aire, le périmètre et la convexité de chaque polygone ;
+- convert : convertit un fichier entre les formats texte et binaire (voir geometry.formats) ;
+- clip : découpe les polygones par une fenêtre rectangulaire.
+
+Les fichiers sont traités en flux, par paquets de polygones. Avec --workers, les paquets
+sont répartis entre des processus, et les résultats sont écrits dans l'ordre d'origine.
+"""
+
+import argparse
+import multiprocessing
+import random
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+
+from geometry import formats
+from geometry.collection import Collection
+from geometry.shapes.rectangle import Rectangle
+from geometry.utilities import clipping, collision, measures
+from geometry.utilities.lazy import lazy_import
+from geometry.vertice import Vertice
+
+np = lazy_import("numpy")
+
+
+class Profiler:
+    """
+    Classe mesurant la durée cumulée de chaque phase d'une commande.
+
+    Attributes:
+        enabled (bool):
+            True si les durées sont affichées à la fin de la commande.
+        durations (dict[str, float]):
+            Durée cumulée de chaque phase, en secondes, dans l'ordre de première mesure.
+    """
+
+    def __init__(self, enabled=False):
+        """
+        Instancie un profileur.
+
+        Args:
+            enabled (bool):
+                True si les durées doivent être affichées. (par défaut à False)
+        """
+        self.enabled = enabled
+        self.durations = {}
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Mesure la durée d'un bloc et l'ajoute à celle de la phase.
+
+        Args:
+            name (str):
+                Nom de la phase.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[name] = self.durations.get(name, 0.) + time.perf_counter() - start
+
+    def timed(self, name, iterable):
+        """
+        Parcourt un itérable en comptant le temps de production de chaque élément dans une phase.
+
+        Args:
+            name (str):
+                Nom de la phase.
+            iterable (iterable):
+                Itérable à parcourir.
+        Yields:
+            Éléments de l'itérable.
+        """
+        iterator = iter(iterable)
+        while True:
+            with self.phase(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def report(self, file=None):
+        """
+        Affiche la durée de chaque phase, si le profileur est activé.
+
+        Args:
+            file (_io.TextIOWrapper):
+                Fichier de sortie. (par défaut à stderr)
+        """
+        if not self.enabled:
+            return
+
+        file = sys.stderr if file is None else file
+
+        total = sum(self.durations.values())
+        for name, duration in self.durations.items():
+            print(f"{name:<12} {duration:10.4f} s", file=file)
+        print(f"{'total':<12} {total:10.4f} s", file=file)
+
+
+@contextmanager
+def open_stream(path, mode):
+    """
+    Ouvre un fichier en mode binaire, ou l'entrée/la sortie standard pour '-'.
+
+    Args:
+        path (str):
+            Chemin du fichier, ou '-'.
+        mode (str):
+            'rb' ou 'wb'.
+    Yields:
+        io.BufferedIOBase:
+            Flux ouvert.
+    """
+    if path == '-':
+        yield sys.stdin.buffer if mode == 'rb' else sys.stdout.buffer
+        return
+
+    with open(path, mode) as stream:
+        yield stream
+
+
+def run_pipeline(chunks, function, consume, workers, profiler):
+    """
+    Applique une fonction à chaque paquet et consomme les résultats dans l'ordre des paquets.
+    Avec plusieurs processus, au plus 2 x workers paquets sont en cours à la fois.
+
+    Args:
+        chunks (iterable[tuple]):
+            Arguments de la fonction pour chaque paquet.
+        function (callable):
+            Fonction de traitement d'un paquet, définie au niveau d'un module (sérialisable).
+        consume (callable):
+            Fonction recevant le résultat de chaque paquet.
+        workers (int):
+            Nombre de processus. (1 : traitement dans le processus courant)
+    """
+    chunks = profiler.timed('lecture', chunks)
+    if workers <= 1:
+        for chunk in chunks:
+            with profiler.phase('calcul'):
+                result = function(*chunk)
+            with profiler.phase('écriture'):
+                consume(result)
+        return
+
+    # Les processus sont démarrés par 'spawn' : les fils d'exécution de numba ne survivent pas à un 'fork'.
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+        pending = deque()
+
+        def consume_first():
+            with profiler.phase('calcul'):
+                result = pending.popleft().result()
+            with profiler.phase('écriture'):
+                consume(result)
+
+        for chunk in chunks:
+            pending.append(pool.submit(function, *chunk))
+            if len(pending) >= 2 * workers:
+                consume_first()
+        while pending:
+            consume_first()
+
+
+def numbered(chunks):
+    """
+    Ajoute à chaque paquet l'indice de son premier polygone.
+
+    Args:
+        chunks (iterable[tuple(numpy.ndarray, numpy.ndarray)]):
+            Paquets de tampons (coordonnées, indices de début).
+    Yields:
+        tuple(numpy.ndarray, numpy.ndarray, int):
+            Coordonnées, indices de début et indice du premier polygone du paquet.
+    """
+    first = 0
+    for coordinates, offsets in chunks:
+        yield coordinates, offsets, first
+        first += len(offsets) - 1
+
+
+def generate_chunk(options, space_bounds, seed, first, output_format):
+    """
+    Génère une collection aléatoire dans une partie de l'espace et l'encode.
+
+    Args:
+        options (dict):
+            Options de Collection.random, sans l'espace.
+        space_bounds (tuple(float, float, float, float)):
+            Partie de l'espace (x_min, y_min, x_max, y_max).
+        seed (int | None):
+            Graine du générateur aléatoire.
+        first (int):
+            Indice du premier polygone.
+        output_format (str):
+            Format de sortie.
+    Returns:
+        bytes:
+            Polygones encodés.
+    """
+    if seed is not None:
+        random.seed(seed)
+
+    x_min, y_min, x_max, y_max = space_bounds
+    options = dict(options, space={'space': Rectangle(Vertice(x_min, y_min), y_max - y_min, x_max - x_min),
+                                   'divisions': options['divisions']})
+    del options['divisions']
+
+    coordinates, offsets = Collection.random(options).buffers()
+    return formats.encode_chunk(coordinates, offsets, output_format, first + np.arange(len(offsets) - 1))
+
+
+def stats_chunk(coordinates, offsets, first, summary):
+    """
+    Calcule l'aire, le périmètre et la convexité des polygones d'un paquet.
+
+    Args:
+        coordinates (numpy.ndarray):
+            Coordonnées des sommets. (V, 2)
+        offsets (numpy.ndarray):
+            Indices de début de chaque polygone, suivis de V. (N + 1)
+        first (int):
+            Indice du premier polygone.
+        summary (bool):
+            Si True, seuls les totaux sont calculés.
+    Returns:
+        tuple(bytes, tuple(int, float, float, int)):
+            Lignes "indice aire périmètre convexe" (vides si summary), et totaux du paquet :
+            nombre de polygones, aire, périmètre et nombre de polygones convexes.
+    """
+    areas = np.abs(measures.signed_areas(coordinates, offsets))
+    perimeters = measures.perimeters(coordinates, offsets)
+    convex = collision.convex_mask(coordinates, offsets)
+
+    totals = (len(areas), float(areas.sum()), float(perimeters.sum()), int(convex.sum()))
+    if summary:
+        return b"", totals
+
+    lines = [f"{first + index} {area!r} {perimeter!r} {int(is_convex)}\n"
+             for index, (area, perimeter, is_convex) in enumerate(zip(areas.tolist(), perimeters.tolist(),
+                                                                      convex.tolist()))]
+    return "".join(lines).encode(), totals
+
+
+def convert_chunk(coordinates, offsets, first, output_format):
+    """
+    Encode un paquet dans le format de sortie.
+
+    Args:
+        coordinates (numpy.ndarray):
+            Coordonnées des sommets. (V, 2)
+        offsets (numpy.ndarray):
+            Indices de début de chaque polygone, suivis de V. (N + 1)
+        first (int):
+            Indice du premier polygone.
+        output_format (str):
+            Format de sortie.
+    Returns:
+        bytes:
+            Paquet encodé.
+    """
+    return formats.encode_chunk(coordinates, offsets, output_format, first + np.arange(len(offsets) - 1))
+
+
+def clip_chunk(coordinates, offsets, first, bounds, output_format):
+    """
+    Découpe les polygones d'un paquet par une fenêtre et les encode.
+    Les polygones conservent leur indice d'origine en format texte.
+
+    Args:
+        coordinates (numpy.ndarray):
+            Coordonnées des sommets. (V, 2)
+        offsets (numpy.ndarray):
+            Indices de début de chaque polygone, suivis de V. (N + 1)
+        first (int):
+            Indice du premier polygone.
+        bounds (tuple(float, float, float, float)):
+            Fenêtre (x_min, y_min, x_max, y_max).
+        output_format (str):
+            Format de sortie.
+    Returns:
+        bytes:
+            Polygones découpés encodés.
+    """
+    coordinates, offsets, kept = clipping.clip_buffers(coordinates, offsets, bounds)
+    return formats.encode_chunk(coordinates, offsets, output_format, first + kept)
+
+
+def command_generate(arguments, profiler):
+    """
+    Génère une collection aléatoire. Avec plusieurs processus, l'espace est découpé
+    en bandes verticales, une par processus, qui reçoivent chacune une part des polygones.
+    """
+    options = {
+        'type': arguments.type,
+        'count': arguments.count,
+        'form': {'min_vertices_count': arguments.min_vertices, 'max_vertices_count': arguments.max_vertices},
+        'divisions': tuple(arguments.divisions),
+        'placement': arguments.placement,
+        'density': arguments.density,
+    }
+
+    parts = max(min(arguments.workers, arguments.count), 1)
+    chunks = []
+    first = 0
+    for part in range(parts):
+        count = arguments.count // parts + (part < arguments.count % parts)
+        seed = None if arguments.seed is None else arguments.seed + part
+        # Les sommets sont tirés sur des coordonnées entières : les bandes le sont aussi.
+        bounds = (round(part * arguments.width / parts), 0., round((part + 1) * arguments.width / parts),
+                  arguments.length)
+        chunks.append((dict(options, count=count), bounds, seed, first, arguments.output_format))
+        first += count
+
+    with open_stream(arguments.output, 'wb') as output:
+        if arguments.output_format == 'binary':
+            output.write(formats.MAGIC)
+        run_pipeline(chunks, generate_chunk, output.write, arguments.workers, profiler)
+
+
+def command_stats(arguments, profiler):
+    """
+    Calcule les mesures de chaque polygone d'un fichier, ou leurs totaux avec --summary.
+    """
+    totals = [0, 0., 0., 0]
+
+    with open_stream(arguments.input, 'rb') as stream, open_stream(arguments.output, 'wb') as output:
+        def consume(result):
+            lines, chunk_totals = result
+            output.write(lines)
+            for index, value in enumerate(chunk_totals):
+                totals[index] += value
+
+        if not arguments.summary:
+            output.write(b"index area perimeter convex\n")
+
+        chunks = numbered(formats.read_chunks(stream, arguments.input_format, arguments.chunk_size))
+        run_pipeline(((*chunk, arguments.summary) for chunk in chunks), stats_chunk, consume, arguments.workers,
+                     profiler)
+
+        if arguments.summary:
+            count, area, perimeter, convex = totals
+            output.write(f"polygons {count}\narea {area!r}\nperimeter {perimeter!r}\nconvex {convex}\n".encode())
+
+
+def command_convert(arguments, profiler):
+    """
+    Convertit un fichier de polygones dans le format de sortie.
+    """
+    with open_stream(arguments.input, 'rb') as stream, open_stream(arguments.output, 'wb') as output:
+        if arguments.output_format == 'binary':
+            output.write(formats.MAGIC)
+
+        chunks = numbered(formats.read_chunks(stream, arguments.input_format, arguments.chunk_size))
+        function = partial(convert_chunk, output_format=arguments.output_format)
+        run_pipeline(chunks, function, output.write, arguments.workers, profiler)
+
+
+def command_clip(arguments, profiler):
+    """
+    Découpe les polygones d'un fichier par une fenêtre rectangulaire.
+    """
+    x_min, y_min, x_max, y_max = arguments.window
+    if x_min > x_max or y_min > y_max:
+        raise ValueError("Fenêtre invalide : x_min ≤ x_max et y_min ≤ y_max sont attendus.")
+
+    with open_stream(arguments.input, 'rb') as stream, open_stream(arguments.output, 'wb') as output:
+        if arguments.output_format == 'binary':
+            output.write(formats.MAGIC)
+
+        chunks = numbered(formats.read_chunks(stream, arguments.input_format, arguments.chunk_size))
+        function = partial(clip_chunk, bounds=tuple(arguments.window), output_format=arguments.output_format)
+        run_pipeline(chunks, function, output.write, arguments.workers, profiler)
+
+
+def positive_integer(value):
+    """
+    Convertit un argument en entier strictement positif.
+
+    Raises:
+        argparse.ArgumentTypeError:
+            Si la valeur n'est pas un entier strictement positif.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"entier strictement positif attendu : {value}")
+    return number
+
+
+def build_parser():
+    """
+    Construit l'analyseur des arguments de la commande.
+
+    Returns:
+        argparse.ArgumentParser:
+            Analyseur des arguments.
+    """
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--workers", type=positive_integer, default=1,
+                        help="Nombre de processus. (par défaut à 1)")
+    common.add_argument("--profile", action="store_true",
+                        help="Affiche la durée de chaque phase sur la sortie d'erreur.")
+    common.add_argument("-o", "--output", default="-", help="Fichier de sortie. (par défaut : sortie standard)")
+
+    reader = argparse.ArgumentParser(add_help=False)
+    reader.add_argument("input", nargs="?", default="-", help="Fichier d'entrée. (par défaut : entrée standard)")
+    reader.add_argument("--input-format", choices=formats.FORMATS,
+                        help="Format d'entrée. (par défaut : déduit de l'extension, texte sinon)")
+    reader.add_argument("--chunk-size", type=positive_integer, default=formats.CHUNK_SIZE,
+                        help=f"Nombre de polygones par paquet. (par défaut à {formats.CHUNK_SIZE})")
+
+    writer = argparse.ArgumentParser(add_help=False)
+    writer.add_argument("--output-format", choices=formats.FORMATS,
+                        help="Format de sortie. (par défaut : déduit de l'extension, texte sinon)")
+
+    parser = argparse.ArgumentParser(prog="geometry", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    generate = subparsers.add_parser("generate", parents=[common, writer], help="Génère une collection aléatoire.")
+    generate.add_argument("--type", default="polygon", choices=("polygon", "rectangle", "simple", "convex"),
+                          help="Type de polygones. (par défaut à 'polygon')")
+    generate.add_argument("--count", type=positive_integer, default=3, help="Nombre de polygones. (par défaut à 3)")
+    generate.add_argument("--min-vertices", type=int, default=3, help="Nombre de sommets minimal. (par défaut à 3)")
+    generate.add_argument("--max-vertices", type=int, default=16, help="Nombre de sommets maximal. (par défaut à 16)")
+    generate.add_argument("--width", type=float, default=1280., help="Largeur de l'espace. (par défaut à 1280)")
+    generate.add_argument("--length", type=float, default=720., help="Longueur de l'espace. (par défaut à 720)")
+    generate.add_argument("--divisions", type=int, nargs=2, default=(2, 2),
+                          help="Divisions récursives de l'espace. (par défaut à 2 2)")
+    generate.add_argument("--placement", default="subdivision", choices=("subdivision", "grid"),
+                          help="Méthode de placement des polygones. (par défaut à 'subdivision')")
+    generate.add_argument("--density", type=float, default=0.5,
+                          help="Densité visée en placement 'grid'. (par défaut à 0.5)")
+    generate.add_argument("--seed", type=int, help="Graine du générateur aléatoire.")
+    generate.set_defaults(function=command_generate)
+
+    stats = subparsers.add_parser("stats", parents=[common, reader],
+                                  help="Calcule l'aire, le périmètre et la convexité des polygones.")
+    stats.add_argument("--summary", action="store_true", help="N'affiche que les totaux.")
+    stats.set_defaults(function=command_stats)
+
+    convert = subparsers.add_parser("convert", parents=[common, reader, writer],
+                                    help="Convertit un fichier entre les formats texte et binaire.")
+    convert.set_defaults(function=command_convert)
+
+    clip = subparsers.add_parser("clip", parents=[common, reader, writer],
+                                 help="Découpe les polygones par une fenêtre rectangulaire.")
+    clip.add_argument("--window", type=float, nargs=4, required=True, metavar=("X_MIN", "Y_MIN", "X_MAX", "Y_MAX"),
+                      help="Fenêtre de découpage.")
+    clip.set_defaults(function=command_clip)
+
+    return parser
+
+
+def main(argv=None):
+    """
+    Point d'entrée de la commande 'geometry'.
+
+    Args:
+        argv (list[str], optional):
+            Arguments de la commande. (par défaut à sys.argv[1:])
+    Returns:
+        int:
+            Code de retour.
+    """
+    parser = build_parser()
+    arguments = parser.parse_args(argv)
+
+    # Formats déduits des extensions des fichiers
+    if 'input' in arguments and arguments.input_format is None:
+        arguments.input_format = formats.format_from_path(arguments.input)
+    if 'output_format' in arguments and arguments.output_format is None:
+        arguments.output_format = formats.format_from_path(arguments.output)
+
+    profiler = Profiler(arguments.profile)
+    try:
+        arguments.function(arguments, profiler)
+    except (OSError, ValueError) as error:
+        parser.exit(1, f"geometry {arguments.command} : erreur : {error}\n")
+    finally:
+        profiler.report()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
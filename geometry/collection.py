@@ -1,10 +1,24 @@
+import math
+import multiprocessing
 import random
+import time
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from itertools import chain
 from sys import stdout
 
-from geometry.shapes.polygon import Polygon
+from geometry.shapes.polygon import (Polygon, convex_hull_points, largest_interior_rectangle_bounds,
+                                     random_convex_vertices)
 from geometry.shapes.rectangle import Rectangle
+from geometry.utilities import calipers, collision, coverage, curves, delaunay, generation, measures, minkowski, \
+    predicates, transforms
+from geometry.utilities.lazy import lazy_import, load
 from geometry.vertice import Vertice
 
+cv2 = lazy_import("cv2")
+lir = lazy_import("largestinteriorrectangle")
+np = lazy_import("numpy")
+
 
 class Collection:
     """Représente une collection de polygones.
@@ -12,11 +26,23 @@ class Collection:
     Cette classe permet de gérer une collection de polygones, offrant des fonctionnalités
     pour accéder aux polygones, les ajouter et les imprimer dans différents formats.
     
+    Une collection peut aussi être construite directement à partir de tampons de coordonnées
+    (voir from_buffers()) : ses polygones ne sont alors créés qu'au premier accès.
+
+    Indexer une collection par une tranche, un tableau d'indices ou un masque booléen retourne une vue :
+    une collection qui partage les tampons de la collection parente et n'en recopie rien tant que ce
+    n'est pas nécessaire. Attention ! Une vue ne doit plus être utilisée après une modification de la
+    collection parente ; modifier la vue elle-même la détache de sa parente.
+
     Attributes:
         polygons (list[Polygon]): Ensemble de polygones.
     """
     DEFAULT_RANDOM_SPACE_WIDTH = 1280.
     DEFAULT_RANDOM_SPACE_LENGTH = 720.
+    CANCEL_POLL_INTERVAL = 0.05
+    GRID_PLACEMENT_ATTEMPTS = 32
+    GRID_PLACEMENT_SHRINK = 0.8
+    GRID_PLACEMENT_MIN_SIDE = 2
 
     def __init__(self, polygons=None):
         """Initialise une collection de polygones.
@@ -24,23 +50,97 @@ class Collection:
         Args:
             polygons (list[Polygon], optional): Ensemble de polygones. Par défaut à [].
         """
+        self._cache = {}
         self.polygons = [] if not polygons else list(polygons)
 
+    @property
+    def polygons(self):
+        """Ensemble de polygones de la collection.
+
+        Les polygones d'une collection construite à partir de tampons sont créés au premier accès.
+
+        Returns:
+            list[Polygon]: Ensemble de polygones.
+        """
+        if self._polygons is None:
+            self._polygons = self._materialize()
+        return self._polygons
+
+    @polygons.setter
+    def polygons(self, polygons):
+        """Remplace l'ensemble de polygones et vide le cache des tampons.
+
+        Args:
+            polygons (list[Polygon]): Nouvel ensemble de polygones.
+        """
+        self._polygons = polygons
+        self.invalidate()
+
     def __getitem__(self, item):
         """Permet l'accès aux polygones via les crochets.
         
         Args:
-            item (int): Index pour l'accès aux polygones.
+            item (int | slice | numpy.ndarray | list): Index pour l'accès aux polygones, tranche,
+                tableau d'indices ou masque booléen de même longueur que la collection.
             
         Returns:
-            Polygon: Un polygone de la collection.
+            Polygon | Collection: Un polygone de la collection pour un index, une vue sur les polygones
+                sélectionnés sinon.
             
         Raises:
-            IndexError: Si l'index n'est pas entre 0 et le nombre de polygones - 1.
+            IndexError: Si un index n'est pas entre 0 et le nombre de polygones - 1 (entre -N et N - 1 dans
+                un tableau d'indices), ou si le masque n'a pas la longueur de la collection.
+            TypeError: Si item n'est pas d'un type pris en charge.
+        """
+        # Un index entier ne nécessite pas NumPy.
+        if isinstance(item, int) and not isinstance(item, bool):
+            if item < 0 or item >= len(self):
+                raise IndexError("Clé invalide !")
+            return self.polygons[item]
+
+        if isinstance(item, np.integer):
+            return self[int(item)]
+
+        if isinstance(item, slice):
+            selection = range(len(self))[item]
+            return self._select(np.arange(selection.start, selection.stop, selection.step, dtype=np.int64))
+
+        if isinstance(item, (list, tuple, np.ndarray)):
+            item = np.asarray(item)
+            if item.dtype == bool:
+                if item.shape != (len(self),):
+                    raise IndexError("Le masque doit avoir la longueur de la collection !")
+                return self._select(np.flatnonzero(item))
+
+            if item.size == 0:
+                return self._select(np.empty(0, dtype=np.int64))
+            if item.ndim != 1 or not np.issubdtype(item.dtype, np.integer):
+                raise IndexError("Les indices doivent former un tableau d'entiers à une dimension !")
+            if item.min() < -len(self) or item.max() >= len(self):
+                raise IndexError("Clé invalide !")
+            return self._select(np.where(item < 0, item + len(self), item).astype(np.int64))
+
+        raise TypeError(f"Index non pris en charge : {type(item)} !")
+
+    def _select(self, indices):
+        """Crée une vue sur des polygones de la collection.
+
+        Les vues de vues désignent directement la collection d'origine.
+
+        Args:
+            indices (numpy.ndarray): Indices des polygones sélectionnés. (K)
+
+        Returns:
+            Collection: Vue sur les polygones sélectionnés.
         """
-        if item < 0 or item >= len(self):
-            raise IndexError("Clé invalide !")
-        return self.polygons[item]
+        if 'view' in self._cache:
+            parent, parent_indices = self._cache['view']
+            return parent._select(parent_indices[indices])
+
+        view = Collection.__new__(Collection)
+        view._polygons = None
+        view._cache = {'view': (self, indices)}
+        return view
 
     def __str__(self):
         """Représente la collection de polygones sous forme de chaîne de caractères.
@@ -65,7 +165,41 @@ class Collection:
         Returns:
             int: Nombre de polygones.
         """
-        return len(self.polygons)
+        if self._polygons is None:
+            if 'view' in self._cache:
+                return len(self._cache['view'][1])
+            return len(self._cache['buffers'][1]) - 1
+        return len(self._polygons)
+
+    def __reduce__(self):
+        """Sérialise la collection sous la forme de tampons contigus de coordonnées et d'indices,
+        plutôt que d'un objet par polygone et par sommet.
+
+        Les tampons sont recalculés si des polygones ont été modifiés (voir _refresh()). La classe de la
+        collection et les attributs propres à une sous-classe sont conservés.
+
+        Returns:
+            tuple: Fonction de reconstruction, ses arguments et l'état de la sous-classe éventuelle.
+        """
+        state = {key: value for key, value in self.__dict__.items() if key not in ('_polygons', '_cache')}
+        return self._reduce(type(self), state)
+
+    def _reduce(self, cls, state=None):
+        """Sérialise le contenu actuel de la collection pour le reconstruire dans une collection de classe cls.
+
+        Args:
+            cls (type): Classe de la collection reconstruite.
+            state (dict, optional): Attributs à restaurer après la reconstruction. Par défaut aucun.
+
+        Returns:
+            tuple: Fonction de reconstruction, ses arguments et l'état à restaurer.
+        """
+        if self._polygons is not None and any(type(polygon) not in (Polygon, Rectangle) for polygon in self._polygons):
+            # Polygones d'autres classes : sérialisation polygone par polygone
+            return cls, (self._polygons,), state or None
+
+        coordinates, offsets = self.buffers()
+        return cls.from_buffers, (coordinates, offsets, self.rectangle_table()), state or None
 
     def __add__(self, other):
         """Ajoute un polygone ou une collection à la collection actuelle.
@@ -85,6 +219,761 @@ class Collection:
             return Collection(self.polygons + other.polygons)
         return NotImplemented(f"Opération non autorisée entre Collection et {type(other)} !")
 
+    def __iadd__(self, other):
+        """Ajoute, en place, un polygone ou une collection à la collection actuelle.
+
+        Args:
+            other (Polygon | Collection): Polygone ou collection à ajouter.
+
+        Returns:
+            Collection: La collection actuelle.
+
+        Raises:
+            TypeError: Si l'opération est non autorisée.
+        """
+        if isinstance(other, Polygon):
+            self.append(other)
+        elif isinstance(other, Collection):
+            self.extend(other)
+        else:
+            raise TypeError(f"Opération non autorisée entre Collection et {type(other)} !")
+        return self
+
+    def append(self, polygon):
+        """Ajoute, en place, un polygone à la fin de la collection.
+
+        Args:
+            polygon (Polygon): Polygone à ajouter.
+
+        Raises:
+            TypeError: Si polygon n'est pas un polygone.
+        """
+        if not isinstance(polygon, Polygon):
+            raise TypeError(f"Opération non autorisée entre Collection et {type(polygon)} !")
+
+        self.polygons.append(polygon)
+        self.invalidate()
+
+    def extend(self, polygons):
+        """Ajoute, en place, des polygones à la fin de la collection.
+
+        Args:
+            polygons (Collection | iterable[Polygon]): Polygones à ajouter.
+
+        Raises:
+            TypeError: Si l'un des éléments n'est pas un polygone.
+        """
+        polygons = polygons.polygons if isinstance(polygons, Collection) else list(polygons)
+        if not all(isinstance(polygon, Polygon) for polygon in polygons):
+            raise TypeError("Seuls des polygones peuvent être ajoutés à une collection !")
+
+        self.polygons.extend(polygons)
+        self.invalidate()
+
+    def invalidate(self):
+        """Vide le cache des tampons de coordonnées et des boîtes englobantes.
+
+        Les modifications des polygones créés sont détectées à la requête suivante (voir _refresh()) : il
+        n'est pas nécessaire d'appeler cette méthode après avoir modifié un polygone.
+        Les tampons d'une collection dont les polygones n'ont pas encore été créés sont conservés.
+        """
+        if self._polygons is None:
+            sources = {key: self._cache[key] for key in ('buffers', 'rectangles', 'view') if key in self._cache}
+            self._cache.clear()
+            self._cache.update(sources)
+        else:
+            self._cache.clear()
+
+    def _snapshot(self):
+        """Calcule les tampons de coordonnées et la table des rectangles à partir des polygones créés.
+
+        Returns:
+            tuple(tuple(numpy.ndarray, numpy.ndarray), tuple(numpy.ndarray, numpy.ndarray)):
+                Tampons (voir buffers()) et table des rectangles (voir rectangle_table()).
+        """
+        counts = np.fromiter((len(polygon.vertices) for polygon in self._polygons), dtype=np.int64,
+                             count=len(self._polygons))
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        coordinates = np.fromiter(
+            (coordinate for polygon in self._polygons for vertice in polygon.vertices
+             for coordinate in (vertice.x, vertice.y)),
+            dtype=np.float64, count=2 * int(offsets[-1])
+        ).reshape(-1, 2)
+
+        indices = [index for index, polygon in enumerate(self._polygons) if isinstance(polygon, Rectangle)]
+        dimensions = [(self._polygons[index].length, self._polygons[index].width) for index in indices]
+        rectangles = (np.array(indices, dtype=np.int64), np.array(dimensions, dtype=np.float64).reshape(-1, 2))
+        return (coordinates, offsets), rectangles
+
+    def _refresh(self):
+        """Vide le cache si les polygones créés ne correspondent plus aux tampons en cache.
+
+        Les polygones sont des objets modifiables (add_vertice(), simplify(), transform(inplace=True), ajout
+        direct de sommets, ...) qui ne préviennent pas la collection. Comme Polygon.triangulate() avec ses
+        sommets, la collection compare donc ses tampons en cache au contenu actuel de ses polygones avant
+        chaque requête, en O(V). Une collection dont les polygones n'ont pas été créés n'a rien à vérifier.
+        """
+        if self._polygons is None:
+            return
+
+        buffers, rectangles = self._snapshot()
+        cached_buffers, cached_rectangles = self._cache.get('buffers'), self._cache.get('rectangles')
+        unchanged = (cached_buffers is not None and cached_rectangles is not None
+                     and all(np.array_equal(cached, current, equal_nan=True) for cached, current
+                             in zip(cached_buffers + cached_rectangles, buffers + rectangles)))
+        if not unchanged:
+            # Les tampons d'une vue ou d'un bloc partagé sont conservés tant qu'ils sont à jour.
+            self._cache.clear()
+            self._cache.update(buffers=buffers, rectangles=rectangles)
+
+    def rectangle_table(self):
+        """Retourne les indices et les dimensions des rectangles de la collection.
+
+        Returns:
+            tuple(numpy.ndarray, numpy.ndarray):
+                - Indices des rectangles dans la collection. (R)
+                - Longueur et largeur de chaque rectangle. (R, 2)
+        """
+        self._refresh()
+        if 'rectangles' not in self._cache:
+            parent, selected = self._cache['view']
+            parent_indices, parent_dimensions = parent.rectangle_table()
+            # Les indices des rectangles de la collection parente sont triés.
+            positions = np.searchsorted(parent_indices, selected)
+            is_rectangle = np.zeros(len(selected), dtype=bool)
+            found = positions < len(parent_indices)
+            is_rectangle[found] = parent_indices[positions[found]] == selected[found]
+            self._cache['rectangles'] = (np.flatnonzero(is_rectangle), parent_dimensions[positions[is_rectangle]])
+        return self._cache['rectangles']
+
+    def _materialize(self):
+        """Crée les polygones d'une collection construite à partir de tampons.
+
+        Les polygones d'une vue sont ceux de la collection parente s'ils ont déjà été créés.
+
+        Returns:
+            list[Polygon]: Ensemble de polygones.
+        """
+        if 'view' in self._cache:
+            parent, indices = self._cache['view']
+            if parent._polygons is not None:
+                return [parent._polygons[index] for index in indices.tolist()]
+
+        coordinates, offsets = self.buffers()
+        rectangle_indices, rectangle_dimensions = self.rectangle_table()
+
+        vertices = [Vertice(x, y) for x, y in coordinates.tolist()]
+        offsets = offsets.tolist()
+        polygons = [Polygon(vertices[offsets[index]:offsets[index + 1]]) for index in range(len(offsets) - 1)]
+
+        for index, (length, width) in zip(rectangle_indices.tolist(), rectangle_dimensions.tolist()):
+            polygons[index] = Rectangle(vertices[offsets[index]], length, width)
+
+        return polygons
+
+    @classmethod
+    def from_buffers(cls, coordinates, offsets, rectangles=None, dtype=None):
+        """Crée une collection à partir de tampons de coordonnées, sans créer ses polygones.
+
+        Les polygones ne sont créés qu'au premier accès à l'attribut polygons : les calculs vectorisés
+        (boîtes englobantes, chevauchements, ...) n'en ont pas besoin.
+
+        Args:
+            coordinates (numpy.ndarray): Coordonnées des sommets, polygone par polygone. (V, 2)
+            offsets (numpy.ndarray): Indices de début de chaque polygone, suivis de V. (N + 1)
+            rectangles (tuple(numpy.ndarray, numpy.ndarray), optional): Indices et dimensions
+                (longueur, largeur) des polygones à recréer sous forme de rectangles. Par défaut aucun.
+            dtype (numpy.dtype, optional): Type des coordonnées stockées : float64, ou int32 pour le mode entier
+                (voir astype()). Par défaut, int32 si les coordonnées sont déjà de ce type, float64 sinon.
+
+        Returns:
+            Collection: Nouvelle collection.
+
+        Raises:
+            ValueError: Si les tampons sont incohérents, si le type n'est pas pris en charge, ou si des
+                coordonnées du mode entier ne sont pas des entiers bornés par INTEGER_COORDINATE_LIMIT.
+        """
+        coordinates = storage_coordinates(coordinates, dtype).reshape(-1, 2)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        if offsets.ndim != 1 or len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != len(coordinates) \
+                or np.any(np.diff(offsets) < 0):
+            raise ValueError("Indices de début des polygones incohérents avec les coordonnées !")
+
+        if rectangles is None:
+            rectangles = (np.empty(0, dtype=np.int64), np.empty((0, 2), dtype=np.float64))
+
+        collection = cls.__new__(cls)
+        collection._polygons = None
+        collection._cache = {'buffers': (coordinates, offsets), 'rectangles': rectangles}
+        return collection
+
+    @property
+    def dtype(self):
+        """Type des coordonnées stockées dans les tampons de la collection.
+
+        Returns:
+            numpy.dtype: float64, ou int32 en mode entier.
+        """
+        return self.buffers()[0].dtype
+
+    def astype(self, dtype):
+        """Retourne la collection avec des coordonnées stockées dans un autre type.
+
+        En mode entier (int32), les coordonnées occupent deux fois moins de mémoire qu'en float64, les prédicats
+        d'orientation et les tests de chevauchement sont calculés exactement en arithmétique entière, et le calcul
+        des plus grands rectangles intérieurs utilise directement les tampons, sans conversion. Les transformations
+        et les sommes de Minkowski retournent des collections en float64. Le mode entier est perdu si les
+        polygones créés sont modifiés puis invalidate() appelé.
+
+        Args:
+            dtype (numpy.dtype): float64 ou int32.
+
+        Returns:
+            Collection: Nouvelle collection construite à partir de tampons, qui partage ceux de la collection si le
+                type ne change pas.
+
+        Raises:
+            ValueError: Si le type n'est pas pris en charge, ou si, pour int32, des coordonnées ne sont pas des
+                entiers bornés par INTEGER_COORDINATE_LIMIT.
+        """
+        coordinates, offsets = self.buffers()
+        return Collection.from_buffers(coordinates, offsets, self.rectangle_table(), dtype=dtype)
+
+    @classmethod
+    def from_contours(cls, contours, epsilon=None):
+        """Crée une collection à partir de contours au format OpenCV (sortie de cv2.findContours()).
+
+        Les contours sont copiés en une fois dans les tampons de la collection, sans créer de sommet ni de
+        polygone. Les contours de moins de 3 sommets (après simplification) sont ignorés.
+
+        Args:
+            contours (list[numpy.ndarray]): Sommets de chaque contour, de forme (k, 1, 2) ou (k, 2).
+            epsilon (float, optional): Distance maximale entre un contour et sa version simplifiée
+                (algorithme de Douglas-Peucker, cv2.approxPolyDP()). Les contours qui ne sont ni entiers
+                (int32) ni flottants simple précision sont simplifiés en float32. Par défaut, les contours
+                ne sont pas simplifiés.
+
+        Returns:
+            Collection: Nouvelle collection, construite à partir de tampons.
+
+        Raises:
+            ValueError: Si epsilon est négatif, ou si un contour n'est pas formé de couples de coordonnées.
+        """
+        if epsilon is not None and epsilon < 0:
+            raise ValueError("epsilon doit être positif !")
+
+        contours = [np.asarray(contour) for contour in contours]
+        if any(contour.size % 2 for contour in contours):
+            raise ValueError("Un contour doit être formé de couples de coordonnées !")
+
+        if epsilon:
+            contours = [cv2.approxPolyDP(contour if contour.dtype in (np.int32, np.float32)
+                                         else contour.astype(np.float32), epsilon, True)
+                        for contour in contours]
+        contours = [contour.reshape(-1, 2) for contour in contours]
+        contours = [contour for contour in contours if len(contour) >= 3]
+
+        offsets = np.zeros(len(contours) + 1, dtype=np.int64)
+        np.cumsum([len(contour) for contour in contours], out=offsets[1:])
+        coordinates = np.concatenate(contours).astype(np.float64) if contours else np.empty((0, 2))
+        return cls.from_buffers(coordinates, offsets)
+
+    @classmethod
+    def from_mask(cls, mask, epsilon=None, holes=False):
+        """Crée une collection à partir des contours des régions d'un masque (cv2.findContours()).
+
+        Les sommets sont les centres des pixels du bord des régions (x : colonne, y : ligne). Les suites de
+        pixels alignés sont réduites à leurs extrémités.
+
+        Args:
+            mask (numpy.ndarray): Masque (H, W). Les pixels non nuls forment les régions.
+            epsilon (float, optional): Tolérance de simplification des contours, en pixels (voir
+                from_contours()). Par défaut, les contours ne sont pas simplifiés.
+            holes (bool, optional): Si True, les contours des trous des régions sont aussi ajoutés.
+                Par défaut à False : seuls les contours extérieurs sont conservés.
+
+        Returns:
+            Collection: Nouvelle collection, construite à partir de tampons.
+
+        Raises:
+            ValueError: Si le masque n'a pas deux dimensions, ou si epsilon est négatif.
+        """
+        mask = np.asarray(mask)
+        if mask.ndim != 2:
+            raise ValueError("Le masque doit être un tableau à deux dimensions !")
+
+        retrieval = cv2.RETR_LIST if holes else cv2.RETR_EXTERNAL
+        contours, _ = cv2.findContours((mask != 0).astype(np.uint8), retrieval, cv2.CHAIN_APPROX_SIMPLE)
+        return cls.from_contours(contours, epsilon)
+
+    def buffers(self):
+        """Retourne les coordonnées de tous les sommets de la collection dans des tampons contigus.
+
+        Le résultat est mis en cache tant que les polygones de la collection ne sont pas modifiés.
+        Les coordonnées d'une vue sur des polygones consécutifs sont une vue sur celles de la collection
+        parente ; celles des autres vues sont rassemblées au premier appel.
+
+        Returns:
+            tuple(numpy.ndarray, numpy.ndarray):
+                - Coordonnées des sommets, polygone par polygone. (V, 2)
+                - Indices de début de chaque polygone, suivis de V. (N + 1)
+        """
+        if self._polygons is None and 'buffers' not in self._cache:
+            parent, indices = self._cache['view']
+            coordinates, offsets = parent.buffers()
+            starts, stops = offsets[indices], offsets[indices + 1]
+
+            if len(indices) == 0:
+                self._cache['buffers'] = coordinates[:0], np.zeros(1, dtype=np.int64)
+            elif np.all(np.diff(indices) == 1):
+                # Polygones consécutifs : aucune copie des coordonnées
+                self._cache['buffers'] = (coordinates[starts[0]:stops[-1]],
+                                          np.append(starts, stops[-1]) - starts[0])
+            else:
+                counts = stops - starts
+                view_offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+                np.cumsum(counts, out=view_offsets[1:])
+                gather = np.repeat(starts - view_offsets[:-1], counts) + np.arange(view_offsets[-1])
+                self._cache['buffers'] = coordinates[gather], view_offsets
+
+        self._refresh()
+        return self._cache['buffers']
+
+    def bounds(self):
+        """Retourne les boîtes englobantes des polygones de la collection.
+
+        Le résultat est mis en cache tant que les polygones de la collection ne sont pas modifiés.
+
+        Returns:
+            numpy.ndarray: Boîtes (x_min, y_min, x_max, y_max) de chaque polygone, NaN si vide. (N, 4)
+        """
+        self._refresh()
+        if 'bounds' not in self._cache and 'view' in self._cache:
+            parent, indices = self._cache['view']
+            self._cache['bounds'] = parent.bounds()[indices]
+
+        if 'bounds' not in self._cache:
+            coordinates, offsets = self.buffers()
+            bounds = np.full((len(self), 4), np.nan)
+
+            non_empty = np.diff(offsets) > 0
+            if non_empty.any():
+                starts = offsets[:-1][non_empty]
+                bounds[non_empty, :2] = np.minimum.reduceat(coordinates, starts)
+                bounds[non_empty, 2:] = np.maximum.reduceat(coordinates, starts)
+
+            self._cache['bounds'] = bounds
+        return self._cache['bounds']
+
+    def areas(self):
+        """Retourne l'aire de chaque polygone de la collection (valeur absolue de Polygon.area()).
+
+        Le résultat est mis en cache tant que les polygones de la collection ne sont pas modifiés.
+
+        Returns:
+            numpy.ndarray: Aire de chaque polygone, nulle si vide. (N)
+        """
+        self._refresh()
+        if 'areas' not in self._cache:
+            if 'view' in self._cache:
+                parent, indices = self._cache['view']
+                self._cache['areas'] = parent.areas()[indices]
+            else:
+                self._cache['areas'] = np.abs(measures.signed_areas(*self.buffers()))
+        return self._cache['areas']
+
+    def moments(self):
+        """Retourne l'aire, le centre de gravité et les moments d'inertie centrés de chaque polygone, ainsi
+        que l'orientation de son axe principal (voir measures.moments()).
+
+        Returns:
+            tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray):
+                - Aires. (N)
+                - Centres de gravité, NaN pour les polygones d'aire nulle. (N, 2)
+                - Moments centrés (mu20, mu02, mu11). (N, 3)
+                - Angles en radians des axes principaux de plus faible inertie. (N)
+        """
+        return measures.moments(*self.buffers())
+
+    def sort_spatially(self, curve='hilbert'):
+        """Réordonne la collection le long d'une courbe remplissant l'espace.
+
+        Les clés sont calculées sur les centres des boîtes englobantes, puis les tampons sont réordonnés
+        en une passe : les polygones proches dans le plan deviennent proches dans la collection, ce qui
+        améliore la localité des requêtes spatiales et des lectures par plages. Les polygones vides sont
+        placés à la fin. Une vue est détachée de sa collection parente.
+
+        Args:
+            curve (str, optional): 'hilbert' ou 'morton'. Par défaut à 'hilbert'.
+
+        Returns:
+            numpy.ndarray: Permutation appliquée : le polygone à la position i était à la position order[i]. (N)
+
+        Raises:
+            ValueError: Si la courbe est inconnue.
+        """
+        bounds = self.bounds()
+        order = np.argsort(curves.curve_keys((bounds[:, :2] + bounds[:, 2:]) / 2, curve), kind='stable')
+
+        sorted_view = self._select(order)
+        buffers = sorted_view.buffers()
+        rectangles = sorted_view.rectangle_table()
+        polygons = None if self._polygons is None else [self._polygons[index] for index in order.tolist()]
+        reordered = {key: self._cache[key][order] for key in ('bounds', 'areas') if key in self._cache}
+
+        self._polygons = polygons
+        self._cache.clear()
+        self._cache.update(reordered, buffers=buffers, rectangles=rectangles)
+        return order
+
+    def transform(self, matrices, inplace=False):
+        """Applique des transformations affines aux polygones, en un seul produit matriciel sur le tampon
+        de coordonnées.
+
+        Les rectangles transformés par une translation ou une mise à l'échelle de facteurs strictement positifs
+        restent des rectangles ; les autres deviennent des polygones.
+
+        Args:
+            matrices (numpy.ndarray): Matrice (2, 3) ou (3, 3) appliquée à tous les polygones, ou une matrice
+                par polygone (N, 2, 3) ou (N, 3, 3) (voir geometry.utilities.transforms).
+            inplace (bool, optional): Si True, les tampons de la collection sont remplacés et ses polygones
+                seront recréés au prochain accès (les polygones déjà créés ne sont pas modifiés). Une vue est
+                détachée de sa collection parente. Par défaut à False.
+
+        Returns:
+            Collection: Collection transformée : la collection elle-même si inplace, une nouvelle collection
+                construite à partir de tampons sinon.
+
+        Raises:
+            ValueError: Si les matrices ne sont pas valides, ou si leur nombre ne correspond pas aux polygones.
+        """
+        coordinates, offsets = self.buffers()
+        matrices = transforms.affine_part(matrices)
+        transformed = transforms.apply(coordinates, matrices, offsets)
+
+        indices, dimensions = self.rectangle_table()
+        rectangle_matrices = matrices if matrices.ndim == 2 else matrices[indices]
+        kept = np.broadcast_to(transforms.axis_aligned(rectangle_matrices), indices.shape)
+        factors = np.broadcast_to(rectangle_matrices[..., [1, 0], [1, 0]], dimensions.shape)
+        rectangles = (indices[kept], dimensions[kept] * factors[kept])
+
+        if not inplace:
+            return Collection.from_buffers(transformed, offsets, rectangles)
+
+        self._polygons = None
+        self._cache.clear()
+        self._cache.update(buffers=(transformed, offsets), rectangles=rectangles)
+        return self
+
+    def translate(self, dx, dy, inplace=False):
+        """Translate les polygones de la collection.
+
+        Args:
+            dx (float | numpy.ndarray): Déplacement horizontal, ou un par polygone. (N)
+            dy (float | numpy.ndarray): Déplacement vertical, ou un par polygone. (N)
+            inplace (bool, optional): Si True, la collection est modifiée (voir transform()). Par défaut à False.
+
+        Returns:
+            Collection: Collection translatée.
+        """
+        return self.transform(transforms.translation(dx, dy), inplace)
+
+    def rotate(self, angles, centers=None, inplace=False):
+        """Tourne les polygones de la collection.
+
+        Args:
+            angles (float | numpy.ndarray): Angle en radians, dans le sens trigonométrique, ou un par
+                polygone. (N)
+            centers (tuple(float, float) | numpy.ndarray, optional): Centre de la rotation, ou un par
+                polygone (N, 2). Par défaut à l'origine.
+            inplace (bool, optional): Si True, la collection est modifiée (voir transform()). Par défaut à False.
+
+        Returns:
+            Collection: Collection tournée.
+        """
+        return self.transform(transforms.rotation(angles, centers), inplace)
+
+    def scale(self, sx, sy=None, centers=None, inplace=False):
+        """Met les polygones de la collection à l'échelle.
+
+        Args:
+            sx (float | numpy.ndarray): Facteur horizontal, ou un par polygone. (N)
+            sy (float | numpy.ndarray, optional): Facteur vertical, ou un par polygone (N). Par défaut à sx.
+            centers (tuple(float, float) | numpy.ndarray, optional): Centre de la mise à l'échelle, ou un par
+                polygone (N, 2). Par défaut à l'origine.
+            inplace (bool, optional): Si True, la collection est modifiée (voir transform()). Par défaut à False.
+
+        Returns:
+            Collection: Collection mise à l'échelle.
+        """
+        return self.transform(transforms.scaling(sx, sy, centers), inplace)
+
+    def overlapping_pairs_chunks(self, chunk_size=None):
+        """Produit, paquet par paquet, les paires de polygones qui se chevauchent.
+
+        Une première phase (balayage et élagage sur les boîtes englobantes, voir
+        collision.sweep_and_prune_chunks()) sélectionne les paires candidates d'un paquet, puis une seconde
+        phase les confirme : théorème des axes séparateurs si les deux polygones sont convexes, intersection
+        des arêtes et inclusion sinon. Les polygones qui se touchent sont considérés comme se chevauchant.
+        Seul un paquet de paires est en mémoire à la fois.
+
+        Args:
+            chunk_size (int, optional): Nombre maximal de paires candidates par paquet. Par défaut à
+                collision.SWEEP_CHUNK_SIZE.
+
+        Yields:
+            numpy.ndarray: Paires d'indices (i, j) avec i < j d'un paquet, dans l'ordre du balayage. (K, 2)
+        """
+        coordinates, offsets = self.buffers()
+        bounds = self.bounds()
+        convex = collision.convex_mask(coordinates, offsets)
+
+        # Phase large sur les polygones non vides
+        indices = np.flatnonzero(np.diff(offsets) > 0)
+        chunks = collision.sweep_and_prune_chunks(bounds[indices], chunk_size or collision.SWEEP_CHUNK_SIZE)
+        for candidates in chunks:
+            candidates = indices[candidates]
+
+            # Phase fine
+            keep = np.zeros(len(candidates), dtype=bool)
+            for index, (first, second) in enumerate(candidates):
+                polygon1 = coordinates[offsets[first]:offsets[first + 1]]
+                polygon2 = coordinates[offsets[second]:offsets[second + 1]]
+
+                if convex[first] and convex[second]:
+                    keep[index] = collision.convex_polygons_overlap(polygon1, polygon2)
+                else:
+                    keep[index] = collision.polygons_overlap(polygon1, polygon2)
+            yield candidates[keep]
+
+    def overlapping_pairs(self, chunk_size=None):
+        """Retourne toutes les paires de polygones qui se chevauchent (voir overlapping_pairs_chunks()).
+
+        Le résultat occupe O(K) mémoire : pour de très nombreuses paires, parcourir directement
+        overlapping_pairs_chunks().
+
+        Args:
+            chunk_size (int, optional): Nombre maximal de paires candidates par paquet. Par défaut à
+                collision.SWEEP_CHUNK_SIZE.
+
+        Returns:
+            numpy.ndarray: Paires d'indices (i, j) avec i < j, triées. (K, 2)
+        """
+        pairs = np.concatenate([np.empty((0, 2), dtype=np.int64), *self.overlapping_pairs_chunks(chunk_size)])
+        return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+    def _rectangle_bounds(self):
+        """Retourne les boîtes des rectangles d'une collection qui ne contient que des rectangles.
+
+        Returns:
+            numpy.ndarray: Boîtes (x_min, y_min, x_max, y_max) des rectangles. (N, 4)
+
+        Raises:
+            ValueError: Si la collection contient d'autres polygones que des rectangles.
+        """
+        if len(self.rectangle_table()[0]) != len(self):
+            raise ValueError("La collection ne doit contenir que des rectangles !")
+        return self.bounds()
+
+    def union_area(self):
+        """Retourne l'aire couverte par les rectangles de la collection, chevauchements comptés une fois.
+
+        L'aire est calculée par balayage selon les abscisses, avec un arbre de segments sur les ordonnées
+        compressées, en O(n log n) (voir coverage.union_area()).
+
+        Returns:
+            float: Aire de l'union des rectangles.
+
+        Raises:
+            ValueError: Si la collection contient d'autres polygones que des rectangles.
+        """
+        return coverage.union_area(self._rectangle_bounds())
+
+    def covered_mask(self, shape, window=None):
+        """Retourne le masque des pixels d'une grille dont le centre est couvert par un rectangle de la collection.
+
+        Args:
+            shape (tuple(int, int)): Nombre de lignes et de colonnes de la grille.
+            window (tuple(float, float, float, float), optional): Zone (x_min, y_min, x_max, y_max) couverte par
+                la grille. Par défaut à la boîte englobante de la collection.
+
+        Returns:
+            numpy.ndarray: Masque booléen, une ligne par ordonnée. (H, W)
+
+        Raises:
+            ValueError: Si la collection contient d'autres polygones que des rectangles, ou si la grille ou la
+                zone est vide.
+        """
+        bounds = self._rectangle_bounds()
+        if window is None:
+            window = (*np.nanmin(bounds[:, :2], axis=0), *np.nanmax(bounds[:, 2:], axis=0)) if len(bounds) \
+                else (0., 0., 0., 0.)
+        return coverage.covered_mask(bounds, shape, window)
+
+    def locate_points(self, points, chunk_size=collision.LOCATE_CHUNK_SIZE):
+        """Retourne, pour chaque point, l'indice du polygone qui le contient.
+
+        Les polygones candidats sont sélectionnés par une grille uniforme sur les boîtes englobantes, puis
+        l'inclusion est confirmée par un test de croisement vectorisé (voir collision.locate_points()).
+        Les points sont traités par paquets : la mémoire utilisée ne dépend pas de leur nombre.
+
+        Args:
+            points (numpy.ndarray): Points à localiser. (P, 2)
+            chunk_size (int, optional): Nombre de points traités à la fois. Par défaut à LOCATE_CHUNK_SIZE.
+
+        Returns:
+            numpy.ndarray: Indice du polygone contenant chaque point, le plus petit si plusieurs le contiennent,
+                -1 si aucun ne le contient. (P)
+        """
+        coordinates, offsets = self.buffers()
+        return collision.locate_points(points, coordinates, offsets, self.bounds(), chunk_size=chunk_size)
+
+    def minkowski_sum(self, kernel):
+        """Retourne la somme de Minkowski de chaque polygone convexe de la collection avec un même noyau convexe.
+
+        Gonfler des obstacles par la forme d'un mobile revient à leur ajouter le symétrique du mobile. Les arêtes
+        de tous les polygones sont fusionnées en une passe avec celles du noyau (voir minkowski.minkowski_sums()).
+
+        Args:
+            kernel (Polygon | numpy.ndarray): Noyau convexe, d'au moins 3 sommets distincts.
+
+        Returns:
+            Collection: Nouvelle collection construite à partir de tampons. La somme d'un polygone vide est vide.
+
+        Raises:
+            ValueError: Si un polygone ou le noyau n'est pas convexe, ou si le noyau a moins de 3 sommets distincts.
+        """
+        if isinstance(kernel, Polygon):
+            kernel = kernel.coordinates()
+        return Collection.from_buffers(*minkowski.minkowski_sums(*self.buffers(), kernel))
+
+    def delaunay(self, rng=None):
+        """Retourne la triangulation de Delaunay de tous les sommets de la collection.
+
+        Les indices des points de la triangulation sont ceux des sommets dans les tampons : les sommets partagés
+        par plusieurs polygones ne sont insérés qu'une fois (voir DelaunayTriangulation.representatives). Ses
+        arêtes forment le graphe de voisinage des sommets (voir DelaunayTriangulation.edges()), et d'autres points
+        peuvent lui être ajoutés sans la reconstruire.
+
+        Args:
+            rng (numpy.random.Generator, optional): Générateur de l'ordre d'insertion. Par défaut non initialisé.
+
+        Returns:
+            DelaunayTriangulation: Triangulation des sommets.
+        """
+        return delaunay.DelaunayTriangulation(self.buffers()[0], rng)
+
+    def convex_hulls(self):
+        """Retourne l'enveloppe convexe de chaque polygone, calculée directement sur les tampons.
+
+        Returns:
+            list[list[tuple(float, float)]]: Sommets de chaque enveloppe (voir convex_hull_points()).
+        """
+        coordinates, offsets = self.buffers()
+        return [convex_hull_points(coordinates[start:stop]) for start, stop in zip(offsets[:-1], offsets[1:])]
+
+    def diameters(self):
+        """Calcule le diamètre de chaque polygone (voir Polygon.diameter()).
+
+        Returns:
+            numpy.ndarray: Diamètre de chaque polygone, NaN si vide. (N)
+        """
+        return np.array([calipers.diameter(hull) if hull else np.nan for hull in self.convex_hulls()],
+                        dtype=np.float64)
+
+    def widths(self):
+        """Calcule la largeur de chaque polygone (voir Polygon.width()).
+
+        Returns:
+            numpy.ndarray: Largeur de chaque polygone, NaN si vide. (N)
+        """
+        return np.array([calipers.width(hull) if hull else np.nan for hull in self.convex_hulls()],
+                        dtype=np.float64)
+
+    def min_area_rects(self):
+        """Calcule le rectangle orienté d'aire minimale contenant chaque polygone (voir Polygon.min_area_rect()).
+
+        Returns:
+            numpy.ndarray: Sommets de chaque rectangle, dans le sens trigonométrique, NaN si vide. (N, 4, 2)
+        """
+        rectangles = np.full((len(self), 4, 2), np.nan)
+        for index, hull in enumerate(self.convex_hulls()):
+            if hull:
+                rectangles[index] = calipers.min_area_rect(hull)
+
+        return rectangles
+
+    def largest_interior_rectangles(self, workers=None, executor='thread', timeout=None, cancel=None,
+                                    chunk_size=64):
+        """Calcule en parallèle le plus grand rectangle intérieur de chaque polygone.
+
+        Les polygones sont répartis par paquets entre les fils d'exécution (ou les processus) d'un groupe.
+        Les processus sont démarrés par 'spawn' : les fils d'exécution de numba et d'OpenCV ne survivent
+        pas à un 'fork'.
+
+        Args:
+            workers (int, optional): Nombre de fils d'exécution ou de processus. Par défaut, choisi par
+                concurrent.futures.
+            executor (str, optional): 'thread' pour un groupe de fils d'exécution, 'process' pour un groupe
+                de processus. Par défaut à 'thread'.
+            timeout (float, optional): Durée maximale du calcul, en secondes. Par défaut illimitée.
+            cancel (threading.Event, optional): Événement interrompant le calcul dès qu'il est déclenché.
+            chunk_size (int, optional): Nombre de polygones par paquet. Par défaut à 64.
+
+        Returns:
+            numpy.ndarray: Sommets limites (x_min, y_min, x_max, y_max) du rectangle de chaque polygone, dans
+                l'ordre de la collection. Les lignes des polygones non traités (délai dépassé ou calcul
+                interrompu) valent NaN. (N, 4)
+
+        Raises:
+            ValueError: Si executor n'est ni 'thread' ni 'process'.
+        """
+        match executor:
+            case 'thread':
+                # Les fils d'exécution ne doivent pas déclencher eux-mêmes le chargement différé
+                # (largestinteriorrectangle utilise OpenCV).
+                load(cv2)
+                load(lir)
+                load(np)
+                pool = ThreadPoolExecutor(max_workers=workers)
+            case 'process':
+                pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+            case _:
+                raise ValueError("executor invalide. Valeurs possibles : 'thread', 'process'.")
+
+        coordinates, offsets = self.buffers()
+        rectangles = np.full((len(self), 4), np.nan)
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        try:
+            futures = {}
+            for start in range(0, len(self), chunk_size):
+                stop = min(start + chunk_size, len(self))
+                chunk_coordinates = coordinates[offsets[start]:offsets[stop]]
+                chunk_offsets = offsets[start:stop + 1] - offsets[start]
+                futures[pool.submit(largest_interior_rectangles_chunk, chunk_coordinates, chunk_offsets)] = start
+
+            pending = set(futures)
+            while pending and not (cancel is not None and cancel.is_set()):
+                # L'attente est découpée afin de surveiller l'événement d'interruption.
+                wait_time = self.CANCEL_POLL_INTERVAL
+                if deadline is not None:
+                    wait_time = min(wait_time, deadline - time.monotonic())
+                    if wait_time <= 0:
+                        break
+
+                done, pending = wait(pending, timeout=wait_time, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = future.result()
+                    rectangles[futures[future]:futures[future] + len(chunk)] = chunk
+        finally:
+            # Les paquets en attente sont abandonnés, sans attendre ceux en cours.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        return rectangles
+
     def poly_file_print(self, file=stdout):
         """Imprime la collection dans un format spécifique pour les fichiers 'poly'.
         
@@ -119,8 +1008,20 @@ class Collection:
 
                     Attention ! Ces nombres devront être cohérents avec le nombre de polygones à générer. Par exemple, si le nombre de polygones à générer est égal à 16 alors si le nombre de divisions est nul, l'espace sera divisé en 16.
 
+                - placement (str): Méthode de placement des polygones :
+                    - 'subdivision' : Subdivisions récursives du plus grand rectangle intérieur de chaque polygone. (default)
+                    - 'grid' : Boîtes englobantes tirées au hasard et indexées dans une grille de hachage uniforme,
+                      sans chevauchement, en temps quasi linéaire. Les divisions sont ignorées.
+                - density (float): Fraction de l'espace couverte par les boîtes englobantes en placement 'grid'.
+                    (default to 0.5) Doit être comprise entre 0 (exclu) et 1. Si l'espace est trop encombré, les boîtes
+                    sont réduites : la densité obtenue peut être inférieure.
+
         Returns:
             Collection: Collection aléatoire de polygones.
+
+        Raises:
+            ValueError: Si une option est invalide, si l'espace ne peut plus accueillir de polygone en placement
+                'grid', ou s'il est trop petit pour les polygones convexes demandés.
         """
 
         def check_options(user_options):
@@ -175,6 +1076,14 @@ class Collection:
                                  given_options['space']['divisions'][1] >= 0)):
                         raise ValueError("divisions invalide. Doit être un tuple d'entiers supérieurs ou égaux à 0.")
 
+                if 'placement' in given_options and given_options['placement'] not in ('subdivision', 'grid'):
+                    raise ValueError("placement invalide. Valeurs possibles : 'subdivision', 'grid'.")
+
+                if 'density' in given_options and (
+                        not isinstance(given_options['density'], (int, float)) or
+                        not 0 < given_options['density'] <= 1):
+                    raise ValueError("density invalide. Doit être comprise entre 0 (exclu) et 1.")
+
             # Valeurs par défaut
             default_options = {
                 'type': 'polygon',
@@ -186,7 +1095,9 @@ class Collection:
                 'space': {
                     'space': None,
                     'divisions': (2, 2)
-                }
+                },
+                'placement': 'subdivision',
+                'density': 0.5,
             }
 
             if user_options is None:
@@ -214,7 +1125,8 @@ class Collection:
                     - 'convex' or 3 : Polygones convexes.
 
             Returns:
-                Polygon | Rectangle: Polygone généré aléatoirement.
+                Polygon | Rectangle | None: Polygone généré aléatoirement, ou None si l'espace est trop petit
+                    (ou plat) pour un polygone convexe à sommets entiers.
 
             Raises:
                 AssertionError: Contraintes sur le paramètre space non respectées.
@@ -232,13 +1144,14 @@ class Collection:
                 case 2 | 'simple':
                     return Polygon.random(space, vertices_count, simplify=True)
                 case 3 | 'convex':
-                    return Polygon.random(space, vertices_count, simplify=True)
+                    vertices = random_convex_vertices(space, vertices_count, random.getrandbits(64))
+                    return None if vertices is None else Polygon(vertices)
                 case _:
                     raise ValueError("Type de polygone inconnu ")
 
-        def generate_polygons(count, polygon_type, form, space, divisions):
+        def generate_polygons(count, polygon_type, form, space, divisions, builder):
             """
-            Retourne une collection de polygones générés aléatoirement.
+            Génère des polygones aléatoirement et les ajoute au constructeur de collection.
 
             Args:
                 count (int): Nombre de polygones à générer. (≥ 0)
@@ -254,16 +1167,21 @@ class Collection:
 
                 space (Rectangle): Rectangle représentant l'espace dans lequel les sommets du polygone seront tirés au hasard.
                 divisions (int, int): Nombre de divisions récursives verticales et horizontales de l'espace.
+                builder (CollectionBuilder): Constructeur auquel les polygones sont ajoutés.
 
             Returns:
-                Collection contenant les polygones.
+                int: Nombre de polygones qui n'ont pas pu être générés, faute de place.
             """
             if count == 0:
-                return Collection()
+                return 0
 
             polygon = generate_polygon(form, space, polygon_type)
+            if polygon is None:
+                # Espace dégénéré : ses polygones sont reportés sur les divisions suivantes.
+                return count
+            builder.append(polygon)
             if count == 1:
-                return Collection([polygon])
+                return 0
             count -= 1
 
             # S'il reste des polygons à générer.
@@ -275,16 +1193,128 @@ class Collection:
             subdivision_polys_count = (count % (divisions[0] * divisions[1])
                                        + count // (divisions[0] * divisions[1]))
 
-            collection = Collection([polygon])
-            for subspaces_line in subspaces:
-                for subspace in subspaces_line:
-                    collection += generate_polygons(subdivision_polys_count, polygon_type, form, subspace, divisions)
+            carried = 0
+            for subspace in chain.from_iterable(subspaces):
+                # La dernière division ne reçoit que les polygones restants.
+                subspace_polys_count = min(subdivision_polys_count + carried, count)
+                carried = generate_polygons(subspace_polys_count, polygon_type, form, subspace, divisions, builder)
+
+                count -= subspace_polys_count - carried
+                if count <= 0:
+                    return 0
+            return count
+
+        def place_polygons(count, polygon_type, form, space, density, builder):
+            """
+            Génère des polygones aléatoirement, chacun dans une boîte englobante qui ne chevauche aucune
+            des boîtes déjà placées, et les ajoute au constructeur de collection.
+
+            Les boîtes occupées sont indexées dans une grille de hachage uniforme dont les cellules sont au moins
+            aussi grandes que les boîtes : chaque boîte candidate n'est comparée qu'aux boîtes des (au plus) quatre
+            cellules qu'elle recouvre. Après GRID_PLACEMENT_ATTEMPTS échecs consécutifs, les boîtes sont réduites.
+
+            Args:
+                count (int): Nombre de polygones à générer. (≥ 0)
+                polygon_type (int | str): Type de polygones (voir generate_polygon()).
+                form (dict): Contraintes sur les polygones.
+                space (Rectangle): Rectangle représentant l'espace dans lequel les polygones sont placés.
+                density (float): Fraction visée de l'espace couverte par les boîtes englobantes. (0 < density ≤ 1)
+                builder (CollectionBuilder): Constructeur auquel les polygones sont ajoutés.
+
+            Raises:
+                ValueError: Si aucune boîte de taille minimale ne peut plus être placée, ou si une boîte est trop
+                    petite pour un polygone convexe à sommets entiers.
+            """
+            # Les sommets sont tirés sur des coordonnées entières : les boîtes le sont aussi.
+            x_min, y_min = math.ceil(space.vertices[0].x), math.ceil(space.vertices[0].y)
+            x_max, y_max = math.floor(space.vertices[2].x), math.floor(space.vertices[2].y)
+            area = max(x_max - x_min, 0) * max(y_max - y_min, 0)
 
-                    count -= subdivision_polys_count
-                    if count <= 0:
-                        return collection
+            # Côté d'une boîte carrée d'aire moyenne visée ; les boîtes ont un rapport d'aspect entre 1/2 et 2.
+            side = math.sqrt(density * area / max(count, 1))
+            # Un polygone strictement convexe de n sommets entiers tient dans une boîte de côtés au moins n.
+            convex = polygon_type in (3, 'convex')
+            min_side = max(cls.GRID_PLACEMENT_MIN_SIDE, form['min_vertices_count'] if convex else 0)
+            largest_min_side = max(cls.GRID_PLACEMENT_MIN_SIDE, form['max_vertices_count'] if convex else 0)
+            vertices_counts = []
+            vertices_count = None
+            cell = None
+            grid = {}
+            boxes = []
 
-            return collection
+            def cells(box):
+                return ((i, j) for i in range(box[0] // cell, box[2] // cell + 1)
+                        for j in range(box[1] // cell, box[3] // cell + 1))
+
+            def rebuild_grid(new_cell):
+                nonlocal cell
+                cell = new_cell
+                grid.clear()
+                for index, box in enumerate(boxes):
+                    for key in cells(box):
+                        grid.setdefault(key, []).append(index)
+
+            def overlaps(box):
+                # Comme pour les subdivisions, des boîtes peuvent partager un bord.
+                return any(box[0] < boxes[other][2] and boxes[other][0] < box[2]
+                           and box[1] < boxes[other][3] and boxes[other][1] < box[3]
+                           for key in cells(box) for other in grid.get(key, ()))
+
+            placed = 0
+            while placed < count:
+                max_side = max(math.ceil(side * math.sqrt(2)), largest_min_side)
+                if cell != max_side + 1:
+                    rebuild_grid(max_side + 1)
+
+                if convex and vertices_count is None:
+                    vertices_count = random.randint(form['min_vertices_count'], form['max_vertices_count'])
+                box_min_side = max(min_side, vertices_count) if convex else min_side
+                for _ in range(cls.GRID_PLACEMENT_ATTEMPTS):
+                    aspect = math.sqrt(random.uniform(0.5, 2.))
+                    width = min(max(round(side * aspect), box_min_side), max_side)
+                    length = min(max(round(side / aspect), box_min_side), max_side)
+                    if x_max - x_min < width or y_max - y_min < length:
+                        continue
+
+                    x = random.randint(x_min, x_max - width)
+                    y = random.randint(y_min, y_max - length)
+                    box = (x, y, x + width, y + length)
+                    if overlaps(box):
+                        continue
+
+                    boxes.append(box)
+                    for key in cells(box):
+                        grid.setdefault(key, []).append(len(boxes) - 1)
+                    if convex:
+                        vertices_counts.append(vertices_count)
+                        vertices_count = None
+                    else:
+                        builder.append(generate_polygon(form, Rectangle(Vertice(x, y), length, width), polygon_type))
+                    placed += 1
+                    break
+                else:
+                    # Espace trop encombré pour cette taille : les boîtes suivantes sont réduites.
+                    if side <= min_side:
+                        raise ValueError("Espace insuffisant pour placer tous les polygones sans chevauchement.")
+                    side = max(side * cls.GRID_PLACEMENT_SHRINK, min_side)
+
+            if convex:
+                # Les polygones convexes sont générés par lots, un lot par nombre de sommets.
+                vertices_counts = np.array(vertices_counts, dtype=np.int64)
+                polygons = [None] * len(boxes)
+                rng = np.random.default_rng(random.getrandbits(64))
+                for vertices_count in np.unique(vertices_counts).tolist():
+                    indices = np.flatnonzero(vertices_counts == vertices_count)
+                    batch = generation.random_convex_coordinates(len(indices), vertices_count, rng)
+                    for index, coordinates in zip(indices.tolist(), batch):
+                        x, y, x_end, y_end = boxes[index]
+                        # Tirage du lot complété si l'arrondi aligne des sommets, recommencé en dernier recours
+                        vertices = random_convex_vertices(Rectangle(Vertice(x, y), y_end - y, x_end - x),
+                                                          vertices_count, rng, batch=coordinates)
+                        if vertices is None:
+                            raise ValueError("Espace insuffisant pour placer tous les polygones convexes.")
+                        polygons[index] = Polygon(vertices)
+                builder.extend(polygons)
 
         # Vérification des options
         options = check_options(options)
@@ -294,6 +1324,153 @@ class Collection:
             options['space']['space'] = Rectangle(Vertice(), cls.DEFAULT_RANDOM_SPACE_LENGTH,
                                                   cls.DEFAULT_RANDOM_SPACE_WIDTH)
 
-        # noinspection PyTypeChecker
-        return generate_polygons(options['count'], options['type'], options['form'],
-                                 options['space']['space'], options['space']['divisions'])
+        builder = CollectionBuilder(options['count'])
+        if options['placement'] == 'grid':
+            place_polygons(options['count'], options['type'], options['form'],
+                           options['space']['space'], options['density'], builder)
+        else:
+            # noinspection PyTypeChecker
+            if generate_polygons(options['count'], options['type'], options['form'],
+                                 options['space']['space'], options['space']['divisions'], builder):
+                raise ValueError("Espace insuffisant pour générer tous les polygones convexes.")
+        return builder.build()
+
+
+def storage_coordinates(coordinates, dtype=None):
+    """Convertit des coordonnées dans un type de stockage des tampons d'une collection.
+
+    Args:
+        coordinates (numpy.ndarray): Coordonnées des sommets. (V, 2)
+        dtype (numpy.dtype, optional): float64 ou int32. Par défaut, int32 si les coordonnées sont déjà de ce type,
+            float64 sinon.
+
+    Returns:
+        numpy.ndarray: Coordonnées, copiées seulement si leur type change.
+
+    Raises:
+        ValueError: Si le type n'est pas pris en charge, ou si, pour int32, des coordonnées ne sont pas des entiers
+            bornés par INTEGER_COORDINATE_LIMIT.
+    """
+    coordinates = np.asarray(coordinates)
+    if dtype is None:
+        dtype = np.int32 if coordinates.dtype == np.int32 else np.float64
+
+    if np.dtype(dtype) == np.float64:
+        return coordinates.astype(np.float64, copy=False)
+    if np.dtype(dtype) != np.int32:
+        raise ValueError("Type de coordonnées invalide. Valeurs possibles : float64, int32.")
+
+    if not np.issubdtype(coordinates.dtype, np.integer):
+        if not np.all(np.isfinite(coordinates)) or np.any(coordinates != np.round(coordinates)):
+            raise ValueError("Les coordonnées du mode entier doivent être des entiers !")
+    limit = predicates.INTEGER_COORDINATE_LIMIT
+    if coordinates.size and not -limit < coordinates.min() <= coordinates.max() < limit:
+        raise ValueError(f"Les coordonnées du mode entier doivent être comprises entre -{limit} et {limit} (exclus) !")
+    return coordinates.astype(np.int32, copy=False)
+
+
+def largest_interior_rectangles_chunk(coordinates, offsets):
+    """Calcule le plus grand rectangle intérieur de chaque polygone d'un paquet.
+
+    Args:
+        coordinates (numpy.ndarray): Coordonnées des sommets du paquet. (V, 2)
+        offsets (numpy.ndarray): Indices de début de chaque polygone, suivis de V. (N + 1)
+
+    Returns:
+        numpy.ndarray: Sommets limites (x_min, y_min, x_max, y_max) de chaque rectangle. (N, 4)
+    """
+    return np.array([largest_interior_rectangle_bounds(coordinates[start:stop])
+                     for start, stop in zip(offsets[:-1], offsets[1:])], dtype=np.float64).reshape(-1, 4)
+
+
+class CollectionBuilder:
+    """Construit une collection en temps linéaire.
+
+    Les polygones sont ajoutés un à un et leurs coordonnées sont recopiées dans des tampons
+    préalloués dont la capacité double lorsqu'ils sont pleins. La collection construite dispose
+    ainsi directement de ses tampons de coordonnées, sans les recalculer.
+
+    Attributes:
+        polygons (list[Polygon]): Polygones ajoutés.
+    """
+    DEFAULT_VERTICES_PER_POLYGON = 8
+
+    def __init__(self, capacity=0, vertices_capacity=None):
+        """Initialise un constructeur de collection.
+
+        Args:
+            capacity (int, optional): Nombre de polygones attendus. Par défaut à 0.
+            vertices_capacity (int, optional): Nombre de sommets attendus.
+                Par défaut à DEFAULT_VERTICES_PER_POLYGON sommets par polygone attendu.
+        """
+        if vertices_capacity is None:
+            vertices_capacity = capacity * self.DEFAULT_VERTICES_PER_POLYGON
+
+        self.polygons = []
+        # Tampons préalloués : coordonnées à plat (x, y, x, y, ...) et indices de début.
+        self._coordinates = array('d', bytes(16 * max(vertices_capacity, 1)))
+        self._offsets = array('q', bytes(8 * (max(capacity, 1) + 1)))
+        self._size = 0
+
+    def __len__(self):
+        """Retourne le nombre de polygones ajoutés.
+
+        Returns:
+            int: Nombre de polygones.
+        """
+        return len(self.polygons)
+
+    def append(self, polygon):
+        """Ajoute un polygone à la collection en construction.
+
+        Args:
+            polygon (Polygon): Polygone à ajouter.
+
+        Raises:
+            TypeError: Si polygon n'est pas un polygone.
+        """
+        if not isinstance(polygon, Polygon):
+            raise TypeError(f"Opération non autorisée entre CollectionBuilder et {type(polygon)} !")
+
+        count = len(self.polygons)
+        size = self._size
+        coordinates = self._coordinates
+
+        # Agrandissement géométrique des tampons
+        missing = size + 2 * len(polygon) - len(coordinates)
+        if missing > 0:
+            coordinates.frombytes(bytes(8 * max(missing, len(coordinates))))
+        if count + 2 > len(self._offsets):
+            self._offsets.frombytes(bytes(8 * len(self._offsets)))
+
+        for vertice in polygon.vertices:
+            coordinates[size] = vertice.x
+            coordinates[size + 1] = vertice.y
+            size += 2
+
+        self._size = size
+        self._offsets[count + 1] = size // 2
+        self.polygons.append(polygon)
+
+    def extend(self, polygons):
+        """Ajoute des polygones à la collection en construction.
+
+        Args:
+            polygons (Collection | iterable[Polygon]): Polygones à ajouter.
+        """
+        for polygon in polygons:
+            self.append(polygon)
+
+    def build(self):
+        """Retourne la collection construite.
+
+        Returns:
+            Collection: Nouvelle collection, dont les tampons de coordonnées sont déjà calculés.
+        """
+        collection = Collection(self.polygons)
+        count = len(self.polygons)
+        collection._cache['buffers'] = (
+            np.frombuffer(self._coordinates, dtype=np.float64, count=self._size).reshape(-1, 2).copy(),
+            np.frombuffer(self._offsets, dtype=np.int64, count=count + 1).copy()
+        )
+        return collection
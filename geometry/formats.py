@@ -0,0 +1,267 @@
+"""
+Implémentation de la lecture et de l'écriture par paquets des fichiers de polygones.
+
+Deux formats sont pris en charge :
+- texte ('.poly') : une ligne "indice x y" par sommet, comme Collection.poly_file_print().
+  Les sommets consécutifs de même indice forment un polygone ;
+- binaire ('.polyb') : l'en-tête MAGIC, puis une suite de paquets. Chaque paquet
+  contient le nombre N de polygones et le nombre V de sommets (deux entiers de 64 bits),
+  les N + 1 indices de début des polygones (entiers de 64 bits), puis les V x 2
+  coordonnées (flottants de 64 bits), en petit-boutiste.
+
+Les fichiers sont lus et écrits en flux, un paquet de tampons (coordonnées,
+indices de début) à la fois : la mémoire utilisée ne dépend pas de la taille du fichier.
+"""
+
+import struct
+from itertools import islice
+
+from geometry.utilities.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# En-tête des fichiers binaires
+MAGIC = b"GEOPOLY\x01"
+
+# Nombre de polygones par paquet
+CHUNK_SIZE = 4096
+
+# Nombre de lignes lues à la fois dans un fichier texte
+TEXT_BLOCK_LINES = 1 << 16
+
+CHUNK_HEADER = struct.Struct("<qq")
+
+FORMATS = ('text', 'binary')
+
+
+def format_from_path(path, default='text'):
+    """
+    Déduit le format d'un fichier de son extension.
+
+    Args:
+        path (str):
+            Chemin du fichier, '-' pour l'entrée ou la sortie standard.
+        default (str):
+            Format retourné si l'extension n'est pas reconnue. (par défaut à 'text')
+    Returns:
+        str:
+            'binary' pour un fichier '.polyb', 'text' pour un fichier '.poly', default sinon.
+    """
+    if path.endswith('.polyb'):
+        return 'binary'
+    if path.endswith('.poly'):
+        return 'text'
+    return default
+
+
+def split_rows(rows):
+    """
+    Regroupe les lignes (indice, x, y) consécutives de même indice en polygones.
+
+    Args:
+        rows (numpy.ndarray):
+            Lignes du fichier texte. (V, 3)
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray):
+            Coordonnées des sommets (V, 2) et indices de début de chaque polygone, suivis de V. (N + 1)
+    """
+    starts = np.flatnonzero(np.diff(rows[:, 0]) != 0) + 1
+    offsets = np.concatenate([[0], starts, [len(rows)]]).astype(np.int64) if len(rows) else np.zeros(1, np.int64)
+    return np.ascontiguousarray(rows[:, 1:]), offsets
+
+
+def read_text(stream, chunk_size=CHUNK_SIZE):
+    """
+    Lit un fichier texte de polygones par paquets.
+
+    Args:
+        stream (io.BufferedIOBase | io.TextIOBase):
+            Flux d'entrée.
+        chunk_size (int):
+            Nombre maximal de polygones par paquet. (par défaut à CHUNK_SIZE)
+    Yields:
+        tuple(numpy.ndarray, numpy.ndarray):
+            Coordonnées des sommets (V, 2) et indices de début des polygones du paquet. (N + 1)
+    Raises:
+        ValueError:
+            Si une ligne ne contient pas exactement trois nombres.
+    """
+    pending = np.empty((0, 3))
+    while True:
+        lines = list(islice(stream, TEXT_BLOCK_LINES))
+        at_end = not lines
+        values = np.array((b" " if lines and isinstance(lines[0], bytes) else " ").join(lines).split(),
+                          dtype=np.float64)
+        if values.size % 3:
+            raise ValueError("Ligne invalide : format attendu 'indice x y' !")
+
+        rows = np.concatenate([pending, values.reshape(-1, 3)])
+        if len(rows) == 0:
+            return
+
+        coordinates, offsets = split_rows(rows)
+        polygons_count = len(offsets) - 1
+        # Avant la fin du flux, le dernier polygone peut se poursuivre dans le bloc suivant,
+        # et seuls des paquets complets sont émis.
+        ready = polygons_count if at_end else (polygons_count - 1) - (polygons_count - 1) % chunk_size
+        for start in range(0, ready, chunk_size):
+            stop = min(start + chunk_size, ready)
+            yield coordinates[offsets[start]:offsets[stop]].copy(), offsets[start:stop + 1] - offsets[start]
+
+        if at_end:
+            return
+        pending = rows[offsets[ready]:]
+
+
+def encode_text(coordinates, offsets, indices=None):
+    """
+    Encode un paquet de polygones au format texte.
+
+    Args:
+        coordinates (numpy.ndarray):
+            Coordonnées des sommets. (V, 2)
+        offsets (numpy.ndarray):
+            Indices de début de chaque polygone, suivis de V. (N + 1)
+        indices (numpy.ndarray, optional):
+            Indice écrit pour chaque polygone. (N) (par défaut à 0, 1, ..., N - 1)
+    Returns:
+        bytes:
+            Lignes "indice x y" des sommets.
+    """
+    counts = np.diff(offsets)
+    if indices is None:
+        indices = np.arange(len(counts))
+
+    lines = [f"{index} {x!r} {y!r}\n"
+             for index, (x, y) in zip(np.repeat(indices, counts).tolist(), coordinates.tolist())]
+    return "".join(lines).encode()
+
+
+def read_exactly(stream, size):
+    """
+    Lit exactement size octets d'un flux.
+
+    Args:
+        stream (io.BufferedIOBase):
+            Flux d'entrée.
+        size (int):
+            Nombre d'octets à lire.
+    Returns:
+        bytes:
+            Octets lus.
+    Raises:
+        ValueError:
+            Si le flux se termine avant.
+    """
+    data = stream.read(size)
+    while len(data) < size:
+        more = stream.read(size - len(data))
+        if not more:
+            raise ValueError("Fichier binaire tronqué !")
+        data += more
+    return data
+
+
+def read_binary(stream):
+    """
+    Lit un fichier binaire de polygones paquet par paquet.
+
+    Args:
+        stream (io.BufferedIOBase):
+            Flux d'entrée.
+    Yields:
+        tuple(numpy.ndarray, numpy.ndarray):
+            Coordonnées des sommets (V, 2) et indices de début des polygones du paquet. (N + 1)
+    Raises:
+        ValueError:
+            Si l'en-tête est invalide ou si le fichier est tronqué.
+    """
+    if stream.read(len(MAGIC)) != MAGIC:
+        raise ValueError("En-tête de fichier binaire invalide !")
+
+    while True:
+        header = stream.read(CHUNK_HEADER.size)
+        if not header:
+            return
+        if len(header) < CHUNK_HEADER.size:
+            header += read_exactly(stream, CHUNK_HEADER.size - len(header))
+
+        polygons_count, vertices_count = CHUNK_HEADER.unpack(header)
+        offsets = np.frombuffer(read_exactly(stream, 8 * (polygons_count + 1)), dtype="<i8").astype(np.int64)
+        coordinates = np.frombuffer(read_exactly(stream, 16 * vertices_count), dtype="<f8")
+        yield coordinates.astype(np.float64).reshape(-1, 2), offsets
+
+
+def encode_binary(coordinates, offsets):
+    """
+    Encode un paquet de polygones au format binaire (sans l'en-tête MAGIC).
+
+    Args:
+        coordinates (numpy.ndarray):
+            Coordonnées des sommets. (V, 2)
+        offsets (numpy.ndarray):
+            Indices de début de chaque polygone, suivis de V. (N + 1)
+    Returns:
+        bytes:
+            Paquet encodé.
+    """
+    return (CHUNK_HEADER.pack(len(offsets) - 1, len(coordinates))
+            + np.ascontiguousarray(offsets, dtype="<i8").tobytes()
+            + np.ascontiguousarray(coordinates, dtype="<f8").tobytes())
+
+
+def read_chunks(stream, file_format, chunk_size=CHUNK_SIZE):
+    """
+    Lit un fichier de polygones par paquets.
+
+    Args:
+        stream (io.BufferedIOBase):
+            Flux d'entrée.
+        file_format (str):
+            'text' ou 'binary'.
+        chunk_size (int):
+            Nombre maximal de polygones par paquet en format texte. (par défaut à CHUNK_SIZE)
+            Les paquets d'un fichier binaire sont lus tels qu'ils ont été écrits.
+    Returns:
+        iterator[tuple(numpy.ndarray, numpy.ndarray)]:
+            Paquets de tampons (coordonnées, indices de début).
+    Raises:
+        ValueError:
+            Si le format est inconnu.
+    """
+    match file_format:
+        case 'text':
+            return read_text(stream, chunk_size)
+        case 'binary':
+            return read_binary(stream)
+        case _:
+            raise ValueError("Format inconnu. Valeurs possibles : 'text', 'binary'.")
+
+
+def encode_chunk(coordinates, offsets, file_format, indices=None):
+    """
+    Encode un paquet de polygones.
+
+    Args:
+        coordinates (numpy.ndarray):
+            Coordonnées des sommets. (V, 2)
+        offsets (numpy.ndarray):
+            Indices de début de chaque polygone, suivis de V. (N + 1)
+        file_format (str):
+            'text' ou 'binary'.
+        indices (numpy.ndarray, optional):
+            Indice de chaque polygone, écrit en format texte seulement. (N)
+    Returns:
+        bytes:
+            Paquet encodé.
+    Raises:
+        ValueError:
+            Si le format est inconnu.
+    """
+    match file_format:
+        case 'text':
+            return encode_text(coordinates, offsets, indices)
+        case 'binary':
+            return encode_binary(coordinates, offsets)
+        case _:
+            raise ValueError("Format inconnu. Valeurs possibles : 'text', 'binary'.")
@@ -1,7 +1,11 @@
 from copy import copy
 
+from geometry.utilities import collision, predicates
+from geometry.utilities.lazy import lazy_import
 from geometry.vertice import Vertice
 
+np = lazy_import("numpy")
+
 
 class Segment:
     """Classe représentant un segment dans un espace à 2 dimensions.
@@ -140,3 +144,194 @@ class Segment:
             Vertice: Nouveau point représentant le vecteur du segment.
         """
         return self[1] - self[0]
+
+    def orientation(self, vertice):
+        """Retourne le signe exact du produit vectoriel entre le segment et le segment allant de sa
+        première extrémité au point donné.
+
+        Contrairement à l'opérateur *, le signe est garanti même pour des points presque alignés.
+
+        Args:
+            vertice (Vertice): Point dont l'orientation est calculée.
+
+        Returns:
+            int: 1 si le point est à gauche du segment, -1 s'il est à droite, 0 s'il est aligné.
+        """
+        return predicates.orientation(self[0].x, self[0].y, self[1].x, self[1].y, vertice.x, vertice.y)
+
+    def intersects(self, other):
+        """Vérifie si deux segments se coupent. Les segments qui se touchent ou se chevauchent se coupent.
+
+        Args:
+            other (Segment): Autre segment.
+
+        Returns:
+            bool: True si les segments se coupent, False sinon.
+        """
+        return bool(SegmentArray.from_segments([self]).intersects(SegmentArray.from_segments([other]))[0, 0])
+
+
+class SegmentArray:
+    """Classe représentant un ensemble de segments stockés dans un tableau contigu.
+
+    Attributes:
+        ends (numpy.ndarray): Extrémités des segments. (N, 2, 2)
+    """
+
+    def __init__(self, ends):
+        """Instancie un ensemble de segments.
+
+        Args:
+            ends (numpy.ndarray): Extrémités des segments, convertibles en tableau (N, 2, 2).
+
+        Raises:
+            ValueError: Si le tableau n'est pas de forme (N, 2, 2).
+        """
+        self.ends = np.asarray(ends, dtype=np.float64)
+        if self.ends.ndim != 3 or self.ends.shape[1:] != (2, 2):
+            raise ValueError("Les extrémités doivent former un tableau de forme (N, 2, 2) !")
+
+    def __len__(self):
+        """Retourne le nombre de segments.
+
+        Returns:
+            int: Nombre de segments.
+        """
+        return len(self.ends)
+
+    def __getitem__(self, item):
+        """Donne accès à un segment ou à un sous-ensemble de segments.
+
+        Args:
+            item (int | slice | numpy.ndarray): Index, tranche, tableau d'indices ou masque booléen.
+
+        Returns:
+            Segment | SegmentArray: Un segment si item est un entier, un sous-ensemble sinon.
+        """
+        if isinstance(item, (int, np.integer)):
+            (x1, y1), (x2, y2) = self.ends[item].tolist()
+            return Segment([Vertice(x1, y1), Vertice(x2, y2)])
+        return SegmentArray(self.ends[item])
+
+    def __repr__(self):
+        """Retourne une chaîne de caractère formelle représentant l'ensemble de segments.
+
+        Returns:
+            str: Chaîne de caractères formelle représentant l'ensemble de segments.
+        """
+        return f"SegmentArray({self.ends.tolist()})"
+
+    def lengths(self):
+        """Retourne les longueurs des segments.
+
+        Returns:
+            numpy.ndarray: Longueurs des segments. (N)
+        """
+        vectors = self.vectors()
+        return np.hypot(vectors[:, 0], vectors[:, 1])
+
+    def vectors(self):
+        """Retourne les vecteurs des segments.
+
+        Returns:
+            numpy.ndarray: Vecteurs des segments. (N, 2)
+        """
+        return self.ends[:, 1] - self.ends[:, 0]
+
+    def is_vertical(self):
+        """Vérifie quels segments sont verticaux.
+
+        Returns:
+            numpy.ndarray: Masque booléen des segments verticaux. (N)
+        """
+        return self.ends[:, 0, 0] == self.ends[:, 1, 0]
+
+    def is_horizontal(self):
+        """Vérifie quels segments sont horizontaux.
+
+        Returns:
+            numpy.ndarray: Masque booléen des segments horizontaux. (N)
+        """
+        return self.ends[:, 0, 1] == self.ends[:, 1, 1]
+
+    def bounds(self):
+        """Retourne les boîtes englobantes des segments.
+
+        Returns:
+            numpy.ndarray: Boîtes (x_min, y_min, x_max, y_max). (N, 4)
+        """
+        return np.concatenate([self.ends.min(axis=1), self.ends.max(axis=1)], axis=1)
+
+    def intersects(self, other):
+        """Vérifie quels segments de l'ensemble coupent quels segments d'un autre ensemble.
+
+        Seules les paires candidates trouvées par intersecting_pairs() sont testées : la matrice (N, M) retournée
+        est le seul tableau de cette taille.
+
+        Args:
+            other (SegmentArray): Autre ensemble de M segments.
+
+        Returns:
+            numpy.ndarray: Matrice booléenne (N, M), vraie si le segment i coupe le segment j.
+        """
+        pairs = self.intersecting_pairs(other)
+        result = np.zeros((len(self), len(other)), dtype=bool)
+        result[pairs[:, 0], pairs[:, 1]] = True
+        return result
+
+    def intersecting_pairs(self, other=None):
+        """Retourne les paires de segments qui se coupent.
+
+        Les paires candidates, dont les boîtes englobantes se touchent, sont trouvées par balayage et élagage sur
+        les boîtes des deux ensembles réunis (voir collision.sweep_and_prune()). Le test exact repose ensuite sur
+        le signe des orientations des extrémités et traite les chevauchements de segments alignés. Les segments
+        qui se touchent se coupent.
+
+        Args:
+            other (SegmentArray, optional): Autre ensemble de M segments. Par défaut, les paires (i, j) avec i < j
+                de l'ensemble lui-même.
+
+        Returns:
+            numpy.ndarray: Paires d'indices (i, j) de segments qui se coupent, triées. (K, 2)
+
+        Raises:
+            TypeError: Si other n'est pas un ensemble de segments.
+        """
+        if other is None:
+            other = self
+            pairs = collision.sweep_and_prune(self.bounds())
+        elif isinstance(other, SegmentArray):
+            # Seules les paires formées d'un segment de chaque ensemble sont conservées.
+            pairs = collision.sweep_and_prune(np.concatenate([self.bounds(), other.bounds()]))
+            pairs = pairs[(pairs[:, 0] < len(self)) & (pairs[:, 1] >= len(self))] - [0, len(self)]
+        else:
+            raise TypeError(f"Opération non autorisée entre SegmentArray et {type(other)} !")
+
+        first, second = self.ends[pairs[:, 0]], other.ends[pairs[:, 1]]
+        return pairs[collision.segments_intersect(first[:, 0], first[:, 1], second[:, 0], second[:, 1])]
+
+    @classmethod
+    def from_segments(cls, segments):
+        """Crée un ensemble de segments à partir d'objets Segment.
+
+        Args:
+            segments (list[Segment]): Segments à stocker.
+
+        Returns:
+            SegmentArray: Nouvel ensemble de segments.
+        """
+        return cls(np.array([[[segment[0].x, segment[0].y], [segment[1].x, segment[1].y]]
+                             for segment in segments], dtype=np.float64).reshape(-1, 2, 2))
+
+    @classmethod
+    def from_polygon(cls, coordinates):
+        """Crée l'ensemble des arêtes d'un polygone à partir de ses coordonnées.
+
+        Args:
+            coordinates (numpy.ndarray): Sommets du polygone. (n, 2)
+
+        Returns:
+            SegmentArray: Arêtes du polygone, la dernière reliant le dernier sommet au premier.
+        """
+        coordinates = np.asarray(coordinates, dtype=np.float64)
+        return cls(np.stack([coordinates, np.roll(coordinates, -1, axis=0)], axis=1))
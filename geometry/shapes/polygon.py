@@ -2,17 +2,20 @@
 Implémentation de l'objet Polygone dans un espace à 2 dimensions.
 """
 
-import importlib
-from copy import copy
+import math
+import random
+from array import array
 from itertools import islice, cycle
 
-import largestinteriorrectangle as lir
-import numpy as np
-
-import geometry.utilities.utils
-from geometry.segment import Segment
+from geometry.segment import Segment, SegmentArray
+from geometry.utilities import calipers, generation, locator, measures, minkowski, predicates, transforms, triangulation
+from geometry.utilities.lazy import lazy_import
 from geometry.vertice import Vertice
 
+# Dépendances lourdes chargées au premier usage
+lir = lazy_import("largestinteriorrectangle")
+np = lazy_import("numpy")
+
 
 class Polygon:
     """
@@ -26,6 +29,7 @@ class Polygon:
 
     DEFAULT_RANDOM_SPACE_WIDTH = 1280.
     DEFAULT_RANDOM_SPACE_LENGTH = 720.
+    CONVEX_RANDOM_ATTEMPTS = 32
 
     def __init__(self, vertices=None):
         """
@@ -88,6 +92,22 @@ class Polygon:
         """
         return len(self.vertices)
 
+    def __reduce__(self):
+        """
+        Sérialise le polygone sous la forme d'un tampon contigu de coordonnées
+        plutôt que d'un objet Vertice par sommet.
+
+        Returns:
+            tuple:
+                Fonction de reconstruction et ses arguments : classe du polygone,
+                coordonnées (x, y, x, y, ...) et autres attributs.
+        """
+        coordinates = array('d', [coordinate for vertice in self.vertices for coordinate in (vertice.x, vertice.y)])
+        # La triangulation mise en cache n'est pas transmise.
+        state = {key: value for key, value in self.__dict__.items() if key not in ('vertices', '_triangulation')}
+
+        return restore_polygon, (type(self), coordinates, state)
+
     def couples(self):
         """
         Retourne une liste consécutive de paires de points du polygone.
@@ -98,6 +118,21 @@ class Polygon:
         """
         return zip(self.vertices, islice(cycle(self.vertices), 1, None))
 
+    def coordinates(self, dtype=None):
+        """
+        Retourne les coordonnées des sommets du polygone.
+
+        Args:
+            dtype (numpy.dtype):
+                Type du tableau, par exemple int32 pour des coordonnées entières
+                (tronquées vers zéro). (par défaut à float64)
+        Returns:
+            numpy.ndarray:
+                Tableau (n, 2) des coordonnées des sommets.
+        """
+        return np.array([(vertice.x, vertice.y) for vertice in self.vertices],
+                        dtype=np.float64 if dtype is None else dtype).reshape(-1, 2)
+
     def segments(self):
         """
         Retourne une liste des segments du polygone.
@@ -108,6 +143,16 @@ class Polygon:
         """
         return map(Segment, self.couples())
 
+    def edges(self):
+        """
+        Retourne les arêtes du polygone dans un tableau contigu.
+
+        Returns:
+            SegmentArray:
+                Arêtes du polygone.
+        """
+        return SegmentArray.from_polygon(self.coordinates())
+
     def area(self):
         """
         Retourne l'aire du polygone.
@@ -147,7 +192,8 @@ class Polygon:
 
     def center(self):
         """
-        Retourne le barycentre.
+        Retourne l'isobarycentre des sommets, indépendant de leur ordre
+        (voir centroid() pour le centre de gravité de la surface).
 
         Returns:
             Vertice:
@@ -158,10 +204,37 @@ class Polygon:
         """
         assert len(self) >= 3, "Nombre de sommets <= 3 !"
 
-        return Vertice(
-            sum(vertice[0] for vertice in self.vertices) / len(self),
-            sum(vertice[1] for vertice in self.vertices) / len(self)
-        )
+        x, y = 0., 0.
+        for vertice in self.vertices:
+            x += vertice.x
+            y += vertice.y
+
+        return Vertice(x / len(self), y / len(self))
+
+    def centroid(self):
+        """
+        Retourne le centre de gravité de la surface du polygone, pondéré par l'aire.
+
+        Returns:
+            Vertice:
+                Centre de gravité, de coordonnées NaN si le polygone est d'aire nulle.
+        """
+        return Vertice(*self.moments()[1])
+
+    def moments(self):
+        """
+        Retourne l'aire, le centre de gravité et les moments d'inertie centrés du polygone,
+        ainsi que l'orientation de son axe principal (voir measures.moments()).
+
+        Returns:
+            tuple(float, numpy.ndarray, numpy.ndarray, float):
+                Aire, centre de gravité (2), moments centrés (mu20, mu02, mu11) (3),
+                et angle en radians de l'axe principal de plus faible inertie.
+        """
+        coordinates = self.coordinates()
+        areas, centers, second_moments, orientations = measures.moments(
+            coordinates, np.array([0, len(coordinates)]))
+        return float(areas[0]), centers[0], second_moments[0], float(orientations[0])
 
     def simplify(self):
         """
@@ -174,36 +247,236 @@ class Polygon:
         # Tri des points basés sur l'angle
         self.vertices.sort(key=lambda vertice: vertice.angle(center))
 
+    def transform(self, matrix, inplace=False):
+        """
+        Applique une transformation affine au polygone, en un seul produit
+        matriciel sur ses coordonnées.
+
+        Args:
+            matrix (numpy.ndarray):
+                Matrice de la transformation (voir geometry.utilities.transforms). (2, 3) ou (3, 3)
+            inplace (bool):
+                Si True, les sommets du polygone sont remplacés. Les collections qui contiennent
+                le polygone détectent la modification à leur requête suivante. (par défaut à False)
+        Returns:
+            Polygon:
+                Polygone transformé : le polygone lui-même si inplace, une copie sinon.
+        Raises:
+            ValueError:
+                Si la matrice n'est pas une matrice affine unique.
+        """
+        matrix = transforms.affine_part(matrix)
+        if matrix.ndim != 2:
+            raise ValueError("Une seule matrice peut être appliquée à un polygone !")
+
+        polygon = self if inplace else self._copy()
+        polygon.vertices = [Vertice(x, y) for x, y in transforms.apply(self.coordinates(), matrix).tolist()]
+        return polygon
+
+    def translate(self, dx, dy, inplace=False):
+        """
+        Translate le polygone.
+
+        Args:
+            dx (float):
+                Déplacement horizontal.
+            dy (float):
+                Déplacement vertical.
+            inplace (bool):
+                Si True, les sommets du polygone sont remplacés. (par défaut à False)
+        Returns:
+            Polygon:
+                Polygone translaté.
+        """
+        return self.transform(transforms.translation(dx, dy), inplace)
+
+    def rotate(self, angle, center=None, inplace=False):
+        """
+        Tourne le polygone.
+
+        Args:
+            angle (float):
+                Angle en radians, dans le sens trigonométrique.
+            center (tuple(float, float)):
+                Centre de la rotation. (par défaut à l'origine)
+            inplace (bool):
+                Si True, les sommets du polygone sont remplacés. (par défaut à False)
+        Returns:
+            Polygon:
+                Polygone tourné.
+        """
+        return self.transform(transforms.rotation(angle, center), inplace)
+
+    def scale(self, sx, sy=None, center=None, inplace=False):
+        """
+        Met le polygone à l'échelle.
+
+        Args:
+            sx (float):
+                Facteur horizontal.
+            sy (float):
+                Facteur vertical. (par défaut à sx)
+            center (tuple(float, float)):
+                Centre de la mise à l'échelle. (par défaut à l'origine)
+            inplace (bool):
+                Si True, les sommets du polygone sont remplacés. (par défaut à False)
+        Returns:
+            Polygon:
+                Polygone mis à l'échelle.
+        """
+        return self.transform(transforms.scaling(sx, sy, center), inplace)
+
+    def _copy(self):
+        """
+        Retourne une copie superficielle du polygone, qui partage ses sommets.
+
+        Returns:
+            Polygon:
+                Nouveau polygone de la même classe, avec les mêmes attributs.
+        """
+        polygon = type(self).__new__(type(self))
+        polygon.__dict__.update(self.__dict__)
+        polygon.vertices = list(self.vertices)
+        return polygon
+
     def convex_hull(self):
         """
-        Retourne l'enveloppe convexe du polygone en utilisant le parcours
-        de Graham.
+        Retourne l'enveloppe convexe du polygone en utilisant la variante
+        de Graham par chaînes monotones (Andrew). Les tournants sont
+        évalués par un prédicat d'orientation robuste.
+
+        Returns:
+            Polygon:
+                Nouveau polygone représentant l'enveloppe convexe du polygone,
+                parcourue dans le sens trigonométrique à partir du sommet
+                d'ordonnée minimale (puis d'abscisse minimale).
+                Les sommets alignés sont retirés.
+        """
+        hull = convex_hull_points((vertice.x, vertice.y) for vertice in self.vertices)
+        return Polygon([Vertice(x, y) for x, y in hull])
+
+    def diameter(self):
+        """
+        Retourne le diamètre du polygone : la plus grande distance entre deux
+        de ses sommets, calculée par pieds à coulisse tournants sur l'enveloppe convexe.
 
+        Returns:
+            float:
+                Diamètre du polygone, nul s'il n'a aucun sommet.
+        """
+        hull = convex_hull_points((vertice.x, vertice.y) for vertice in self.vertices)
+        return calipers.diameter(hull) if hull else 0.
+
+    def width(self):
+        """
+        Retourne la largeur du polygone : la plus petite distance entre deux droites
+        parallèles qui l'encadrent, calculée par pieds à coulisse tournants sur l'enveloppe convexe.
+
+        Returns:
+            float:
+                Largeur du polygone, nulle s'il a moins de trois sommets non alignés.
+        """
+        hull = convex_hull_points((vertice.x, vertice.y) for vertice in self.vertices)
+        return calipers.width(hull) if hull else 0.
+
+    def min_area_rect(self):
+        """
+        Retourne le rectangle orienté d'aire minimale contenant le polygone, calculé
+        par pieds à coulisse tournants sur l'enveloppe convexe.
+
+        Returns:
+            Polygon:
+                Rectangle orienté, parcouru dans le sens trigonométrique.
+                Polygone vide si le polygone n'a aucun sommet.
+        """
+        hull = convex_hull_points((vertice.x, vertice.y) for vertice in self.vertices)
+        if not hull:
+            return Polygon()
+
+        return Polygon([Vertice(x, y) for x, y in calipers.min_area_rect(hull).tolist()])
+
+    def minkowski_sum(self, other):
+        """
+        Retourne la somme de Minkowski de deux polygones convexes, calculée en temps
+        linéaire par fusion de leurs arêtes triées par angle polaire.
+
+        Args:
+            other (Polygon):
+                Autre polygone convexe, d'au moins 3 sommets distincts.
         Returns:
             Polygon:
-                Nouveau polygone représentant l'enveloppe convexe du polygone.
+                Nouveau polygone convexe, parcouru dans le sens trigonométrique à partir
+                du sommet d'ordonnée minimale (puis d'abscisse minimale).
+        Raises:
+            TypeError:
+                Si other n'est pas un polygone.
+            ValueError:
+                Si l'un des polygones n'est pas convexe, ou si other a moins de 3 sommets distincts.
         """
-        vertices = [copy(vertice) for vertice in self.vertices]
+        if not isinstance(other, Polygon):
+            raise TypeError(f"Opération non autorisée entre Polygon et {type(other)} !")
 
-        # Recherche du pivot
-        vertices.sort(key=lambda vertice: (vertice.y, vertice.x))
+        coordinates, _ = minkowski.minkowski_sums(self.coordinates(), np.array([0, len(self)]), other.coordinates())
+        return Polygon([Vertice(x, y) for x, y in coordinates.tolist()])
+
+    def triangulate(self):
+        """
+        Retourne une triangulation du polygone, obtenue par découpage d'oreilles.
+        Elle est mise en cache tant que les sommets du polygone ne changent pas.
 
-        # Tri des sommets par angle croissant par rapport au pivot
-        # Les sommets d'angle égal seront triés par abscisse croissante.
-        vertices[1:] = sorted(vertices[1:], key=lambda vertice: (vertice.angle(vertices[0]), vertice.x))
+        Returns:
+            numpy.ndarray:
+                Sommets de chaque triangle, dans le sens trigonométrique. (n - 2, 3, 2)
+        Raises:
+            ValueError:
+                Si le polygone n'est pas simple (deux arêtes non consécutives se touchent).
+        """
+        key = tuple((vertice.x, vertice.y) for vertice in self.vertices)
+        cached = self.__dict__.get('_triangulation')
+        if cached is None or cached[0] != key:
+            coordinates = np.array(key, dtype=np.float64).reshape(-1, 2)
+            triangles = coordinates[triangulation.triangulate(coordinates)]
+            cumulative = np.cumsum(triangulation.triangle_areas(triangles))
+            self._triangulation = key, triangles, cumulative
 
-        vertices_stack = [
-            vertices[0], vertices[1]
-        ]
+        return self._triangulation[1]
 
-        # Construction itérative de l'enveloppe convexe
-        for index in range(2, len(vertices)):
-            # Attente d'un tournant à gauche
-            while len(vertices_stack) >= 2 and (Segment([vertices_stack[1], vertices_stack[0]]) * vertices[index]) > 0:
-                vertices_stack.pop()
-            vertices_stack.append(vertices[index])
+    def build_locator(self):
+        """
+        Construit une structure de localisation de points dans le polygone (décomposition en bandes),
+        pour des requêtes répétées en O(log n) par point. La structure ne suit pas les modifications
+        ultérieures du polygone.
 
-        return Polygon(vertices_stack)
+        Returns:
+            SlabLocator:
+                Structure de localisation (voir SlabLocator.locate()).
+        Raises:
+            ValueError:
+                Si le polygone a moins de 3 sommets.
+        """
+        return locator.SlabLocator(self.coordinates())
+
+    def sample_points(self, count, rng=None):
+        """
+        Tire des points uniformément répartis à l'intérieur du polygone.
+        Le polygone est triangulé une seule fois, puis chaque point est tiré dans
+        un triangle choisi proportionnellement à son aire.
+
+        Args:
+            count (int):
+                Nombre de points à tirer. (≥ 0)
+            rng (numpy.random.Generator | int):
+                Générateur aléatoire, ou graine. (par défaut à None)
+        Returns:
+            numpy.ndarray:
+                Points tirés. (count, 2)
+        Raises:
+            ValueError:
+                Si le polygone n'est pas simple (deux arêtes non consécutives
+                se touchent) ou est d'aire nulle, ou si le nombre de points est négatif.
+        """
+        triangles = self.triangulate()
+        return triangulation.sample_triangles(triangles, count, rng, cumulative=self._triangulation[2])
 
     def is_convex(self):
         """
@@ -224,13 +497,12 @@ class Polygon:
             )
             next_vertice = self[(index + 2) % vertices_count]
 
-            # Tournant à gauche si signe du produit vectoriel est négatif.
-            # Tournant à droite si le signe du produit est positif.
-            product = segment * next_vertice
-            orientation = geometry.utilities.utils.sign(product)
+            # Tournant à gauche si l'orientation est positive.
+            # Tournant à droite si l'orientation est négative.
+            orientation = segment.orientation(next_vertice)
 
             # Vecteurs non collinéaires ?
-            if product != 0:
+            if orientation != 0:
                 # Premièr segment
                 if current_orientation == 0:
                     current_orientation = orientation
@@ -248,24 +520,17 @@ class Polygon:
             Rectangle:
                 Plus grand rectangle intérieur du polygone.
         """
-        # La liste des sommets est convertie au format requis par la librairie largestinteriorrectangle.
-        lir_format_polygon = np.array([[[vertice.x, vertice.y] for vertice in self.vertices]], np.int32)
-
-        # Le plus grand rectangle intérieur est ensuite calculé.
-        lir_format_rectangle = lir.lir(lir_format_polygon)
-
         # On récupère les sommets limites du rectangle.
-        top_left = lir.pt1(lir_format_rectangle)
-        top_left = Vertice(top_left[0], top_left[1])
-
-        bottom_right = lir.pt2(lir_format_rectangle)
-        bottom_right = Vertice(bottom_right[0], bottom_right[1])
+        x_min, y_min, x_max, y_max = largest_interior_rectangle_bounds(self.coordinates(np.int32))
+        top_left = Vertice(x_min, y_min)
+        bottom_right = Vertice(x_max, y_max)
 
         # Dimensions du rectangle
         dimensions = bottom_right - top_left
 
-        rectangle = importlib.import_module("geometry.shapes.rectangle").Rectangle
-        return rectangle(top_left, dimensions.y, dimensions.x)
+        # Import local : le module rectangle importe lui-même ce module.
+        from geometry.shapes.rectangle import Rectangle
+        return Rectangle(top_left, dimensions.y, dimensions.x)
 
     @classmethod
     def random(cls, space=None, vertices_count=3, simplify=False, convex=False):
@@ -282,20 +547,22 @@ class Polygon:
             simplify (bool):
                 Si True, le polygone sera simple. (par défaut à False)
             convex (bool):
-                Si True, le polygone sera forcément convexe. (par défaut à False)
-                Attention ! L'enveloppe convexe sera retournée, il se peut donc
-                qu'il n'y ait pas autant de sommets que demandés.
+                Si True, le polygone sera strictement convexe, avec exactement
+                vertices_count sommets entiers (algorithme de Valtr), et aura pour
+                boîte englobante l'espace ramené à des coordonnées entières.
+                (par défaut à False)
         Returns:
             Polygon:
                 Nouveau polygone aléatoire.
         Raises:
             ValueError:
-                Le nombre de sommets est inférieur à 3.
+                Le nombre de sommets est inférieur à 3, ou l'espace est trop petit
+                pour un polygone convexe de vertices_count sommets entiers.
         """
         if not space:
-            # Import dynamique de la classe Rectangle
-            rectangle = importlib.import_module("geometry.shapes.rectangle").Rectangle
-            space = rectangle(
+            # Import local : le module rectangle importe lui-même ce module.
+            from geometry.shapes.rectangle import Rectangle
+            space = Rectangle(
                 Vertice(), cls.DEFAULT_RANDOM_SPACE_LENGTH,
                 cls.DEFAULT_RANDOM_SPACE_WIDTH
             )
@@ -304,17 +571,168 @@ class Polygon:
         if vertices_count < 3:
             raise ValueError("Nombre de sommets minimal : 3 !")
 
+        # Polygone convexe
+        if convex:
+            # Le générateur NumPy est initialisé depuis le module random, pour rester reproductible avec random.seed().
+            vertices = random_convex_vertices(space, vertices_count, random.getrandbits(64), cls.CONVEX_RANDOM_ATTEMPTS)
+            if vertices is None:
+                raise ValueError(f"Espace trop petit pour un polygone convexe de {vertices_count} sommets entiers !")
+            return Polygon(vertices)
+
         # Création d'un polygone quelconque
         polygon = Polygon()
         for _ in range(vertices_count):
             polygon.add_vertice(Vertice.random(space))
 
-        # Polygone convexe
-        if convex:
-            return polygon.convex_hull()
-
         # 'Simplification' du polygone
         if simplify:
             polygon.simplify()
 
         return polygon
+
+
+def fit_to_space(coordinates, space):
+    """
+    Place des sommets définis dans le carré unité dans un espace rectangulaire, sur
+    des coordonnées entières comme Vertice.random() : le carré unité est mis à
+    l'échelle des abscisses et ordonnées entières de l'espace, puis arrondi.
+
+    Args:
+        coordinates (numpy.ndarray):
+            Sommets dans le carré unité [0, 1] x [0, 1]. (n, 2)
+        space (Rectangle):
+            Espace de destination, qui contient au moins une abscisse et une ordonnée entières.
+    Returns:
+        list[Vertice]:
+            Sommets placés dans l'espace.
+    """
+    origin, opposite = space.vertices[0], space.vertices[2]
+    x_min, y_min = math.ceil(origin.x), math.ceil(origin.y)
+    x_max, y_max = math.floor(opposite.x), math.floor(opposite.y)
+    scaled = np.rint(np.asarray(coordinates) * (max(x_max - x_min, 0), max(y_max - y_min, 0))) + (x_min, y_min)
+    return [Vertice(x, y) for x, y in scaled.tolist()]
+
+
+def random_convex_vertices(space, vertices_count, rng=None, attempts=Polygon.CONVEX_RANDOM_ATTEMPTS, batch=None):
+    """
+    Tire un polygone strictement convexe de vertices_count sommets entiers dans un espace
+    (algorithme de Valtr, puis fit_to_space()). Les sommets confondus ou alignés par l'arrondi
+    sont retirés, puis remplacés par de nouveaux sommets entiers ; si ce n'est pas possible,
+    le tirage est recommencé.
+
+    Args:
+        space (Rectangle):
+            Espace de destination.
+        vertices_count (int):
+            Nombre de sommets. (≥ 3)
+        rng (numpy.random.Generator | int, optional):
+            Générateur aléatoire, ou graine. (par défaut à None)
+        attempts (int):
+            Nombre maximal de tirages. (par défaut à Polygon.CONVEX_RANDOM_ATTEMPTS)
+        batch (numpy.ndarray):
+            Premier tirage dans le carré unité, issu d'un lot. (vertices_count, 2) (par défaut aucun)
+    Returns:
+        list[Vertice] | None:
+            Sommets du polygone, dans le sens trigonométrique, ou None si l'espace est trop
+            petit (ou plat) pour vertices_count sommets entiers.
+    """
+    origin, opposite = space.vertices[0], space.vertices[2]
+    bounds = math.ceil(origin.x), math.ceil(origin.y), math.floor(opposite.x), math.floor(opposite.y)
+    # Un polygone strictement convexe a au plus deux sommets sur chaque abscisse et chaque ordonnée entières.
+    if vertices_count > 2 * (min(bounds[2] - bounds[0], bounds[3] - bounds[1]) + 1):
+        return None
+
+    rng = np.random.default_rng(rng)
+    for attempt in range(attempts):
+        if attempt or batch is None:
+            batch = generation.random_convex_coordinates(1, vertices_count, rng)[0]
+        hull = convex_hull_points([(vertice.x, vertice.y) for vertice in fit_to_space(batch, space)])
+        if len(hull) >= 3:
+            coordinates = generation.complete_lattice_polygon(hull, vertices_count, bounds, rng)
+            if coordinates is not None:
+                return [Vertice(x, y) for x, y in coordinates.tolist()]
+    return None
+
+
+def convex_hull_points(coordinates):
+    """
+    Retourne l'enveloppe convexe d'un ensemble de points en utilisant la variante
+    de Graham par chaînes monotones (Andrew). Les tournants sont évalués par un
+    prédicat d'orientation robuste.
+
+    Args:
+        coordinates (numpy.ndarray | iterable[tuple(float, float)]):
+            Coordonnées des points. (n, 2)
+    Returns:
+        list[tuple(float, float)]:
+            Sommets de l'enveloppe, parcourus dans le sens trigonométrique à partir
+            du sommet d'ordonnée minimale (puis d'abscisse minimale).
+            Les sommets alignés et les doublons sont retirés.
+    """
+    # Tri lexicographique des points, sans doublons
+    if hasattr(coordinates, 'tolist'):
+        coordinates = coordinates.tolist()
+    points = sorted(set(map(tuple, coordinates)))
+    if len(points) < 3:
+        return points
+
+    def chain(sorted_points):
+        """
+        Construit une chaîne monotone en n'acceptant que des tournants à gauche.
+        """
+        stack = []
+        for point in sorted_points:
+            while len(stack) >= 2 and predicates.orientation(*stack[-2], *stack[-1], *point) <= 0:
+                stack.pop()
+            stack.append(point)
+        return stack
+
+    # Chaînes inférieure et supérieure
+    hull = chain(points)[:-1] + chain(reversed(points))[:-1]
+
+    # Le pivot est le sommet d'ordonnée minimale, puis d'abscisse minimale.
+    pivot = min(range(len(hull)), key=lambda index: (hull[index][1], hull[index][0]))
+    return hull[pivot:] + hull[:pivot]
+
+
+def largest_interior_rectangle_bounds(coordinates):
+    """
+    Retourne les sommets limites du plus grand rectangle inclus dans un polygone.
+
+    Args:
+        coordinates (numpy.ndarray):
+            Sommets du polygone. (n, 2)
+    Returns:
+        tuple(int, int, int, int):
+            Sommets haut gauche (x_min, y_min) et bas droit (x_max, y_max) du rectangle.
+    """
+    # Les sommets sont convertis au format requis par la librairie largestinteriorrectangle,
+    # sans copie s'ils sont déjà entiers 32 bits et contigus.
+    lir_format_polygon = np.ascontiguousarray(coordinates, dtype=np.int32).reshape(1, -1, 2)
+
+    # Le plus grand rectangle intérieur est ensuite calculé.
+    lir_format_rectangle = lir.lir(lir_format_polygon)
+
+    return (*map(int, lir.pt1(lir_format_rectangle)), *map(int, lir.pt2(lir_format_rectangle)))
+
+
+def restore_polygon(cls, coordinates, state):
+    """
+    Reconstruit un polygone sérialisé par Polygon.__reduce__().
+
+    Args:
+        cls (type):
+            Classe du polygone.
+        coordinates (array.array):
+            Coordonnées à plat (x, y, x, y, ...) des sommets.
+        state (dict):
+            Autres attributs du polygone.
+    Returns:
+        Polygon:
+            Polygone reconstruit.
+    """
+    polygon = cls.__new__(cls)
+    polygon.vertices = [Vertice(x, y) for x, y in zip(coordinates[::2], coordinates[1::2])]
+    polygon.__dict__.update(state)
+
+    return polygon
@@ -2,13 +2,16 @@
 Implémentation de l'objet Rectangle dans un espace à 2 dimensions.
 """
 
-import importlib
-
-import numpy as np
-
 from geometry.shapes.polygon import Polygon
+from geometry.utilities import collision, transforms
+from geometry.utilities.lazy import lazy_import
 from geometry.vertice import Vertice
 
+np = lazy_import("numpy")
+
+# Nombre maximal de paires de rectangles testées à la fois par RectangleArray.overlaps()
+OVERLAP_BLOCK_SIZE = 1 << 22
+
 
 class Rectangle(Polygon):
     """
@@ -36,16 +39,11 @@ class Rectangle(Polygon):
             width (float):
                 Largeur du rectangle
         """
-        # Création d'un rectangle, avec les dimensions
-        # données, situé à l'origine
+        # Sommets du rectangle, créés directement au point donné
         vertices = [
-            Vertice(0., 0.),
-            Vertice(x=width),
-            Vertice(width, length),
-            Vertice(y=length),
+            Vertice(top_left.x + dx, top_left.y + dy)
+            for dx, dy in ((0., 0.), (width, 0.), (width, length), (0., length))
         ]
-        # Translation du rectangle au point donné.
-        vertices = [vertice + top_left for vertice in vertices]
 
         super().__init__(vertices)
         self.length = length
@@ -95,6 +93,38 @@ class Rectangle(Polygon):
         """
         return f"Rectangle({repr(self[0])}, {self.length}, {self.width})"
 
+    def transform(self, matrix, inplace=False):
+        """
+        Applique une transformation affine au rectangle.
+        Les translations et les mises à l'échelle de facteurs strictement positifs conservent un
+        rectangle ; les autres transformations retournent un polygone.
+
+        Args:
+            matrix (numpy.ndarray):
+                Matrice de la transformation (voir geometry.utilities.transforms). (2, 3) ou (3, 3)
+            inplace (bool):
+                Si True, les sommets et les dimensions du rectangle sont remplacés. Les collections qui
+                contiennent le rectangle détectent la modification à leur requête suivante. (par défaut à False)
+        Returns:
+            Rectangle | Polygon:
+                Rectangle ou polygone transformé : le rectangle lui-même si inplace.
+        Raises:
+            ValueError:
+                Si la matrice n'est pas une matrice affine unique, ou si une transformation
+                qui ne conserve pas les rectangles est demandée en place.
+        """
+        matrix = transforms.affine_part(matrix)
+        if matrix.ndim == 2 and not transforms.axis_aligned(matrix):
+            if inplace:
+                raise ValueError("Un rectangle ne peut être transformé en place que par une translation "
+                                 "ou une mise à l'échelle de facteurs strictement positifs !")
+            return Polygon(self.vertices).transform(matrix)
+
+        rectangle = super().transform(matrix, inplace)
+        rectangle.width = self.width * float(matrix[0, 0])
+        rectangle.length = self.length * float(matrix[1, 1])
+        return rectangle
+
     def add_vertice(self, vertice, simplify=False):
         raise NotImplemented("Cette méthode n'est pas implémentée pour la classe 'Rectangle'")
 
@@ -120,9 +150,7 @@ class Rectangle(Polygon):
             raise TypeError("space doit être une instance de Rectangle !")
 
         if space is None:
-            # Import dynamique de la classe Rectangle
-            rectangle = importlib.import_module("geometry.shapes.rectangle").Rectangle
-            space = rectangle(
+            space = cls(
                 Vertice(), cls.DEFAULT_RANDOM_SPACE_LENGTH,
                 cls.DEFAULT_RANDOM_SPACE_WIDTH
             )
@@ -141,3 +169,289 @@ class Rectangle(Polygon):
         return Rectangle(
             vertice1, dimensions.y, dimensions.x
         )
+
+
+class RectangleArray:
+    """
+    Classe représentant un ensemble de rectangles alignés sur les axes, stockés dans quatre tableaux contigus.
+    Un rectangle occupe 32 octets, contre plusieurs centaines pour un objet Rectangle et ses quatre sommets.
+
+    Attributes:
+        x (numpy.ndarray):
+            Abscisses des sommets haut gauche (minimales). (N)
+        y (numpy.ndarray):
+            Ordonnées des sommets haut gauche (minimales). (N)
+        widths (numpy.ndarray):
+            Largeurs, selon les abscisses. (N)
+        lengths (numpy.ndarray):
+            Longueurs, selon les ordonnées. (N)
+    """
+
+    def __init__(self, x, y, widths, lengths):
+        """
+        Instancie un ensemble de rectangles.
+
+        Args:
+            x (numpy.ndarray):
+                Abscisses des sommets haut gauche. (N)
+            y (numpy.ndarray):
+                Ordonnées des sommets haut gauche. (N)
+            widths (numpy.ndarray):
+                Largeurs, positives ou nulles. (N)
+            lengths (numpy.ndarray):
+                Longueurs, positives ou nulles. (N)
+        Raises:
+            ValueError:
+                Si les tableaux n'ont pas tous la même forme (N), ou si une dimension est négative.
+        """
+        self.x, self.y, self.widths, self.lengths = (np.asarray(values, dtype=np.float64)
+                                                      for values in (x, y, widths, lengths))
+        if self.x.ndim != 1 or any(values.shape != self.x.shape for values in (self.y, self.widths, self.lengths)):
+            raise ValueError("Les coordonnées et les dimensions doivent former des tableaux de même forme (N) !")
+        if np.any(self.widths < 0) or np.any(self.lengths < 0):
+            raise ValueError("Les dimensions des rectangles doivent être positives !")
+
+    def __len__(self):
+        """
+        Retourne le nombre de rectangles.
+
+        Returns:
+            int:
+                Nombre de rectangles.
+        """
+        return len(self.x)
+
+    def __getitem__(self, item):
+        """
+        Donne accès à un rectangle ou à un sous-ensemble de rectangles.
+
+        Args:
+            item (int | slice | numpy.ndarray):
+                Index, tranche, tableau d'indices ou masque booléen.
+        Returns:
+            Rectangle | RectangleArray:
+                Un rectangle si item est un entier, un sous-ensemble sinon.
+        """
+        if isinstance(item, (int, np.integer)):
+            return Rectangle(Vertice(self.x[item], self.y[item]), float(self.lengths[item]),
+                             float(self.widths[item]))
+        return RectangleArray(self.x[item], self.y[item], self.widths[item], self.lengths[item])
+
+    def __repr__(self):
+        """
+        Retourne une chaîne de caractère formelle représentant l'ensemble de rectangles.
+
+        Returns:
+            str:
+                Chaîne de caractères formelle représentant l'ensemble de rectangles.
+        """
+        return f"RectangleArray({self.x.tolist()}, {self.y.tolist()}, {self.widths.tolist()}, {self.lengths.tolist()})"
+
+    def bounds(self):
+        """
+        Retourne les boîtes des rectangles.
+
+        Returns:
+            numpy.ndarray:
+                Boîtes (x_min, y_min, x_max, y_max). (N, 4)
+        """
+        return np.stack([self.x, self.y, self.x + self.widths, self.y + self.lengths], axis=1)
+
+    def areas(self):
+        """
+        Retourne les aires des rectangles.
+
+        Returns:
+            numpy.ndarray:
+                Aires. (N)
+        """
+        return self.widths * self.lengths
+
+    def contains(self, points, block_size=None):
+        """
+        Vérifie quels rectangles contiennent quels points, bords compris.
+        Avec block_size, seules les paires (rectangle, point) trouvées sont retournées : elles sont
+        cherchées par blocs d'au plus block_size paires, pour borner la mémoire utilisée.
+
+        Args:
+            points (numpy.ndarray):
+                Points. (P, 2)
+            block_size (int):
+                Nombre maximal de paires testées à la fois. (par défaut aucun : matrice complète)
+        Returns:
+            numpy.ndarray:
+                Matrice booléenne (N, P), vraie si le rectangle i contient le point j ;
+                avec block_size, paires d'indices (i, j), triées. (K, 2)
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if block_size is None:
+            return contains(self.bounds(), points)
+
+        bounds = self.bounds()
+        rows = max(1, block_size // max(len(points), 1))
+        pairs = [np.empty((0, 2), dtype=np.int64)]
+        for start in range(0, len(self), rows):
+            first, second = np.nonzero(contains(bounds[start:start + rows], points))
+            pairs.append(np.stack([first + start, second], axis=1).astype(np.int64))
+        return np.concatenate(pairs)
+
+    def intersection_areas(self, other, block_size=None):
+        """
+        Retourne les aires des intersections de chaque rectangle avec chaque rectangle d'un autre ensemble.
+        Avec block_size, seules les paires d'intersection d'aire non nulle sont retournées (voir overlaps()).
+
+        Args:
+            other (RectangleArray):
+                Autre ensemble de M rectangles.
+            block_size (int):
+                Nombre maximal de paires testées à la fois. (par défaut aucun : matrice complète)
+        Returns:
+            numpy.ndarray | tuple(numpy.ndarray, numpy.ndarray):
+                Matrice (N, M) des aires d'intersection, nulles pour les rectangles disjoints ;
+                avec block_size, paires d'indices (i, j) triées (K, 2) et leurs aires (K).
+        Raises:
+            TypeError:
+                Si other n'est pas un ensemble de rectangles.
+        """
+        if not isinstance(other, RectangleArray):
+            raise TypeError(f"Opération non autorisée entre RectangleArray et {type(other)} !")
+
+        if block_size is not None:
+            return self.overlaps(other, block_size)
+        return intersection_areas(self.bounds(), other.bounds())
+
+    def overlaps(self, other=None, block_size=OVERLAP_BLOCK_SIZE):
+        """
+        Retourne les paires de rectangles dont l'intersection est d'aire non nulle, et ces aires.
+        Les paires d'un même ensemble sont trouvées par balayage et élagage (collision.sweep_and_prune()) ;
+        celles de deux ensembles par blocs d'au plus block_size paires, pour borner la mémoire utilisée.
+
+        Args:
+            other (RectangleArray):
+                Autre ensemble de rectangles. (par défaut, les paires (i, j) avec i < j
+                de l'ensemble lui-même)
+            block_size (int):
+                Nombre maximal de paires testées à la fois. (par défaut à OVERLAP_BLOCK_SIZE)
+        Returns:
+            tuple(numpy.ndarray, numpy.ndarray):
+                Paires d'indices (i, j), triées (K, 2), et aire de l'intersection de chaque paire (K).
+        Raises:
+            TypeError:
+                Si other n'est pas un ensemble de rectangles.
+        """
+        bounds = self.bounds()
+        if other is None:
+            pairs = collision.sweep_and_prune(bounds)
+            areas = intersection_areas(bounds[pairs[:, 0]], bounds[pairs[:, 1]], pairwise=False)
+            positive = areas > 0
+            return pairs[positive], areas[positive]
+
+        if not isinstance(other, RectangleArray):
+            raise TypeError(f"Opération non autorisée entre RectangleArray et {type(other)} !")
+
+        other_bounds = other.bounds()
+        rows = max(1, block_size // max(len(other), 1))
+        pairs, areas = [np.empty((0, 2), dtype=np.int64)], [np.empty(0)]
+        for start in range(0, len(self), rows):
+            block_areas = intersection_areas(bounds[start:start + rows], other_bounds)
+            first, second = np.nonzero(block_areas > 0)
+            pairs.append(np.stack([first + start, second], axis=1).astype(np.int64))
+            areas.append(block_areas[first, second])
+        return np.concatenate(pairs), np.concatenate(areas)
+
+    def to_collection(self):
+        """
+        Crée une collection de rectangles à partir de l'ensemble, sans créer ses polygones.
+
+        Returns:
+            Collection:
+                Nouvelle collection construite à partir de tampons, dont les polygones
+                sont recréés sous forme de rectangles.
+        """
+        # Import local : le module collection importe lui-même ce module.
+        from geometry.collection import Collection
+
+        corners = np.array([[0., 0.], [1., 0.], [1., 1.], [0., 1.]])
+        coordinates = (np.stack([self.x, self.y], axis=1)[:, None, :]
+                       + np.stack([self.widths, self.lengths], axis=1)[:, None, :] * corners).reshape(-1, 2)
+        offsets = np.arange(0, 4 * len(self) + 1, 4, dtype=np.int64)
+        rectangles = (np.arange(len(self), dtype=np.int64), np.stack([self.lengths, self.widths], axis=1))
+        return Collection.from_buffers(coordinates, offsets, rectangles)
+
+    @classmethod
+    def from_collection(cls, collection):
+        """
+        Crée un ensemble de rectangles à partir d'une collection qui ne contient que des rectangles.
+
+        Args:
+            collection (Collection):
+                Collection de rectangles.
+        Returns:
+            RectangleArray:
+                Nouvel ensemble de rectangles.
+        Raises:
+            ValueError:
+                Si la collection contient d'autres polygones que des rectangles.
+        """
+        indices, dimensions = collection.rectangle_table()
+        if len(indices) != len(collection):
+            raise ValueError("La collection ne doit contenir que des rectangles !")
+
+        coordinates, offsets = collection.buffers()
+        top_lefts = coordinates[offsets[:-1]]
+        return cls(top_lefts[:, 0], top_lefts[:, 1], dimensions[:, 1], dimensions[:, 0])
+
+    @classmethod
+    def from_bounds(cls, bounds):
+        """
+        Crée un ensemble de rectangles à partir de boîtes.
+
+        Args:
+            bounds (numpy.ndarray):
+                Boîtes (x_min, y_min, x_max, y_max). (N, 4)
+        Returns:
+            RectangleArray:
+                Nouvel ensemble de rectangles.
+        """
+        bounds = np.asarray(bounds, dtype=np.float64).reshape(-1, 4)
+        return cls(bounds[:, 0], bounds[:, 1], bounds[:, 2] - bounds[:, 0], bounds[:, 3] - bounds[:, 1])
+
+
+def contains(bounds, points):
+    """
+    Vérifie quelles boîtes contiennent quels points, bords compris.
+
+    Args:
+        bounds (numpy.ndarray):
+            Boîtes (x_min, y_min, x_max, y_max). (N, 4)
+        points (numpy.ndarray):
+            Points. (P, 2)
+    Returns:
+        numpy.ndarray:
+            Matrice booléenne (N, P), vraie si la boîte i contient le point j.
+    """
+    return ((points[None, :, 0] >= bounds[:, None, 0]) & (points[None, :, 0] <= bounds[:, None, 2])
+            & (points[None, :, 1] >= bounds[:, None, 1]) & (points[None, :, 1] <= bounds[:, None, 3]))
+
+
+def intersection_areas(first, second, pairwise=True):
+    """
+    Calcule les aires des intersections de boîtes.
+
+    Args:
+        first (numpy.ndarray):
+            Boîtes (x_min, y_min, x_max, y_max). (N, 4)
+        second (numpy.ndarray):
+            Boîtes (x_min, y_min, x_max, y_max). (M, 4)
+        pairwise (bool):
+            Si True, chaque boîte de first est intersectée avec chaque boîte de second ;
+            sinon, les boîtes de même indice sont intersectées (M = N). (par défaut à True)
+    Returns:
+        numpy.ndarray:
+            Aires des intersections, nulles pour les boîtes disjointes. (N, M) ou (N)
+    """
+    if pairwise:
+        first, second = first[:, None, :], second[None, :, :]
+    widths = np.minimum(first[..., 2], second[..., 2]) - np.maximum(first[..., 0], second[..., 0])
+    lengths = np.minimum(first[..., 3], second[..., 3]) - np.maximum(first[..., 1], second[..., 1])
+    return np.maximum(widths, 0) * np.maximum(lengths, 0)
@@ -0,0 +1,226 @@
+"""
+Implémentation d'une collection de polygones en mémoire partagée.
+
+Les tampons de coordonnées d'une SharedCollection résident dans un bloc
+multiprocessing.shared_memory. Transmettre la collection à un autre processus
+ne transmet que le nom du bloc : le processus destinataire s'y attache sans
+copier les coordonnées.
+"""
+
+from multiprocessing import shared_memory
+
+from geometry.collection import Collection
+from geometry.utilities.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+class SharedCollection(Collection):
+    """
+    Classe représentant une collection de polygones dont les tampons de
+    coordonnées résident en mémoire partagée.
+
+    Le bloc contient, dans l'ordre : les coordonnées des sommets, les indices
+    de début des polygones, les indices puis les dimensions des rectangles.
+    Les modifications de la collection (ajout de polygones, ...) ne sont pas
+    partagées : elles recréent des tampons propres au processus.
+
+    Attributes:
+        name (str): Nom du bloc de mémoire partagée.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Interdit l'instanciation directe.
+
+        Raises:
+            TypeError:
+                Toujours : utiliser create() ou attach().
+        """
+        raise TypeError("Utiliser SharedCollection.create() ou SharedCollection.attach() !")
+
+    def __reduce__(self):
+        """
+        Sérialise la collection sous la forme du nom de son bloc et de ses dimensions,
+        tant que ses tampons sont ceux du bloc. Une collection modifiée (ou détachée)
+        depuis, y compris par une modification de ses polygones, est sérialisée comme
+        une Collection, avec son propre contenu.
+
+        Returns:
+            tuple:
+                Fonction de reconstruction et ses arguments.
+        """
+        # Les tampons en cache sont remplacés si des polygones ont été modifiés.
+        self._refresh()
+        buffers = self._cache.get('buffers')
+        if buffers is None or buffers is not self._shared_buffers:
+            return self._reduce(Collection)
+        return type(self).attach, (self.name, *self._counts)
+
+    def __enter__(self):
+        """
+        Utilise la collection comme gestionnaire de contexte.
+
+        Returns:
+            SharedCollection:
+                La collection elle-même.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Détache la collection du bloc, et libère le bloc si la collection l'a créé.
+        """
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    @property
+    def name(self):
+        """
+        Nom du bloc de mémoire partagée.
+
+        Returns:
+            str:
+                Nom du bloc.
+        """
+        return self._memory.name
+
+    @staticmethod
+    def _layout(vertices_count, polygons_count, rectangles_count):
+        """
+        Retourne la position des tampons dans le bloc.
+
+        Args:
+            vertices_count (int):
+                Nombre de sommets.
+            polygons_count (int):
+                Nombre de polygones.
+            rectangles_count (int):
+                Nombre de rectangles.
+        Returns:
+            tuple(list[tuple(str, numpy.dtype, tuple, int)], int):
+                Nom, type, forme et position en octets de chaque tampon,
+                et taille totale du bloc.
+        """
+        buffers = [
+            ('coordinates', np.float64, (vertices_count, 2)),
+            ('offsets', np.int64, (polygons_count + 1,)),
+            ('rectangle_indices', np.int64, (rectangles_count,)),
+            ('rectangle_dimensions', np.float64, (rectangles_count, 2)),
+        ]
+
+        layout = []
+        position = 0
+        for name, dtype, shape in buffers:
+            layout.append((name, dtype, shape, position))
+            position += int(np.prod(shape)) * np.dtype(dtype).itemsize
+
+        return layout, position
+
+    @classmethod
+    def _from_memory(cls, memory, counts, owner):
+        """
+        Crée une collection dont les tampons sont des vues sur un bloc de mémoire partagée.
+
+        Args:
+            memory (multiprocessing.shared_memory.SharedMemory):
+                Bloc de mémoire partagée.
+            counts (tuple(int, int, int)):
+                Nombres de sommets, de polygones et de rectangles.
+            owner (bool):
+                True si la collection a créé le bloc.
+        Returns:
+            SharedCollection:
+                Nouvelle collection.
+        """
+        layout, _ = cls._layout(*counts)
+        views = {
+            name: np.ndarray(shape, dtype=dtype, buffer=memory.buf, offset=position)
+            for name, dtype, shape, position in layout
+        }
+
+        collection = cls.__new__(cls)
+        collection._memory = memory
+        collection._counts = tuple(counts)
+        collection._owner = owner
+        collection._polygons = None
+        collection._shared_buffers = (views['coordinates'], views['offsets'])
+        collection._cache = {
+            'buffers': collection._shared_buffers,
+            'rectangles': (views['rectangle_indices'], views['rectangle_dimensions']),
+        }
+        return collection
+
+    @classmethod
+    def create(cls, collection):
+        """
+        Copie une collection dans un nouveau bloc de mémoire partagée.
+        Le bloc doit être libéré avec unlink() (ou en utilisant la collection
+        comme gestionnaire de contexte).
+
+        Args:
+            collection (Collection):
+                Collection à partager.
+        Returns:
+            SharedCollection:
+                Nouvelle collection partagée.
+        """
+        coordinates, offsets = collection.buffers()
+        rectangle_indices, rectangle_dimensions = collection.rectangle_table()
+        counts = (len(coordinates), len(offsets) - 1, len(rectangle_indices))
+
+        _, size = cls._layout(*counts)
+        memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+
+        shared = cls._from_memory(memory, counts, owner=True)
+        shared_coordinates, shared_offsets = shared._cache['buffers']
+        shared_coordinates[...] = coordinates
+        shared_offsets[...] = offsets
+        shared_rectangle_indices, shared_rectangle_dimensions = shared._cache['rectangles']
+        shared_rectangle_indices[...] = rectangle_indices
+        shared_rectangle_dimensions[...] = rectangle_dimensions
+
+        return shared
+
+    @classmethod
+    def attach(cls, name, vertices_count, polygons_count, rectangles_count):
+        """
+        S'attache, sans copie, à un bloc de mémoire partagée créé par create().
+
+        Args:
+            name (str):
+                Nom du bloc.
+            vertices_count (int):
+                Nombre de sommets.
+            polygons_count (int):
+                Nombre de polygones.
+            rectangles_count (int):
+                Nombre de rectangles.
+        Returns:
+            SharedCollection:
+                Collection attachée au bloc.
+        """
+        memory = shared_memory.SharedMemory(name=name)
+        return cls._from_memory(memory, (vertices_count, polygons_count, rectangles_count), owner=False)
+
+    def close(self):
+        """
+        Détache la collection du bloc de mémoire partagée. Les polygones déjà
+        créés restent utilisables, mais plus les tampons ; une collection dont
+        les polygones n'ont pas été créés devient vide.
+        Attention ! Aucune référence aux tableaux retournés par buffers()
+        ne doit subsister.
+        """
+        if self._polygons is None:
+            self._polygons = []
+        self._cache.clear()
+        self._shared_buffers = None
+        self._memory.close()
+
+    def unlink(self):
+        """
+        Libère le bloc de mémoire partagée. À n'appeler qu'une seule fois, depuis le
+        processus qui a créé la collection.
+        """
+        self._memory.unlink()
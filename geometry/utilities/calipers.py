@@ -0,0 +1,153 @@
+"""
+Implémentation des pieds à coulisse tournants (rotating calipers).
+
+Les fonctions de ce module opèrent sur une enveloppe convexe déjà construite :
+sommets distincts, sans sommets alignés, parcourus dans le sens
+trigonométrique (voir Polygon.convex_hull()). Chaque calcul avance un nombre
+borné de pointeurs autour de l'enveloppe et s'exécute donc en temps linéaire.
+"""
+
+from math import hypot
+
+from geometry.utilities.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+def antipodal_pairs(hull):
+    """
+    Parcourt les paires de sommets antipodaux de l'enveloppe convexe.
+    Chaque arête est associée au sommet le plus éloigné de sa droite support.
+
+    Args:
+        hull (numpy.ndarray | list[tuple(float, float)]):
+            Sommets de l'enveloppe convexe. (h, 2) (h ≥ 1)
+    Yields:
+        tuple(int, int):
+            Indice du premier sommet d'une arête et indice du sommet qui en est le plus éloigné.
+    """
+    points = hull.tolist() if hasattr(hull, 'tolist') else list(hull)
+    count = len(points)
+    if count < 3:
+        yield from ((index, (index + 1) % count) for index in range(count))
+        return
+
+    def twice_area(first, second, third):
+        (ax, ay), (bx, by), (cx, cy) = points[first], points[second], points[third]
+        return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+    farthest = 1
+    for index in range(count):
+        following = (index + 1) % count
+        # Le sommet le plus éloigné ne fait que tourner dans le même sens que l'arête.
+        while twice_area(index, following, (farthest + 1) % count) > twice_area(index, following, farthest):
+            farthest = (farthest + 1) % count
+        yield index, farthest
+
+
+def diameter(hull):
+    """
+    Retourne le diamètre de l'enveloppe convexe : la plus grande distance entre deux de ses sommets.
+
+    Args:
+        hull (numpy.ndarray | list[tuple(float, float)]):
+            Sommets de l'enveloppe convexe. (h, 2) (h ≥ 1)
+    Returns:
+        float:
+            Diamètre de l'enveloppe.
+    """
+    points = hull.tolist() if hasattr(hull, 'tolist') else list(hull)
+    count = len(points)
+
+    best = 0.
+    for index, farthest in antipodal_pairs(points):
+        # Le diamètre est atteint entre un sommet antipodal et l'une des extrémités de l'arête.
+        for other in (index, (index + 1) % count):
+            best = max(best, hypot(points[farthest][0] - points[other][0], points[farthest][1] - points[other][1]))
+
+    return best
+
+
+def width(hull):
+    """
+    Retourne la largeur de l'enveloppe convexe : la plus petite distance entre deux droites
+    parallèles qui l'encadrent.
+
+    Args:
+        hull (numpy.ndarray | list[tuple(float, float)]):
+            Sommets de l'enveloppe convexe. (h, 2) (h ≥ 1)
+    Returns:
+        float:
+            Largeur de l'enveloppe, nulle si elle a moins de trois sommets.
+    """
+    points = hull.tolist() if hasattr(hull, 'tolist') else list(hull)
+    count = len(points)
+    if count < 3:
+        return 0.
+
+    best = float('inf')
+    for index, farthest in antipodal_pairs(points):
+        (ax, ay), (bx, by) = points[index], points[(index + 1) % count]
+        cx, cy = points[farthest]
+        # La largeur minimale est atteinte avec l'une des droites portée par une arête.
+        best = min(best, ((bx - ax) * (cy - ay) - (by - ay) * (cx - ax)) / hypot(bx - ax, by - ay))
+
+    return best
+
+
+def min_area_rect(hull):
+    """
+    Retourne le rectangle orienté d'aire minimale contenant l'enveloppe convexe.
+    L'un de ses côtés porte nécessairement une arête de l'enveloppe : quatre pointeurs
+    (arête courante, sommets extrêmes à droite, en haut et à gauche) tournent ensemble.
+
+    Args:
+        hull (numpy.ndarray | list[tuple(float, float)]):
+            Sommets de l'enveloppe convexe. (h, 2) (h ≥ 1)
+    Returns:
+        numpy.ndarray:
+            Sommets du rectangle, dans le sens trigonométrique. (4, 2)
+    """
+    points = hull.tolist() if hasattr(hull, 'tolist') else list(hull)
+    count = len(points)
+    if count == 1:
+        return np.array(points * 4, dtype=np.float64)
+
+    def projection(index, direction):
+        return points[index][0] * direction[0] + points[index][1] * direction[1]
+
+    def advance(pointer, direction, sense):
+        # La projection sur une direction est unimodale le long de l'enveloppe.
+        while sense * projection((pointer + 1) % count, direction) > sense * projection(pointer, direction):
+            pointer = (pointer + 1) % count
+        return pointer
+
+    best_area, best_rectangle = float('inf'), None
+    right = top = left = None
+    for index in range(count):
+        (ax, ay), (bx, by) = points[index], points[(index + 1) % count]
+        length = hypot(bx - ax, by - ay)
+        along = ((bx - ax) / length, (by - ay) / length)
+        normal = (-along[1], along[0])
+
+        if right is None:
+            right = advance((index + 1) % count, along, 1)
+            top = advance(right, normal, 1)
+            left = advance(top, along, -1)
+        else:
+            right = advance(right, along, 1)
+            top = advance(top, normal, 1)
+            left = advance(left, along, -1)
+
+        start, stop = projection(left, along), projection(right, along)
+        bottom, height = projection(index, normal), projection(top, normal)
+
+        area = (stop - start) * (height - bottom)
+        if area < best_area:
+            best_area = area
+            best_rectangle = [
+                (offset * along[0] + level * normal[0], offset * along[1] + level * normal[1])
+                for offset, level in ((start, bottom), (stop, bottom), (stop, height), (start, height))
+            ]
+
+    return np.array(best_rectangle, dtype=np.float64)
@@ -0,0 +1,110 @@
+"""
+Implémentation du découpage de polygones par une fenêtre rectangulaire (Sutherland-Hodgman).
+
+Le polygone est découpé successivement par les quatre demi-plans de la fenêtre.
+Le résultat est exact pour les polygones convexes ; un polygone concave dont
+plusieurs parties restent dans la fenêtre est découpé en un seul polygone dont
+les parties sont reliées par des arêtes confondues avec les bords de la fenêtre.
+"""
+
+from geometry.utilities.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+def clip_half_plane(coordinates, axis, limit, keep_greater):
+    """
+    Découpe un polygone par un demi-plan parallèle à un axe.
+
+    Args:
+        coordinates (numpy.ndarray):
+            Sommets du polygone. (n, 2)
+        axis (int):
+            0 pour une limite sur les abscisses, 1 pour une limite sur les ordonnées.
+        limit (float):
+            Coordonnée de la droite limite.
+        keep_greater (bool):
+            True pour conserver le demi-plan des coordonnées supérieures ou égales à la limite.
+    Returns:
+        numpy.ndarray:
+            Sommets du polygone découpé. (m, 2)
+    """
+    if len(coordinates) == 0:
+        return coordinates
+
+    following = np.roll(coordinates, -1, axis=0)
+    inside = coordinates[:, axis] >= limit if keep_greater else coordinates[:, axis] <= limit
+    crossing = inside != np.roll(inside, -1)
+
+    # Intersection de chaque arête traversante avec la droite limite
+    delta = following[:, axis] - coordinates[:, axis]
+    ratios = np.divide(limit - coordinates[:, axis], delta, out=np.zeros(len(delta)), where=crossing)
+    intersections = coordinates + ratios[:, None] * (following - coordinates)
+    intersections[:, axis] = limit
+
+    # Chaque arête produit son origine si elle est intérieure, puis son intersection si elle traverse.
+    candidates = np.stack([coordinates, intersections], axis=1)
+    return candidates[np.stack([inside, crossing], axis=1)]
+
+
+def clip_to_rectangle(coordinates, bounds):
+    """
+    Découpe un polygone par une fenêtre rectangulaire.
+
+    Args:
+        coordinates (numpy.ndarray):
+            Sommets du polygone. (n, 2)
+        bounds (tuple(float, float, float, float)):
+            Fenêtre (x_min, y_min, x_max, y_max).
+    Returns:
+        numpy.ndarray:
+            Sommets du polygone découpé, vide si le polygone est hors de la fenêtre. (m, 2)
+    """
+    x_min, y_min, x_max, y_max = bounds
+    clipped = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+    for axis, limit, keep_greater in ((0, x_min, True), (0, x_max, False), (1, y_min, True), (1, y_max, False)):
+        clipped = clip_half_plane(clipped, axis, limit, keep_greater)
+    return clipped
+
+
+def clip_buffers(coordinates, offsets, bounds):
+    """
+    Découpe des polygones par une fenêtre rectangulaire. Les polygones réduits
+    à moins de trois sommets sont retirés.
+
+    Args:
+        coordinates (numpy.ndarray):
+            Coordonnées des sommets. (V, 2)
+        offsets (numpy.ndarray):
+            Indices de début de chaque polygone, suivis de V. (N + 1)
+        bounds (tuple(float, float, float, float)):
+            Fenêtre (x_min, y_min, x_max, y_max).
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray):
+            Coordonnées des sommets découpés (V', 2), indices de début des polygones conservés (K + 1),
+            et indices d'origine des polygones conservés. (K)
+    """
+    x_min, y_min, x_max, y_max = bounds
+    clipped, kept = [], []
+    for index, (start, stop) in enumerate(zip(offsets[:-1].tolist(), offsets[1:].tolist())):
+        polygon = coordinates[start:stop]
+        if len(polygon) == 0:
+            continue
+
+        # Les polygones entièrement intérieurs ou extérieurs ne sont pas découpés.
+        lower, upper = polygon.min(axis=0), polygon.max(axis=0)
+        if upper[0] < x_min or lower[0] > x_max or upper[1] < y_min or lower[1] > y_max:
+            continue
+        if lower[0] >= x_min and upper[0] <= x_max and lower[1] >= y_min and upper[1] <= y_max:
+            result = polygon
+        else:
+            result = clip_to_rectangle(polygon, bounds)
+
+        if len(result) >= 3:
+            clipped.append(result)
+            kept.append(index)
+
+    new_offsets = np.zeros(len(clipped) + 1, dtype=np.int64)
+    np.cumsum([len(polygon) for polygon in clipped], out=new_offsets[1:])
+    new_coordinates = np.concatenate(clipped) if clipped else np.empty((0, 2))
+    return new_coordinates, new_offsets, np.array(kept, dtype=np.int64)
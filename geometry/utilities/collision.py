@@ -0,0 +1,409 @@
+"""
+Implémentation des noyaux vectorisés de détection de collisions.
+
+Les polygones y sont manipulés sous forme de tableaux de coordonnées
+de forme (n, 2).
+"""
+
+from geometry.utilities import predicates
+from geometry.utilities.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# Nombre maximal de paires candidates traitées à la fois par le balayage.
+SWEEP_CHUNK_SIZE = 1 << 20
+
+# Nombre de points localisés à la fois par la jointure spatiale.
+LOCATE_CHUNK_SIZE = 1 << 16
+
+# Nombre maximal de couples (paire candidate, arête) testés à la fois par la jointure spatiale.
+LOCATE_EDGES_CHUNK_SIZE = 1 << 20
+
+
+def segments_intersect(p1, p2, q1, q2):
+    """
+    Vérifie, élément par élément, si les segments [p1, p2] et [q1, q2] se coupent.
+    Les segments qui se touchent ou se chevauchent sont considérés comme sécants.
+    Les orientations sont évaluées par des prédicats robustes.
+
+    Args:
+        p1, p2 (numpy.ndarray):
+            Extrémités des premiers segments. (..., 2)
+        q1, q2 (numpy.ndarray):
+            Extrémités des seconds segments. (..., 2)
+    Returns:
+        numpy.ndarray:
+            Masque booléen diffusé selon les règles de NumPy.
+    """
+    p1, p2, q1, q2 = np.broadcast_arrays(p1, p2, q1, q2)
+    d1 = predicates.orientations(q1, q2, p1)
+    d2 = predicates.orientations(q1, q2, p2)
+    d3 = predicates.orientations(p1, p2, q1)
+    d4 = predicates.orientations(p1, p2, q2)
+
+    # Cas général : chaque segment sépare les extrémités de l'autre.
+    result = (d1 * d2 < 0) & (d3 * d4 < 0)
+
+    # Cas dégénérés : une extrémité alignée se trouve sur l'autre segment.
+    def on_segment(origins, ends, vertices):
+        return ((np.minimum(origins[..., 0], ends[..., 0]) <= vertices[..., 0])
+                & (vertices[..., 0] <= np.maximum(origins[..., 0], ends[..., 0]))
+                & (np.minimum(origins[..., 1], ends[..., 1]) <= vertices[..., 1])
+                & (vertices[..., 1] <= np.maximum(origins[..., 1], ends[..., 1])))
+
+    result |= (d1 == 0) & on_segment(q1, q2, p1)
+    result |= (d2 == 0) & on_segment(q1, q2, p2)
+    result |= (d3 == 0) & on_segment(p1, p2, q1)
+    result |= (d4 == 0) & on_segment(p1, p2, q2)
+
+    return result
+
+
+def points_in_polygon(points, polygon):
+    """
+    Vérifie quels points sont strictement à l'intérieur d'un polygone
+    (règle pair-impair).
+
+    Args:
+        points (numpy.ndarray):
+            Points à tester. (p, 2)
+        polygon (numpy.ndarray):
+            Sommets du polygone. (n, 2)
+    Returns:
+        numpy.ndarray:
+            Masque booléen de taille p.
+    """
+    points, polygon = predicates.widen(points), predicates.widen(polygon)
+    x = points[:, 0:1]
+    y = points[:, 1:2]
+    x0, y0 = polygon[:, 0], polygon[:, 1]
+    x1, y1 = np.roll(x0, -1), np.roll(y0, -1)
+
+    # Arêtes traversées par la demi-droite horizontale issue de chaque point.
+    crossing = (y0 > y) != (y1 > y)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_intersection = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+
+    return np.count_nonzero(crossing & (x < x_intersection), axis=1) % 2 == 1
+
+
+def convex_polygons_overlap(polygon1, polygon2):
+    """
+    Vérifie si deux polygones convexes se chevauchent à l'aide du théorème
+    des axes séparateurs.
+
+    Args:
+        polygon1 (numpy.ndarray):
+            Sommets du premier polygone convexe. (n, 2)
+        polygon2 (numpy.ndarray):
+            Sommets du second polygone convexe. (m, 2)
+    Returns:
+        bool:
+            True si les polygones se chevauchent ou se touchent, False sinon.
+    """
+    # Coordonnées entières : les projections sont exactes en int64.
+    polygon1, polygon2 = predicates.widen(polygon1), predicates.widen(polygon2)
+    edges = np.concatenate([np.roll(polygon1, -1, axis=0) - polygon1,
+                            np.roll(polygon2, -1, axis=0) - polygon2])
+    # Normales des arêtes des deux polygones
+    axes = np.stack([-edges[:, 1], edges[:, 0]], axis=1)
+
+    projections1 = polygon1 @ axes.T
+    projections2 = polygon2 @ axes.T
+
+    separated = ((projections1.max(axis=0) < projections2.min(axis=0))
+                 | (projections2.max(axis=0) < projections1.min(axis=0)))
+
+    return not separated.any()
+
+
+def polygons_overlap(polygon1, polygon2):
+    """
+    Vérifie si deux polygones quelconques se chevauchent : soit deux de leurs
+    arêtes se coupent, soit l'un des polygones contient l'autre.
+
+    Args:
+        polygon1 (numpy.ndarray):
+            Sommets du premier polygone. (n, 2)
+        polygon2 (numpy.ndarray):
+            Sommets du second polygone. (m, 2)
+    Returns:
+        bool:
+            True si les polygones se chevauchent ou se touchent, False sinon.
+    """
+    # Arêtes de chaque polygone, diffusées en (n, 1) contre (1, m).
+    p1 = polygon1[:, None, :]
+    p2 = np.roll(polygon1, -1, axis=0)[:, None, :]
+    q1 = polygon2[None, :, :]
+    q2 = np.roll(polygon2, -1, axis=0)[None, :, :]
+
+    if segments_intersect(p1, p2, q1, q2).any():
+        return True
+
+    # Aucune arête ne se coupe : les polygones sont disjoints ou imbriqués.
+    return bool(points_in_polygon(polygon1[:1], polygon2)[0]
+                or points_in_polygon(polygon2[:1], polygon1)[0])
+
+
+def convex_mask(coordinates, offsets):
+    """
+    Vérifie quels polygones d'un ensemble de tampons sont convexes.
+    Un polygone est convexe si tous ses tournants sont de même signe
+    et qu'il ne fait qu'un seul tour sur lui-même.
+
+    Args:
+        coordinates (numpy.ndarray):
+            Coordonnées contiguës des sommets. (V, 2)
+        offsets (numpy.ndarray):
+            Indices de début de chaque polygone, suivis du nombre total de sommets. (N + 1)
+    Returns:
+        numpy.ndarray:
+            Masque booléen de taille N.
+    """
+    coordinates = predicates.widen(coordinates)
+    counts = np.diff(offsets)
+    mask = np.ones(len(counts), dtype=bool)
+    if len(coordinates) == 0:
+        return mask
+
+    # Indices locaux du sommet suivant et du sommet d'après, par polygone.
+    owners = np.repeat(np.arange(len(counts)), counts)
+    local = np.arange(len(coordinates)) - offsets[owners]
+    following = offsets[owners] + (local + 1) % counts[owners]
+    after = offsets[owners] + (local + 2) % counts[owners]
+
+    turns = predicates.orientations(coordinates, coordinates[following], coordinates[after])
+    edges = coordinates[following] - coordinates
+    next_edges = coordinates[after] - coordinates[following]
+    products = edges[:, 0] * next_edges[:, 1] - edges[:, 1] * next_edges[:, 0]
+    dots = (edges * next_edges).sum(axis=1)
+
+    positives = np.bincount(owners, weights=turns > 0, minlength=len(counts))
+    negatives = np.bincount(owners, weights=turns < 0, minlength=len(counts))
+    turning = np.bincount(owners, weights=np.arctan2(products, dots), minlength=len(counts))
+
+    mask &= (positives == 0) | (negatives == 0)
+    mask &= np.abs(turning) < 3 * np.pi
+    return mask | (counts < 4)
+
+
+def sweep_and_prune_chunks(bounds, chunk_size=SWEEP_CHUNK_SIZE):
+    """
+    Produit, paquet par paquet, les paires de boîtes englobantes qui se chevauchent
+    par balayage et élagage selon l'axe des abscisses. Chaque paquet examine au plus
+    chunk_size paires candidates (une boîte et ses suivantes) : la mémoire de travail
+    ne dépend pas du nombre total de paires.
+
+    Args:
+        bounds (numpy.ndarray):
+            Boîtes englobantes (x_min, y_min, x_max, y_max). (N, 4)
+        chunk_size (int):
+            Nombre maximal de paires candidates par paquet. (par défaut à SWEEP_CHUNK_SIZE)
+    Yields:
+        numpy.ndarray:
+            Paires d'indices (i, j) avec i < j d'un paquet, dans l'ordre du balayage. (K, 2)
+    """
+    count = len(bounds)
+    order = np.argsort(bounds[:, 0], kind='stable')
+    sorted_bounds = bounds[order]
+
+    # Les boîtes suivant la boîte i dans l'ordre du balayage et débutant
+    # avant sa fin sont ses candidates.
+    ends = np.searchsorted(sorted_bounds[:, 0], sorted_bounds[:, 2], side='right')
+    firsts = np.arange(1, count + 1)
+    counts = np.maximum(ends - firsts, 0)
+    cumulated = np.cumsum(counts)
+
+    start = 0
+    while start < count:
+        done = cumulated[start - 1] if start else 0
+        stop = max(int(np.searchsorted(cumulated, done + chunk_size, side='right')), start + 1)
+
+        chunk_counts = counts[start:stop]
+        total = int(chunk_counts.sum())
+        if total:
+            first = np.repeat(np.arange(start, stop), chunk_counts)
+            second = (np.arange(total) - np.repeat(np.cumsum(chunk_counts) - chunk_counts, chunk_counts)
+                      + np.repeat(firsts[start:stop], chunk_counts))
+
+            keep = ((sorted_bounds[first, 1] <= sorted_bounds[second, 3])
+                    & (sorted_bounds[second, 1] <= sorted_bounds[first, 3]))
+            yield np.sort(np.stack([order[first[keep]], order[second[keep]]], axis=1), axis=1).astype(np.int64)
+        start = stop
+
+
+def sweep_and_prune(bounds, chunk_size=SWEEP_CHUNK_SIZE):
+    """
+    Retourne les paires de boîtes englobantes qui se chevauchent
+    par balayage et élagage selon l'axe des abscisses (voir sweep_and_prune_chunks()).
+    Le résultat occupe O(K) mémoire : pour de très nombreuses paires, utiliser
+    directement sweep_and_prune_chunks().
+
+    Args:
+        bounds (numpy.ndarray):
+            Boîtes englobantes (x_min, y_min, x_max, y_max). (N, 4)
+        chunk_size (int):
+            Nombre maximal de paires candidates par paquet. (par défaut à SWEEP_CHUNK_SIZE)
+    Returns:
+        numpy.ndarray:
+            Paires d'indices (i, j) avec i < j, triées. (K, 2)
+    """
+    pairs = list(sweep_and_prune_chunks(bounds, chunk_size))
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+
+    pairs = np.concatenate(pairs)
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+def grid_index(bounds, cell_size):
+    """
+    Indexe des boîtes englobantes dans une grille uniforme : chaque cellule
+    liste les boîtes qui la recouvrent, par indices croissants.
+
+    Args:
+        bounds (numpy.ndarray):
+            Boîtes englobantes (x_min, y_min, x_max, y_max), NaN pour les boîtes à ignorer. (N, 4)
+        cell_size (float):
+            Côté des cellules. (> 0)
+    Returns:
+        tuple(numpy.ndarray, tuple(int, int), numpy.ndarray, numpy.ndarray):
+            Origine de la grille (2), nombres de colonnes et de lignes, début des boîtes
+            de chaque cellule suivi de leur nombre total (C + 1), et boîtes de chaque cellule.
+    """
+    boxes = np.flatnonzero(~np.isnan(bounds).any(axis=1))
+    if len(boxes) == 0:
+        return np.zeros(2), (0, 0), np.zeros(1, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    origin = bounds[boxes, :2].min(axis=0)
+    lower = ((bounds[boxes, :2] - origin) // cell_size).astype(np.int64)
+    upper = ((bounds[boxes, 2:] - origin) // cell_size).astype(np.int64)
+    columns, rows = (int(value) + 1 for value in upper.max(axis=0))
+
+    # Chaque boîte est répétée pour chacune des cellules qu'elle recouvre.
+    spans = upper - lower + 1
+    counts = spans[:, 0] * spans[:, 1]
+    local = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+    widths = np.repeat(spans[:, 0], counts)
+    cells = ((np.repeat(lower[:, 1], counts) + local // widths) * columns
+             + np.repeat(lower[:, 0], counts) + local % widths)
+
+    order = np.argsort(cells, kind='stable')
+    cell_offsets = np.zeros(columns * rows + 1, dtype=np.int64)
+    np.cumsum(np.bincount(cells, minlength=columns * rows), out=cell_offsets[1:])
+    return origin, (columns, rows), cell_offsets, np.repeat(boxes, counts)[order]
+
+
+def points_in_polygon_pairs(points, polygons, coordinates, offsets):
+    """
+    Vérifie, pour chaque paire (point, polygone), si le point est strictement à l'intérieur
+    du polygone (règle pair-impair, comme points_in_polygon()).
+
+    Args:
+        points (numpy.ndarray):
+            Point de chaque paire. (K, 2)
+        polygons (numpy.ndarray):
+            Polygone de chaque paire. (K)
+        coordinates (numpy.ndarray):
+            Coordonnées contiguës des sommets. (V, 2)
+        offsets (numpy.ndarray):
+            Indices de début de chaque polygone, suivis du nombre total de sommets. (N + 1)
+    Returns:
+        numpy.ndarray:
+            Masque booléen de taille K.
+    """
+    counts = np.diff(offsets)[polygons]
+    pairs = np.repeat(np.arange(len(polygons)), counts)
+    local = np.arange(len(pairs)) - np.repeat(np.cumsum(counts) - counts, counts)
+    starts = offsets[polygons][pairs]
+    x0, y0 = coordinates[starts + local].T
+    x1, y1 = coordinates[starts + (local + 1) % counts[pairs]].T
+    x, y = points[pairs].T
+
+    # Arêtes traversées par la demi-droite horizontale issue de chaque point.
+    crossing = (y0 > y) != (y1 > y)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_intersection = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+
+    hits = np.bincount(pairs, weights=crossing & (x < x_intersection), minlength=len(polygons))
+    return hits % 2 == 1
+
+
+def locate_points(points, coordinates, offsets, bounds, cell_size=None, chunk_size=LOCATE_CHUNK_SIZE):
+    """
+    Retourne, pour chaque point, le polygone qui le contient.
+
+    Les boîtes englobantes sont indexées dans une grille uniforme. Les polygones candidats d'un
+    point sont ceux de sa cellule dont la boîte contient le point ; l'inclusion est ensuite confirmée
+    par un test de croisement vectorisé sur toutes les paires candidates. Les points sont traités
+    par paquets, et les paires par blocs d'au plus LOCATE_EDGES_CHUNK_SIZE arêtes : la mémoire
+    utilisée ne dépend pas du nombre de points.
+
+    Args:
+        points (numpy.ndarray):
+            Points à localiser. (P, 2)
+        coordinates (numpy.ndarray):
+            Coordonnées contiguës des sommets. (V, 2)
+        offsets (numpy.ndarray):
+            Indices de début de chaque polygone, suivis du nombre total de sommets. (N + 1)
+        bounds (numpy.ndarray):
+            Boîtes englobantes des polygones, NaN pour les polygones vides. (N, 4)
+        cell_size (float):
+            Côté des cellules de la grille. (par défaut à la médiane des côtés des boîtes,
+            sans dépasser 4N cellules)
+        chunk_size (int):
+            Nombre de points traités à la fois. (par défaut à LOCATE_CHUNK_SIZE)
+    Returns:
+        numpy.ndarray:
+            Indice du polygone contenant chaque point, le plus petit si plusieurs le contiennent,
+            -1 si aucun ne le contient. (P)
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    located = np.full(len(points), -1, dtype=np.int64)
+    valid = ~np.isnan(bounds).any(axis=1)
+    if not valid.any() or len(points) == 0:
+        return located
+
+    if cell_size is None:
+        sides = np.maximum(bounds[valid, 2] - bounds[valid, 0], bounds[valid, 3] - bounds[valid, 1])
+        extents = bounds[valid, 2:].max(axis=0) - bounds[valid, :2].min(axis=0)
+        cell_size = max(float(np.median(sides)), float(np.sqrt(extents.prod() / (4 * valid.sum()))))
+        if cell_size <= 0:
+            cell_size = 1.
+    origin, (columns, rows), cell_offsets, cell_boxes = grid_index(bounds, cell_size)
+    vertices_counts = np.diff(offsets)
+
+    for start in range(0, len(points), chunk_size):
+        chunk = points[start:start + chunk_size]
+        finite = np.isfinite(chunk).all(axis=1)
+        with np.errstate(invalid='ignore'):
+            cells = np.where(finite[:, None], (chunk - origin) // cell_size, -1).astype(np.int64)
+        in_grid = np.flatnonzero((cells >= 0).all(axis=1) & (cells[:, 0] < columns) & (cells[:, 1] < rows))
+        cell_indices = cells[in_grid, 1] * columns + cells[in_grid, 0]
+
+        # Paires candidates (point, polygone) de chaque cellule, filtrées par les boîtes englobantes
+        counts = cell_offsets[cell_indices + 1] - cell_offsets[cell_indices]
+        pair_points = np.repeat(in_grid, counts)
+        pair_polygons = cell_boxes[np.repeat(cell_offsets[cell_indices] - np.cumsum(counts) + counts, counts)
+                                   + np.arange(int(counts.sum()))]
+        x, y = chunk[pair_points].T
+        box = bounds[pair_polygons]
+        inside_box = (box[:, 0] <= x) & (x <= box[:, 2]) & (box[:, 1] <= y) & (y <= box[:, 3])
+        pair_points, pair_polygons = pair_points[inside_box], pair_polygons[inside_box]
+
+        # Confirmation par blocs de paires, à nombre d'arêtes borné
+        cumulated = np.cumsum(vertices_counts[pair_polygons])
+        confirmed = np.zeros(len(pair_points), dtype=bool)
+        first = 0
+        while first < len(pair_points):
+            done = cumulated[first - 1] if first else 0
+            last = max(int(np.searchsorted(cumulated, done + LOCATE_EDGES_CHUNK_SIZE, side='right')), first + 1)
+            confirmed[first:last] = points_in_polygon_pairs(chunk[pair_points[first:last]], pair_polygons[first:last],
+                                                            coordinates, offsets)
+            first = last
+
+        chunk_located = np.full(len(chunk), np.iinfo(np.int64).max)
+        np.minimum.at(chunk_located, pair_points[confirmed], pair_polygons[confirmed])
+        located[start:start + len(chunk)] = np.where(chunk_located == np.iinfo(np.int64).max, -1, chunk_located)
+
+    return located
@@ -0,0 +1,175 @@
+"""
+Implémentation du calcul de la surface couverte par des rectangles alignés sur les axes.
+
+Les rectangles sont donnés par leurs boîtes (x_min, y_min, x_max, y_max). L'aire de
+leur union est calculée par balayage selon les abscisses : chaque rectangle ouvre
+puis ferme un intervalle d'ordonnées, et un arbre de segments sur les ordonnées
+compressées maintient la longueur couverte par les intervalles ouverts. Le calcul
+est exact aux arrondis près et coûte O(n log n).
+"""
+
+import math
+
+from geometry.utilities.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+class CoverageTree:
+    """
+    Classe représentant un arbre de segments sur des ordonnées compressées, qui compte
+    les intervalles ouverts et maintient la longueur totale qu'ils couvrent.
+
+    Attributes:
+        ys (list[float]): Ordonnées distinctes triées, bornes des intervalles élémentaires.
+        counts (list[int]): Nombre d'intervalles couvrant entièrement chaque nœud.
+        lengths (list[float]): Longueur couverte dans chaque nœud.
+    """
+
+    def __init__(self, ys):
+        """
+        Instancie un arbre vide.
+
+        Args:
+            ys (numpy.ndarray):
+                Ordonnées distinctes triées. (m ≥ 2)
+        """
+        self.ys = ys.tolist()
+        self.counts = [0] * (4 * len(self.ys))
+        self.lengths = [0.] * (4 * len(self.ys))
+
+    @property
+    def covered(self):
+        """
+        Longueur couverte par les intervalles ouverts.
+
+        Returns:
+            float:
+                Longueur de l'union des intervalles ouverts.
+        """
+        return self.lengths[1]
+
+    def update(self, lower, upper, delta, node=1, left=0, right=None):
+        """
+        Ouvre (delta = 1) ou ferme (delta = -1) l'intervalle [ys[lower], ys[upper]).
+
+        Args:
+            lower (int):
+                Indice de la borne inférieure.
+            upper (int):
+                Indice de la borne supérieure.
+            delta (int):
+                1 ou -1.
+            node (int):
+                Nœud courant. (par défaut à la racine)
+            left (int):
+                Indice de la borne inférieure du nœud. (par défaut à 0)
+            right (int):
+                Indice de la borne supérieure du nœud. (par défaut à m - 1)
+        """
+        if right is None:
+            right = len(self.ys) - 1
+        if upper <= left or right <= lower:
+            return
+
+        if lower <= left and right <= upper:
+            self.counts[node] += delta
+        else:
+            middle = (left + right) // 2
+            self.update(lower, upper, delta, 2 * node, left, middle)
+            self.update(lower, upper, delta, 2 * node + 1, middle, right)
+
+        # Un nœud entièrement couvert l'est quel que soit le contenu de ses fils.
+        if self.counts[node] > 0:
+            self.lengths[node] = self.ys[right] - self.ys[left]
+        elif right - left == 1:
+            self.lengths[node] = 0.
+        else:
+            self.lengths[node] = self.lengths[2 * node] + self.lengths[2 * node + 1]
+
+
+def union_area(bounds):
+    """
+    Calcule l'aire de l'union de rectangles alignés sur les axes.
+
+    Args:
+        bounds (numpy.ndarray):
+            Boîtes (x_min, y_min, x_max, y_max) des rectangles. Les boîtes vides,
+            dégénérées ou NaN sont ignorées. (N, 4)
+    Returns:
+        float:
+            Aire couverte par au moins un rectangle.
+    """
+    bounds = np.asarray(bounds, dtype=np.float64).reshape(-1, 4)
+    with np.errstate(invalid='ignore'):
+        bounds = bounds[(bounds[:, 2] > bounds[:, 0]) & (bounds[:, 3] > bounds[:, 1])]
+    if len(bounds) == 0:
+        return 0.
+
+    ys = np.unique(bounds[:, [1, 3]])
+    lower = np.searchsorted(ys, bounds[:, 1])
+    upper = np.searchsorted(ys, bounds[:, 3])
+
+    # Événements du balayage : ouverture en x_min, fermeture en x_max
+    xs = np.concatenate([bounds[:, 0], bounds[:, 2]])
+    deltas = np.repeat([1, -1], len(bounds))
+    order = np.argsort(xs, kind='stable')
+
+    tree = CoverageTree(ys)
+    slices = []
+    previous = xs[order[0]]
+    for x, low, high, delta in zip(xs[order].tolist(), np.tile(lower, 2)[order].tolist(),
+                                   np.tile(upper, 2)[order].tolist(), deltas[order].tolist()):
+        slices.append(tree.covered * (x - previous))
+        tree.update(low, high, delta)
+        previous = x
+
+    return math.fsum(slices)
+
+
+def covered_mask(bounds, shape, window):
+    """
+    Retourne le masque des pixels d'une grille dont le centre est couvert par au moins un rectangle.
+
+    Les bords des rectangles sont comptés par une table de différences, puis accumulés par
+    balayage selon les lignes et les colonnes, en O(N + H W).
+
+    Args:
+        bounds (numpy.ndarray):
+            Boîtes (x_min, y_min, x_max, y_max) des rectangles, NaN pour les boîtes à ignorer. (N, 4)
+        shape (tuple(int, int)):
+            Nombre de lignes H et de colonnes W de la grille.
+        window (tuple(float, float, float, float)):
+            Zone (x_min, y_min, x_max, y_max) couverte par la grille. La ligne i est à
+            l'ordonnée y_min + (i + 0.5) (y_max - y_min) / H.
+    Returns:
+        numpy.ndarray:
+            Masque booléen. (H, W)
+    Raises:
+        ValueError:
+            Si la grille ou la zone est vide.
+    """
+    rows, columns = shape
+    x_min, y_min, x_max, y_max = window
+    if rows <= 0 or columns <= 0 or not (x_max > x_min and y_max > y_min):
+        raise ValueError("La grille et la zone doivent être non vides !")
+
+    bounds = np.asarray(bounds, dtype=np.float64).reshape(-1, 4)
+    bounds = bounds[~np.isnan(bounds).any(axis=1)]
+
+    # Indices du premier pixel dont le centre est dans [min, max), pour chaque bord
+    steps = np.array([(x_max - x_min) / columns, (y_max - y_min) / rows])
+    first = np.ceil((bounds[:, :2] - (x_min, y_min)) / steps - 0.5)
+    last = np.ceil((bounds[:, 2:] - (x_min, y_min)) / steps - 0.5)
+    first = np.clip(first, 0, (columns, rows)).astype(np.int64)
+    last = np.clip(last, 0, (columns, rows)).astype(np.int64)
+    keep = (last > first).all(axis=1)
+    first, last = first[keep], last[keep]
+
+    differences = np.zeros((rows + 1, columns + 1), dtype=np.int64)
+    np.add.at(differences, (first[:, 1], first[:, 0]), 1)
+    np.add.at(differences, (first[:, 1], last[:, 0]), -1)
+    np.add.at(differences, (last[:, 1], first[:, 0]), -1)
+    np.add.at(differences, (last[:, 1], last[:, 0]), 1)
+
+    return np.cumsum(np.cumsum(differences, axis=0), axis=1)[:rows, :columns] > 0
@@ -0,0 +1,361 @@
+"""
+Implémentation de la triangulation de Delaunay d'un ensemble de points par insertion
+incrémentale aléatoire (arbre de Delaunay).
+
+Le plan est entièrement couvert par des triangles : les triangles finis, orientés dans
+le sens trigonométrique, et un triangle fantôme (a, b, ∞) par arête a → b de l'enveloppe
+convexe, dont le « cercle » est le demi-plan extérieur à cette arête. Insérer un point
+revient à retirer les triangles dont le disque circonscrit ouvert le contient (la cavité,
+connexe et étoilée par rapport au point), puis à relier le point aux arêtes du bord de
+la cavité (Bowyer-Watson).
+
+Les triangles retirés ne sont pas oubliés : chacun pointe vers les triangles créés sur
+ses arêtes, de même que le triangle conservé de l'autre côté de chaque arête du bord.
+Le disque d'un triangle créé étant inclus dans l'union de ceux de ces deux triangles,
+un triangle en conflit avec un point est atteint depuis les triangles initiaux en ne
+parcourant que des triangles en conflit. Pour un ordre d'insertion aléatoire, la
+localisation coûte O(log n) en moyenne, et la construction O(n log n).
+
+Les comparaisons reposent sur les prédicats robustes : la triangulation est exacte pour
+des coordonnées flottantes finies, y compris pour des points alignés ou cocycliques.
+"""
+
+from geometry.utilities import predicates
+from geometry.utilities.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# Indice du sommet à l'infini des triangles fantômes
+GHOST = -1
+
+
+class DelaunayTriangulation:
+    """
+    Classe représentant une triangulation de Delaunay à laquelle des points peuvent être
+    ajoutés sans la reconstruire.
+
+    Les triangles retirés sont conservés comme nœuds de la structure de localisation : les
+    listes internes sont indexées par nœud, et seuls les nœuds vivants forment la triangulation.
+
+    Attributes:
+        coordinates (list[tuple(float, float)]): Coordonnées de tous les points ajoutés.
+        representatives (list[int]): Pour chaque point, indice du point inséré à la même position :
+            lui-même, ou le premier point identique pour un doublon.
+        positions (dict): Indice du point inséré à chaque position.
+        vertices (list[tuple(int, int, int)]): Sommets de chaque nœud, dans le sens trigonométrique.
+            Le sommet à l'infini d'un triangle fantôme (GHOST) est toujours le dernier.
+        adjacent (list[list[int]]): Nœud voisin opposé à chaque sommet de chaque nœud.
+        alive (list[bool]): Nœuds de la triangulation courante.
+        children (list[list[int]]): Nœuds créés sur les arêtes de chaque nœud, lors de son retrait
+            ou contre l'une de ses arêtes.
+    """
+
+    def __init__(self, points=None, rng=None):
+        """
+        Construit la triangulation de Delaunay d'un ensemble de points.
+
+        Args:
+            points (numpy.ndarray):
+                Points, insérés dans un ordre aléatoire. (n, 2) (par défaut aucun)
+            rng (numpy.random.Generator):
+                Générateur de l'ordre d'insertion. (par défaut non initialisé)
+        Raises:
+            ValueError:
+                Si des coordonnées ne sont pas finies.
+        """
+        self.coordinates = []
+        self.representatives = []
+        self.positions = {}
+        self.vertices = []
+        self.adjacent = []
+        self.alive = []
+        self.children = []
+        self.roots = []
+        # Points alignés en attente d'un premier triangle non dégénéré
+        self.pending = []
+        self.visits = []
+        self.stamp = 0
+        self._arrays = None
+
+        if points is not None:
+            self.add(points, rng)
+
+    def __len__(self):
+        """
+        Nombre de triangles finis de la triangulation.
+
+        Returns:
+            int:
+                Nombre de triangles.
+        """
+        return len(self.arrays()[0])
+
+    @property
+    def points(self):
+        """
+        Points ajoutés, doublons compris.
+
+        Returns:
+            numpy.ndarray:
+                Coordonnées. (P, 2)
+        """
+        return np.array(self.coordinates, dtype=np.float64).reshape(-1, 2)
+
+    @property
+    def triangles(self):
+        """
+        Triangles finis de la triangulation.
+
+        Returns:
+            numpy.ndarray:
+                Indices des sommets de chaque triangle dans points, dans le sens trigonométrique. (T, 3)
+        """
+        return self.arrays()[0]
+
+    @property
+    def neighbors(self):
+        """
+        Voisins des triangles finis.
+
+        Returns:
+            numpy.ndarray:
+                Indice du triangle opposé à chaque sommet de chaque triangle, -1 sur l'enveloppe convexe. (T, 3)
+        """
+        return self.arrays()[1]
+
+    def arrays(self):
+        """
+        Retourne les triangles finis et leurs voisins. Le résultat est mis en cache jusqu'au prochain ajout.
+
+        Returns:
+            tuple(numpy.ndarray, numpy.ndarray):
+                Triangles (T, 3) et voisins (T, 3).
+        """
+        if self._arrays is None:
+            nodes = [node for node, alive in enumerate(self.alive) if alive and self.vertices[node][2] != GHOST]
+            # Les nœuds fantômes n'ont pas d'indice : les voisins correspondants valent -1.
+            indices = np.full(len(self.vertices), -1, dtype=np.int64)
+            indices[nodes] = np.arange(len(nodes))
+
+            triangles = np.array([self.vertices[node] for node in nodes], dtype=np.int64).reshape(-1, 3)
+            adjacent = np.array([self.adjacent[node] for node in nodes], dtype=np.int64).reshape(-1, 3)
+            self._arrays = triangles, indices[adjacent]
+        return self._arrays
+
+    def edges(self):
+        """
+        Retourne les arêtes de la triangulation : le graphe de voisinage de Delaunay des points.
+
+        Returns:
+            numpy.ndarray:
+                Couples (i, j), i < j, d'indices de points reliés, triés. (E, 2)
+        """
+        triangles = self.triangles
+        edges = np.concatenate([triangles[:, [0, 1]], triangles[:, [1, 2]], triangles[:, [2, 0]]])
+        return np.unique(np.sort(edges, axis=1), axis=0).reshape(-1, 2)
+
+    def add(self, points, rng=None):
+        """
+        Ajoute des points à la triangulation, dans un ordre aléatoire, sans la reconstruire.
+        Un point identique à un point déjà inséré est conservé dans points, mais n'est pas
+        inséré (voir representatives).
+
+        Args:
+            points (numpy.ndarray):
+                Points. (n, 2)
+            rng (numpy.random.Generator):
+                Générateur de l'ordre d'insertion. (par défaut non initialisé)
+        Returns:
+            numpy.ndarray:
+                Indices des points ajoutés dans points. (n)
+        Raises:
+            ValueError:
+                Si des coordonnées ne sont pas finies.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if not np.isfinite(points).all():
+            raise ValueError("Les coordonnées des points doivent être finies !")
+
+        start = len(self.coordinates)
+        inserted = []
+        for index, position in enumerate(map(tuple, points.tolist()), start):
+            self.coordinates.append(position)
+            self.representatives.append(self.positions.setdefault(position, index))
+            if self.representatives[index] == index:
+                inserted.append(index)
+        self._arrays = None
+
+        rng = np.random.default_rng() if rng is None else rng
+        for index in rng.permutation(inserted).tolist():
+            self.insert(index)
+        return np.arange(start, len(self.coordinates))
+
+    def insert(self, index):
+        """
+        Insère un point de coordinates, distinct des points insérés, dans la triangulation.
+
+        Args:
+            index (int):
+                Indice du point.
+        """
+        position = self.coordinates[index]
+        if not self.roots:
+            self.pending.append(index)
+            if len(self.pending) >= 3:
+                first, second = self.pending[:2]
+                if predicates.orientation(*self.coordinates[first], *self.coordinates[second], *position) != 0:
+                    self.initialize(first, second, index)
+                    for other in self.pending[2:-1]:
+                        self.insert_vertex(other)
+                    self.pending = []
+            return
+
+        self.insert_vertex(index)
+
+    def initialize(self, first, second, third):
+        """
+        Crée le premier triangle et ses trois triangles fantômes, racines de la structure de localisation.
+
+        Args:
+            first, second, third (int):
+                Indices de trois points non alignés.
+        """
+        if predicates.orientation(*self.coordinates[first], *self.coordinates[second],
+                                  *self.coordinates[third]) < 0:
+            first, second = second, first
+
+        edges = {}
+        self.roots = [self.create((first, second, third), edges),
+                      self.create((second, first, GHOST), edges),
+                      self.create((third, second, GHOST), edges),
+                      self.create((first, third, GHOST), edges)]
+
+    def create(self, vertices, edges):
+        """
+        Crée un nœud, et le relie aux nœuds créés en même temps qui partagent l'une de ses arêtes.
+
+        Args:
+            vertices (tuple(int, int, int)):
+                Sommets du triangle, dans le sens trigonométrique, GHOST en dernier.
+            edges (dict):
+                Nœud et position de chaque arête orientée des nœuds créés en même temps.
+        Returns:
+            int:
+                Indice du nœud.
+        """
+        node = len(self.vertices)
+        self.vertices.append(vertices)
+        self.adjacent.append([-1, -1, -1])
+        self.alive.append(True)
+        self.children.append([])
+        self.visits.append(0)
+
+        for position in range(3):
+            edge = vertices[(position + 1) % 3], vertices[(position + 2) % 3]
+            twin = edges.pop(edge[::-1], None)
+            if twin is None:
+                edges[edge] = node, position
+            else:
+                self.adjacent[node][position] = twin[0]
+                self.adjacent[twin[0]][twin[1]] = node
+        return node
+
+    def conflicts(self, node, x, y):
+        """
+        Vérifie si un point est strictement dans le disque circonscrit d'un nœud. Le disque d'un
+        triangle fantôme (a, b, ∞) est le demi-plan ouvert à gauche de a → b, augmenté du segment ouvert ]a, b[.
+
+        Args:
+            node (int):
+                Indice du nœud.
+            x, y (float):
+                Coordonnées du point.
+        Returns:
+            bool:
+                True si le point est en conflit avec le nœud.
+        """
+        first, second, third = self.vertices[node]
+        ax, ay = self.coordinates[first]
+        bx, by = self.coordinates[second]
+        if third != GHOST:
+            return predicates.incircle(ax, ay, bx, by, *self.coordinates[third], x, y) > 0
+
+        turn = predicates.orientation(ax, ay, bx, by, x, y)
+        if turn != 0:
+            return turn > 0
+        if ax != bx:
+            return min(ax, bx) < x < max(ax, bx)
+        return min(ay, by) < y < max(ay, by)
+
+    def locate(self, x, y):
+        """
+        Retourne un nœud de la triangulation courante en conflit avec un point, en ne parcourant
+        depuis les racines que des nœuds en conflit.
+
+        Args:
+            x, y (float):
+                Coordonnées du point, distinct des points insérés.
+        Returns:
+            int:
+                Indice du nœud.
+        """
+        self.stamp += 1
+        stack = []
+        for root in self.roots:
+            self.visits[root] = self.stamp
+            if self.conflicts(root, x, y):
+                stack.append(root)
+
+        while stack:
+            node = stack.pop()
+            if self.alive[node]:
+                return node
+            for child in self.children[node]:
+                if self.visits[child] != self.stamp:
+                    self.visits[child] = self.stamp
+                    if self.conflicts(child, x, y):
+                        stack.append(child)
+        raise RuntimeError("Aucun triangle en conflit : la structure de localisation est incohérente.")
+
+    def insert_vertex(self, index):
+        """
+        Insère un point distinct des points insérés, une fois le premier triangle créé.
+
+        Args:
+            index (int):
+                Indice du point.
+        """
+        x, y = self.coordinates[index]
+
+        # Cavité : triangles en conflit, connexes à partir du triangle localisé
+        first = self.locate(x, y)
+        cavity, in_cavity, boundary = [first], {first: True}, []
+        for node in cavity:
+            for position, neighbor in enumerate(self.adjacent[node]):
+                if neighbor not in in_cavity:
+                    in_cavity[neighbor] = self.conflicts(neighbor, x, y)
+                    if in_cavity[neighbor]:
+                        cavity.append(neighbor)
+                if not in_cavity[neighbor]:
+                    boundary.append((node, position, neighbor))
+
+        # Chaque arête du bord est reliée au point.
+        edges = {}
+        for node, position, neighbor in boundary:
+            vertices = self.vertices[node]
+            start, end = vertices[(position + 1) % 3], vertices[(position + 2) % 3]
+            if start == GHOST:
+                created = self.create((end, index, GHOST), edges)
+            elif end == GHOST:
+                created = self.create((index, start, GHOST), edges)
+            else:
+                created = self.create((start, end, index), edges)
+
+            # L'arête du bord est opposée au point dans le nœud créé.
+            self.adjacent[created][self.vertices[created].index(index)] = neighbor
+            self.adjacent[neighbor][self.adjacent[neighbor].index(node)] = created
+            self.children[node].append(created)
+            self.children[neighbor].append(created)
+
+        for node in cavity:
+            self.alive[node] = False
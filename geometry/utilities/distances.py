@@ -0,0 +1,200 @@
+"""
+Implémentation du calcul par blocs des distances entre deux ensembles de points.
+
+Les points sont manipulés sous forme de tableaux de coordonnées de forme (n, 2)
+ou de listes de Vertice. Les distances sont calculées par blocs de taille bornée
+afin que la mémoire utilisée ne dépende pas du nombre de points.
+"""
+
+from geometry.utilities.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# Nombre de lignes et de colonnes d'un bloc de distances.
+BLOCK_SIZE = 2048
+
+
+def as_coordinates(points):
+    """
+    Convertit un ensemble de points en tableau de coordonnées.
+
+    Args:
+        points (numpy.ndarray | list[Vertice]):
+            Points à convertir.
+    Returns:
+        numpy.ndarray:
+            Tableau (n, 2) des coordonnées des points.
+    Raises:
+        ValueError:
+            Si les points ne forment pas un tableau de forme (n, 2).
+    """
+    if isinstance(points, (list, tuple)) and points and hasattr(points[0], 'x'):
+        points = [(point.x, point.y) for point in points]
+
+    coordinates = np.asarray(points, dtype=np.float64)
+    if coordinates.size == 0:
+        coordinates = coordinates.reshape(0, 2)
+    if coordinates.ndim != 2 or coordinates.shape[1] != 2:
+        raise ValueError("Les points doivent former un tableau de forme (n, 2) !")
+
+    return coordinates
+
+
+def squared_distance_blocks(points1, points2, block_size=BLOCK_SIZE):
+    """
+    Parcourt la matrice des carrés des distances bloc par bloc.
+
+    Args:
+        points1 (numpy.ndarray | list[Vertice]):
+            Premier ensemble de N points.
+        points2 (numpy.ndarray | list[Vertice]):
+            Second ensemble de M points.
+        block_size (int):
+            Nombre maximal de lignes et de colonnes d'un bloc. (par défaut à BLOCK_SIZE)
+    Yields:
+        tuple(slice, slice, numpy.ndarray):
+            Tranches des lignes et des colonnes couvertes, et bloc des carrés des distances.
+    """
+    points1 = as_coordinates(points1)
+    points2 = as_coordinates(points2)
+
+    for row in range(0, len(points1), block_size):
+        rows = slice(row, row + block_size)
+        block1 = points1[rows]
+        for column in range(0, len(points2), block_size):
+            columns = slice(column, column + block_size)
+            block2 = points2[columns]
+
+            dx = block1[:, 0, None] - block2[None, :, 0]
+            dy = block1[:, 1, None] - block2[None, :, 1]
+            yield rows, columns, dx * dx + dy * dy
+
+
+def pairwise_distances(points1, points2, block_size=BLOCK_SIZE):
+    """
+    Retourne la matrice complète des distances euclidiennes entre deux ensembles de points.
+    Attention ! La matrice résultante occupe N x M flottants.
+
+    Args:
+        points1 (numpy.ndarray | list[Vertice]):
+            Premier ensemble de N points.
+        points2 (numpy.ndarray | list[Vertice]):
+            Second ensemble de M points.
+        block_size (int):
+            Nombre maximal de lignes et de colonnes d'un bloc. (par défaut à BLOCK_SIZE)
+    Returns:
+        numpy.ndarray:
+            Matrice (N, M) des distances.
+    """
+    points1 = as_coordinates(points1)
+    points2 = as_coordinates(points2)
+
+    distances = np.empty((len(points1), len(points2)))
+    for rows, columns, block in squared_distance_blocks(points1, points2, block_size):
+        np.sqrt(block, out=distances[rows, columns])
+
+    return distances
+
+
+def nearest(points1, points2, block_size=BLOCK_SIZE):
+    """
+    Retourne, pour chaque point du premier ensemble, la distance au point
+    le plus proche du second ensemble et son indice.
+
+    Args:
+        points1 (numpy.ndarray | list[Vertice]):
+            Premier ensemble de N points.
+        points2 (numpy.ndarray | list[Vertice]):
+            Second ensemble de M points. (M > 0)
+        block_size (int):
+            Nombre maximal de lignes et de colonnes d'un bloc. (par défaut à BLOCK_SIZE)
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray):
+            Distances minimales (N) et indices des points les plus proches (N).
+    Raises:
+        ValueError:
+            Si le second ensemble est vide.
+    """
+    points1 = as_coordinates(points1)
+    points2 = as_coordinates(points2)
+    if len(points2) == 0:
+        raise ValueError("Le second ensemble de points est vide !")
+
+    minimums = np.full(len(points1), np.inf)
+    indices = np.zeros(len(points1), dtype=np.int64)
+    for rows, columns, block in squared_distance_blocks(points1, points2, block_size):
+        block_indices = block.argmin(axis=1)
+        block_minimums = block[np.arange(len(block)), block_indices]
+
+        # Mise à jour des minimums courants. En cas d'égalité, le premier indice est conservé.
+        better = block_minimums < minimums[rows]
+        minimums[rows] = np.where(better, block_minimums, minimums[rows])
+        indices[rows] = np.where(better, block_indices + columns.start, indices[rows])
+
+    return np.sqrt(minimums), indices
+
+
+def min_distances(points1, points2, block_size=BLOCK_SIZE):
+    """
+    Retourne, pour chaque point du premier ensemble, la distance au point
+    le plus proche du second ensemble.
+
+    Args:
+        points1 (numpy.ndarray | list[Vertice]):
+            Premier ensemble de N points.
+        points2 (numpy.ndarray | list[Vertice]):
+            Second ensemble de M points. (M > 0)
+        block_size (int):
+            Nombre maximal de lignes et de colonnes d'un bloc. (par défaut à BLOCK_SIZE)
+    Returns:
+        numpy.ndarray:
+            Distances minimales. (N)
+    """
+    return nearest(points1, points2, block_size)[0]
+
+
+def argmin_distances(points1, points2, block_size=BLOCK_SIZE):
+    """
+    Retourne, pour chaque point du premier ensemble, l'indice du point
+    le plus proche du second ensemble.
+
+    Args:
+        points1 (numpy.ndarray | list[Vertice]):
+            Premier ensemble de N points.
+        points2 (numpy.ndarray | list[Vertice]):
+            Second ensemble de M points. (M > 0)
+        block_size (int):
+            Nombre maximal de lignes et de colonnes d'un bloc. (par défaut à BLOCK_SIZE)
+    Returns:
+        numpy.ndarray:
+            Indices des points les plus proches. (N)
+    """
+    return nearest(points1, points2, block_size)[1]
+
+
+def count_within(points1, points2, radius, block_size=BLOCK_SIZE):
+    """
+    Retourne, pour chaque point du premier ensemble, le nombre de points
+    du second ensemble situés à une distance inférieure ou égale au rayon.
+
+    Args:
+        points1 (numpy.ndarray | list[Vertice]):
+            Premier ensemble de N points.
+        points2 (numpy.ndarray | list[Vertice]):
+            Second ensemble de M points.
+        radius (float):
+            Rayon de recherche. (≥ 0)
+        block_size (int):
+            Nombre maximal de lignes et de colonnes d'un bloc. (par défaut à BLOCK_SIZE)
+    Returns:
+        numpy.ndarray:
+            Nombre de voisins de chaque point. (N)
+    """
+    points1 = as_coordinates(points1)
+
+    counts = np.zeros(len(points1), dtype=np.int64)
+    squared_radius = radius * radius
+    for rows, _, block in squared_distance_blocks(points1, points2, block_size):
+        counts[rows] += np.count_nonzero(block <= squared_radius, axis=1)
+
+    return counts
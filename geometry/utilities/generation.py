@@ -0,0 +1,137 @@
+"""
+Implémentation de la génération vectorisée de polygones convexes aléatoires.
+
+L'algorithme de Valtr tire deux ensembles de n coordonnées, les découpe en deux
+chaînes croissantes, en déduit n vecteurs de somme nulle, puis les enchaîne par
+angle croissant : le polygone obtenu est convexe et a exactement n sommets.
+Chaque étape est vectorisée sur un lot de polygones de même nombre de sommets.
+
+Ramené sur des coordonnées entières, un polygone peut perdre des sommets (confondus
+ou alignés) : complete_lattice_polygon() lui en ajoute de nouveaux, entiers, sans
+rompre la convexité stricte.
+"""
+
+from geometry.utilities import predicates
+from geometry.utilities.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+def chain_components(values, rng):
+    """
+    Découpe chaque ligne de coordonnées triées en deux chaînes reliant son minimum
+    à son maximum, et retourne les composantes des vecteurs des deux chaînes.
+
+    Args:
+        values (numpy.ndarray):
+            Coordonnées triées de chaque ligne. (count, n)
+        rng (numpy.random.Generator):
+            Générateur aléatoire.
+    Returns:
+        numpy.ndarray:
+            Composantes de somme nulle, positives pour la première chaîne
+            et négatives pour la seconde. (count, n)
+    """
+    count, vertices_count = values.shape
+
+    # Chaque valeur intérieure est attribuée au hasard à l'une des chaînes, les extrémités aux deux.
+    first = np.ones((count, vertices_count), dtype=bool)
+    first[:, 1:-1] = rng.random((count, vertices_count - 2)) < 0.5
+    second = ~first
+    second[:, [0, -1]] = True
+
+    positions = np.arange(vertices_count)
+    components = []
+    for chain, sign in ((first, 1.), (second, -1.)):
+        # Indice du dernier élément de la chaîne strictement avant chaque position
+        previous = np.maximum.accumulate(np.where(chain, positions, 0), axis=1)[:, :-1]
+        differences = values[:, 1:] - np.take_along_axis(values, previous, axis=1)
+        components.append(np.where(chain[:, 1:], sign * differences, np.nan))
+
+    # Chaque ligne compte exactement n composantes valides, dans l'ordre.
+    components = np.concatenate(components, axis=1)
+    return components[~np.isnan(components)].reshape(count, vertices_count)
+
+
+def random_convex_coordinates(count, vertices_count, rng=None):
+    """
+    Génère un lot de polygones convexes aléatoires par l'algorithme de Valtr, en O(n log n) par polygone.
+
+    Args:
+        count (int):
+            Nombre de polygones. (≥ 0)
+        vertices_count (int):
+            Nombre exact de sommets de chaque polygone. (≥ 3)
+        rng (numpy.random.Generator | int, optional):
+            Générateur aléatoire, ou graine. (par défaut à None)
+    Returns:
+        numpy.ndarray:
+            Sommets de chaque polygone, dans le sens trigonométrique. Chaque polygone
+            a pour boîte englobante le carré unité [0, 1] x [0, 1]. (count, n, 2)
+    Raises:
+        ValueError:
+            Si le nombre de sommets est inférieur à 3, ou si le nombre de polygones est négatif.
+    """
+    if vertices_count < 3:
+        raise ValueError("Nombre de sommets minimal : 3 !")
+    if count < 0:
+        raise ValueError("Le nombre de polygones doit être positif !")
+
+    rng = np.random.default_rng(rng)
+
+    x_components = chain_components(np.sort(rng.random((count, vertices_count)), axis=1), rng)
+    y_components = chain_components(np.sort(rng.random((count, vertices_count)), axis=1), rng)
+
+    # Appariement aléatoire des composantes, puis tri des vecteurs par angle
+    y_components = rng.permuted(y_components, axis=1)
+    order = np.argsort(np.arctan2(y_components, x_components), axis=1)
+    vectors = np.stack([np.take_along_axis(x_components, order, axis=1),
+                        np.take_along_axis(y_components, order, axis=1)], axis=2)
+
+    # Les vecteurs sont mis bout à bout, puis le polygone est ramené dans le carré unité.
+    coordinates = np.cumsum(vectors, axis=1)
+    minimums = coordinates.min(axis=1, keepdims=True)
+    extents = coordinates.max(axis=1, keepdims=True) - minimums
+    return (coordinates - minimums) / extents
+
+
+def complete_lattice_polygon(vertices, vertices_count, bounds, rng):
+    """
+    Ajoute des sommets entiers à un polygone strictement convexe à sommets entiers, jusqu'à
+    vertices_count sommets, sans sortir d'un rectangle. Un sommet ajouté entre a et b est tiré
+    parmi les points entiers strictement à l'extérieur de l'arête (a, b) et strictement à
+    l'intérieur des droites des deux arêtes voisines : le polygone reste strictement convexe.
+
+    Args:
+        vertices (numpy.ndarray | list[tuple(int, int)]):
+            Sommets entiers, dans le sens trigonométrique. (k, 2) (k ≥ 3)
+        vertices_count (int):
+            Nombre de sommets visé. (≥ k)
+        bounds (tuple(int, int, int, int)):
+            Rectangle (x_min, y_min, x_max, y_max) contenant les sommets.
+        rng (numpy.random.Generator):
+            Générateur aléatoire.
+    Returns:
+        numpy.ndarray | None:
+            Sommets entiers, dans le sens trigonométrique (vertices_count, 2), ou None
+            si plus aucun point entier du rectangle ne peut être ajouté.
+    """
+    vertices = np.asarray(vertices, dtype=np.int64).reshape(-1, 2)
+    if len(vertices) >= vertices_count:
+        return vertices
+
+    x_min, y_min, x_max, y_max = bounds
+    grid = np.stack(np.meshgrid(np.arange(x_min, x_max + 1, dtype=np.int64),
+                                np.arange(y_min, y_max + 1, dtype=np.int64)), axis=-1).reshape(-1, 2)
+    while len(vertices) < vertices_count:
+        for edge in rng.permutation(len(vertices)).tolist():
+            previous, start, end, following = (vertices[(edge + shift) % len(vertices)] for shift in (-1, 0, 1, 2))
+            candidates = np.flatnonzero((predicates.orientations(start, end, grid) < 0)
+                                        & (predicates.orientations(previous, start, grid) > 0)
+                                        & (predicates.orientations(grid, end, following) > 0))
+            if len(candidates):
+                vertices = np.insert(vertices, edge + 1, grid[rng.choice(candidates)], axis=0)
+                break
+        else:
+            return None
+    return vertices
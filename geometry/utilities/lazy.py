@@ -0,0 +1,77 @@
+"""
+Implémentation de l'import différé de modules.
+
+Un module importé de manière différée n'est réellement chargé qu'au premier
+accès à l'un de ses attributs. Les dépendances lourdes (NumPy, OpenCV,
+largestinteriorrectangle) ne ralentissent ainsi pas le démarrage des scripts
+qui ne s'en servent pas.
+"""
+
+import importlib.util
+import sys
+
+
+def lazy_import(name):
+    """
+    Retourne un module dont le chargement est différé jusqu'au premier accès à l'un de ses attributs.
+    Le module est enregistré dans sys.modules : les imports suivants, différés ou non,
+    partagent donc le même objet.
+
+    Args:
+        name (str):
+            Nom complet du module.
+    Returns:
+        module:
+            Module, éventuellement pas encore chargé.
+    Raises:
+        ModuleNotFoundError:
+            Si le module est introuvable.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"Module introuvable : {name} !", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    return module
+
+
+def is_loaded(module):
+    """
+    Vérifie si un module importé de manière différée a réellement été chargé.
+    Un accès à ses attributs le chargerait : seul son type est donc examiné.
+
+    Args:
+        module (module):
+            Module à vérifier.
+    Returns:
+        bool:
+            True si le module a été chargé, False sinon.
+    """
+    return not isinstance(module, importlib.util._LazyModule)
+
+
+def load(module):
+    """
+    Force le chargement d'un module importé de manière différée.
+    Avant Python 3.12, le chargement différé n'est pas protégé contre les accès concurrents :
+    un module utilisé par plusieurs fils d'exécution doit être chargé avant leur démarrage.
+
+    Args:
+        module (module):
+            Module à charger.
+    Returns:
+        module:
+            Module chargé.
+    """
+    if not is_loaded(module):
+        # Le premier accès à un attribut exécute le module.
+        getattr(module, '__name__')
+    return module
@@ -0,0 +1,247 @@
+"""
+Implémentation de la localisation de points dans un polygone par décomposition en bandes.
+
+Les abscisses distinctes des sommets découpent le plan en bandes verticales. Aucun
+sommet n'étant à l'intérieur d'une bande, les arêtes d'un polygone simple qui la
+traversent y sont totalement ordonnées de bas en haut. Localiser un point revient
+alors à deux recherches dichotomiques : celle de sa bande, puis celle du nombre
+d'arêtes sous lui dans la bande. La parité de ce nombre indique si le point est à
+l'intérieur. Les comparaisons reposent sur le prédicat d'orientation robuste : un
+point sur le bord est toujours reconnu comme tel.
+
+La requête coûte O(log n). La structure occupe O(n + K), où K est le nombre de
+couples (arête, bande) : K reste proche de n pour les contours usuels (une droite
+verticale ne coupe que quelques arêtes), mais peut atteindre O(n²) pour des
+polygones très dentelés.
+"""
+
+from geometry.utilities import predicates
+from geometry.utilities.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# Résultats de la localisation
+OUTSIDE = -1
+BOUNDARY = 0
+INSIDE = 1
+
+# Nombre de points localisés à la fois
+LOCATE_CHUNK_SIZE = 1 << 16
+
+
+def bisect(lower, upper, goes_right):
+    """
+    Recherche dichotomique vectorisée : pour chaque requête, retourne la première position de
+    [lower, upper) pour laquelle goes_right est faux (upper si aucune).
+
+    Args:
+        lower (numpy.ndarray):
+            Début de l'intervalle de chaque requête. (P)
+        upper (numpy.ndarray):
+            Fin (exclue) de l'intervalle de chaque requête. (P)
+        goes_right (callable):
+            Reçoit les indices des requêtes actives et les positions testées, et retourne
+            un masque vrai si la recherche doit se poursuivre après la position.
+    Returns:
+        numpy.ndarray:
+            Positions trouvées. (P)
+    """
+    lower, upper = lower.copy(), upper.copy()
+    active = np.flatnonzero(lower < upper)
+    while len(active):
+        middles = (lower[active] + upper[active]) // 2
+        right = goes_right(active, middles)
+        lower[active[right]] = middles[right] + 1
+        upper[active[~right]] = middles[~right]
+        active = active[lower[active] < upper[active]]
+    return lower
+
+
+class SlabLocator:
+    """
+    Classe représentant une structure de localisation de points dans un polygone simple.
+
+    Attributes:
+        slab_bounds (numpy.ndarray): Abscisses distinctes des sommets, bornes des bandes. (S + 1)
+        slab_offsets (numpy.ndarray): Début des arêtes de chaque bande dans slab_edges, suivi de K. (S + 1)
+        slab_edges (numpy.ndarray): Arêtes de chaque bande, de bas en haut. (K)
+        lefts (numpy.ndarray): Extrémité gauche de chaque arête. (n, 2)
+        rights (numpy.ndarray): Extrémité droite de chaque arête. (n, 2)
+        verticals (numpy.ndarray): Arêtes verticales (x, y_min, y_max), triées. (V, 3)
+    """
+
+    def __init__(self, coordinates):
+        """
+        Construit la décomposition en bandes d'un polygone simple, en O((n + K) log(n + K)).
+
+        Args:
+            coordinates (numpy.ndarray):
+                Sommets du polygone, dans un sens quelconque. (n, 2)
+        Raises:
+            ValueError:
+                Si le polygone a moins de 3 sommets.
+        """
+        points = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+        if len(points) < 3:
+            raise ValueError("Nombre de sommets minimal : 3 !")
+
+        # Chaque arête est orientée de gauche à droite.
+        following = np.roll(points, -1, axis=0)
+        swap = (following[:, 0] < points[:, 0])[:, None]
+        self.lefts = np.where(swap, following, points)
+        self.rights = np.where(swap, points, following)
+
+        vertical = self.lefts[:, 0] == self.rights[:, 0]
+        verticals = np.stack([self.lefts[vertical, 0],
+                              np.minimum(self.lefts[vertical, 1], self.rights[vertical, 1]),
+                              np.maximum(self.lefts[vertical, 1], self.rights[vertical, 1])], axis=1)
+        self.verticals = verticals[np.lexsort((verticals[:, 1], verticals[:, 0]))]
+
+        # Chaque arête non verticale traverse les bandes [first, last).
+        self.slab_bounds = np.unique(points[:, 0])
+        slabs_count = len(self.slab_bounds) - 1
+        edges = np.flatnonzero(~vertical)
+        first = np.searchsorted(self.slab_bounds, self.lefts[edges, 0])
+        counts = np.searchsorted(self.slab_bounds, self.rights[edges, 0]) - first
+
+        pair_edges = np.repeat(edges, counts)
+        pair_starts = np.repeat(np.cumsum(counts) - counts, counts)
+        pair_slabs = np.repeat(first, counts) + np.arange(len(pair_edges)) - pair_starts
+
+        # Ordre des arêtes d'une bande : ordonnée au milieu de la bande.
+        middles = (self.slab_bounds[pair_slabs] + self.slab_bounds[pair_slabs + 1]) / 2
+        lefts, rights = self.lefts[pair_edges], self.rights[pair_edges]
+        heights = lefts[:, 1] + (rights[:, 1] - lefts[:, 1]) * (middles - lefts[:, 0]) / (rights[:, 0] - lefts[:, 0])
+        order = np.lexsort((heights, pair_slabs))
+
+        index_type = np.int32 if len(points) < 2 ** 31 else np.int64
+        self.slab_edges = pair_edges[order].astype(index_type)
+        self.slab_offsets = np.zeros(slabs_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(pair_slabs, minlength=slabs_count), out=self.slab_offsets[1:])
+
+    @property
+    def nbytes(self):
+        """
+        Mémoire occupée par la structure.
+
+        Returns:
+            int:
+                Taille des tableaux, en octets.
+        """
+        return sum(array.nbytes for array in (self.slab_bounds, self.slab_offsets, self.slab_edges,
+                                              self.lefts, self.rights, self.verticals))
+
+    def _search_slabs(self, points, slabs):
+        """
+        Compte les arêtes sous chaque point dans sa bande, et repère les points situés sur une arête.
+
+        Args:
+            points (numpy.ndarray):
+                Points. (P, 2)
+            slabs (numpy.ndarray):
+                Bande de chaque point. (P)
+        Returns:
+            tuple(numpy.ndarray, numpy.ndarray):
+                Nombre d'arêtes strictement sous chaque point (P), et masque des points sur une arête. (P)
+        """
+        lower, upper = self.slab_offsets[slabs], self.slab_offsets[slabs + 1]
+
+        def above(active, positions):
+            edges = self.slab_edges[positions]
+            return predicates.orientations(self.lefts[edges], self.rights[edges], points[active]) > 0
+
+        positions = bisect(lower, upper, above)
+
+        # Seule la première arête qui n'est pas sous le point peut le contenir.
+        on_edge = np.zeros(len(points), dtype=bool)
+        candidates = np.flatnonzero(positions < upper)
+        edges = self.slab_edges[positions[candidates]]
+        on_edge[candidates] = predicates.orientations(self.lefts[edges], self.rights[edges],
+                                                      points[candidates]) == 0
+        return positions - lower, on_edge
+
+    def _on_verticals(self, points):
+        """
+        Repère les points situés sur une arête verticale.
+
+        Args:
+            points (numpy.ndarray):
+                Points. (P, 2)
+        Returns:
+            numpy.ndarray:
+                Masque des points sur une arête verticale. (P)
+        """
+        lower = np.searchsorted(self.verticals[:, 0], points[:, 0], side='left')
+        upper = np.searchsorted(self.verticals[:, 0], points[:, 0], side='right')
+
+        # Les arêtes verticales d'une même abscisse sont disjointes et triées par y_min.
+        def starts_below(active, positions):
+            return self.verticals[positions, 1] <= points[active, 1]
+
+        positions = bisect(lower, upper, starts_below) - 1
+        candidates = np.flatnonzero(positions >= lower)
+        on_vertical = np.zeros(len(points), dtype=bool)
+        on_vertical[candidates] = self.verticals[positions[candidates], 2] >= points[candidates, 1]
+        return on_vertical
+
+    def _locate_chunk(self, points):
+        """
+        Localise un paquet de points.
+
+        Args:
+            points (numpy.ndarray):
+                Points. (P, 2)
+        Returns:
+            numpy.ndarray:
+                OUTSIDE, BOUNDARY ou INSIDE pour chaque point (int8). (P)
+        """
+        locations = np.full(len(points), OUTSIDE, dtype=np.int8)
+        slabs = np.searchsorted(self.slab_bounds, points[:, 0], side='right') - 1
+
+        inside_slabs = np.flatnonzero((slabs >= 0) & (slabs < len(self.slab_offsets) - 1))
+        below, on_edge = self._search_slabs(points[inside_slabs], slabs[inside_slabs])
+        locations[inside_slabs[below % 2 == 1]] = INSIDE
+        boundary = np.zeros(len(points), dtype=bool)
+        boundary[inside_slabs] = on_edge
+
+        # Un point sur la borne gauche d'une bande peut être l'extrémité droite d'une arête de la bande précédente.
+        on_bounds = np.flatnonzero((slabs >= 1) & (self.slab_bounds[np.maximum(slabs, 0)] == points[:, 0]))
+        boundary[on_bounds] |= self._search_slabs(points[on_bounds], slabs[on_bounds] - 1)[1]
+        boundary |= self._on_verticals(points)
+
+        locations[boundary] = BOUNDARY
+        return locations
+
+    def locate(self, points, chunk_size=LOCATE_CHUNK_SIZE):
+        """
+        Localise des points par rapport au polygone, en O(log n) par point.
+
+        Args:
+            points (numpy.ndarray):
+                Points. (P, 2)
+            chunk_size (int):
+                Nombre de points localisés à la fois. (par défaut à LOCATE_CHUNK_SIZE)
+        Returns:
+            numpy.ndarray:
+                OUTSIDE (-1), BOUNDARY (0) ou INSIDE (1) pour chaque point (int8). (P)
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        locations = np.empty(len(points), dtype=np.int8)
+        for start in range(0, len(points), chunk_size):
+            locations[start:start + chunk_size] = self._locate_chunk(points[start:start + chunk_size])
+        return locations
+
+    def contains(self, points, boundary=False):
+        """
+        Vérifie quels points sont à l'intérieur du polygone.
+
+        Args:
+            points (numpy.ndarray):
+                Points. (P, 2)
+            boundary (bool):
+                Si True, les points du bord sont considérés comme intérieurs. (par défaut à False)
+        Returns:
+            numpy.ndarray:
+                Masque booléen. (P)
+        """
+        return self.locate(points) >= (BOUNDARY if boundary else INSIDE)
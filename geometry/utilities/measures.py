@@ -0,0 +1,145 @@
+"""
+Implémentation du calcul vectorisé de mesures sur des tampons de polygones.
+
+Les polygones sont donnés sous la forme de tampons contigus : coordonnées de
+tous les sommets (V, 2) et indices de début de chaque polygone, suivis de V
+(voir Collection.buffers()).
+"""
+
+from geometry.utilities.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+def successors(offsets):
+    """
+    Retourne, pour chaque sommet, l'indice du sommet suivant dans son polygone.
+
+    Args:
+        offsets (numpy.ndarray):
+            Indices de début de chaque polygone, suivis de V. (N + 1)
+    Returns:
+        numpy.ndarray:
+            Indices des sommets suivants ; le dernier sommet d'un polygone est suivi du premier. (V)
+    """
+    following = np.arange(1, offsets[-1] + 1, dtype=np.int64)
+    counts = np.diff(offsets)
+    non_empty = counts > 0
+    following[offsets[1:][non_empty] - 1] = offsets[:-1][non_empty]
+    return following
+
+
+def sum_by_polygon(values, offsets):
+    """
+    Somme des valeurs attachées aux sommets, polygone par polygone.
+
+    Args:
+        values (numpy.ndarray):
+            Valeur de chaque sommet. (V)
+        offsets (numpy.ndarray):
+            Indices de début de chaque polygone, suivis de V. (N + 1)
+    Returns:
+        numpy.ndarray:
+            Somme de chaque polygone, nulle si le polygone est vide. (N)
+    """
+    sums = np.zeros(len(offsets) - 1)
+    non_empty = np.diff(offsets) > 0
+    if non_empty.any():
+        sums[non_empty] = np.add.reduceat(values, offsets[:-1][non_empty])
+    return sums
+
+
+def signed_areas(coordinates, offsets):
+    """
+    Calcule l'aire signée de chaque polygone (formule du lacet).
+
+    Args:
+        coordinates (numpy.ndarray):
+            Coordonnées des sommets. (V, 2)
+        offsets (numpy.ndarray):
+            Indices de début de chaque polygone, suivis de V. (N + 1)
+    Returns:
+        numpy.ndarray:
+            Aires, positives pour les polygones parcourus dans le sens trigonométrique. (N)
+    """
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+    following = coordinates[successors(offsets)]
+    crosses = coordinates[:, 0] * following[:, 1] - coordinates[:, 1] * following[:, 0]
+    return sum_by_polygon(crosses, offsets) / 2
+
+
+def perimeters(coordinates, offsets):
+    """
+    Calcule le périmètre de chaque polygone.
+
+    Args:
+        coordinates (numpy.ndarray):
+            Coordonnées des sommets. (V, 2)
+        offsets (numpy.ndarray):
+            Indices de début de chaque polygone, suivis de V. (N + 1)
+    Returns:
+        numpy.ndarray:
+            Périmètres. (N)
+    """
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+    edges = coordinates[successors(offsets)] - coordinates
+    return sum_by_polygon(np.hypot(edges[:, 0], edges[:, 1]), offsets)
+
+
+def moments(coordinates, offsets):
+    """
+    Calcule, en une passe de type formule du lacet, l'aire, le centre de gravité et les
+    moments d'inertie centrés de chaque polygone, ainsi que l'orientation de son axe principal.
+
+    Les coordonnées de chaque polygone sont d'abord ramenées à son premier sommet, pour
+    limiter les pertes de précision loin de l'origine. Le sens de parcours est sans effet.
+
+    Args:
+        coordinates (numpy.ndarray):
+            Coordonnées des sommets. (V, 2)
+        offsets (numpy.ndarray):
+            Indices de début de chaque polygone, suivis de V. (N + 1)
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray):
+            - Aires. (N)
+            - Centres de gravité (N, 2), NaN pour les polygones d'aire nulle.
+            - Moments centrés (mu20, mu02, mu11) : intégrales de (x - cx)², (y - cy)² et
+              (x - cx)(y - cy) sur le polygone. mu02 et mu20 sont les moments d'inertie
+              par rapport aux axes horizontal et vertical passant par le centre. (N, 3)
+            - Angle en radians, dans ]-π/2, π/2], entre l'axe des abscisses et l'axe
+              principal de plus faible inertie (direction d'allongement). (N)
+    """
+    counts = np.diff(offsets)
+    owners = np.repeat(np.arange(len(counts)), counts)
+    origins = np.full((len(counts), 2), np.nan)
+    non_empty = counts > 0
+    origins[non_empty] = coordinates[offsets[:-1][non_empty]]
+
+    local = coordinates - origins[owners]
+    following = local[successors(offsets)]
+    x0, y0 = local[:, 0], local[:, 1]
+    x1, y1 = following[:, 0], following[:, 1]
+    crosses = x0 * y1 - x1 * y0
+
+    doubled_areas = sum_by_polygon(crosses, offsets)
+    sums = [sum_by_polygon(terms * crosses, offsets) for terms in (
+        x0 + x1, y0 + y1,
+        x0 * x0 + x0 * x1 + x1 * x1,
+        y0 * y0 + y0 * y1 + y1 * y1,
+        x0 * y1 + 2 * x0 * y0 + 2 * x1 * y1 + x1 * y0,
+    )]
+
+    areas = doubled_areas / 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        centers = np.stack([sums[0], sums[1]], axis=1) / (3 * doubled_areas)[:, None]
+    cx, cy = centers[:, 0], centers[:, 1]
+
+    # Théorème de Huygens : passage du premier sommet au centre de gravité
+    second_moments = np.stack([sums[2] / 12 - areas * cx * cx,
+                               sums[3] / 12 - areas * cy * cy,
+                               sums[4] / 24 - areas * cx * cy], axis=1)
+    second_moments *= np.sign(areas)[:, None]
+    orientations = np.arctan2(2 * second_moments[:, 2], second_moments[:, 0] - second_moments[:, 1]) / 2
+    orientations[orientations <= -np.pi / 2] += np.pi
+
+    return np.abs(areas), centers + origins, second_moments, orientations
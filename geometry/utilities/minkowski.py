@@ -0,0 +1,155 @@
+"""
+Implémentation de la somme de Minkowski de polygones convexes par fusion d'arêtes.
+
+Les arêtes d'un polygone convexe parcouru dans le sens trigonométrique à partir de son
+sommet d'ordonnée minimale (puis d'abscisse minimale) sont triées par angle polaire.
+Celles de la somme de deux polygones convexes sont la fusion de ces deux suites : le
+k-ième sommet de la somme est P[i] + Q[j], où i et j sont les nombres d'arêtes de P et
+de Q qui le précèdent dans la fusion. La fusion est calculée par rangs : le rang d'une
+arête de P parmi celles de Q est obtenu par recherche dichotomique dans le noyau Q,
+puis le rang des arêtes de Q se déduit de l'histogramme de ces rangs. Les sommets
+sont calculés directement, sans cumul d'erreurs d'arrondi.
+"""
+
+from geometry.utilities import collision, measures
+from geometry.utilities.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+def normalize(coordinates, offsets):
+    """
+    Prépare des polygones convexes pour la fusion d'arêtes : sommets parcourus dans le sens
+    trigonométrique, sans doublons consécutifs, à partir du sommet d'ordonnée minimale
+    (puis d'abscisse minimale).
+
+    Args:
+        coordinates (numpy.ndarray):
+            Coordonnées des sommets. (V, 2)
+        offsets (numpy.ndarray):
+            Indices de début de chaque polygone, suivis de V. (N + 1)
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray):
+            Nouvelles coordonnées (V', 2) et nouveaux indices de début (N + 1).
+    """
+    counts = np.diff(offsets)
+    owners = np.repeat(np.arange(len(counts)), counts)
+    local = np.arange(len(coordinates)) - offsets[owners]
+
+    # Les polygones parcourus dans le sens horaire sont retournés.
+    clockwise = measures.signed_areas(coordinates, offsets) < 0
+    local = np.where(clockwise[owners], counts[owners] - 1 - local, local)
+    coordinates = coordinates[offsets[owners] + local]
+
+    # Sommets répétés : seul le dernier de chaque suite est conservé, et au moins un par polygone.
+    keep = (coordinates != coordinates[measures.successors(offsets)]).any(axis=1)
+    kept_counts = np.bincount(owners, weights=keep, minlength=len(counts)).astype(np.int64)
+    keep[offsets[:-1][(kept_counts == 0) & (counts > 0)]] = True
+    coordinates, owners = coordinates[keep], owners[keep]
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(owners, minlength=len(counts)), out=offsets[1:])
+
+    # Rotation de chaque polygone vers son pivot
+    counts = np.diff(offsets)
+    non_empty = np.flatnonzero(counts > 0)
+    order = np.lexsort((coordinates[:, 0], coordinates[:, 1], owners))
+    pivots = np.zeros(len(counts), dtype=np.int64)
+    pivots[non_empty] = order[offsets[:-1][non_empty]] - offsets[:-1][non_empty]
+    local = np.arange(len(coordinates)) - offsets[owners]
+    return coordinates[offsets[owners] + (local + pivots[owners]) % counts[owners]], offsets
+
+
+def edge_angles(coordinates, offsets):
+    """
+    Retourne l'angle polaire, dans [0, 2π), de chaque arête de polygones normalisés (voir normalize()).
+    Un polygone réduit à un point n'a pas d'arête.
+
+    Args:
+        coordinates (numpy.ndarray):
+            Coordonnées des sommets. (V, 2)
+        offsets (numpy.ndarray):
+            Indices de début de chaque polygone, suivis de V. (N + 1)
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray):
+            Angles des arêtes (E), et masque des sommets origines d'une arête. (V)
+    """
+    counts = np.diff(offsets)
+    has_edge = np.repeat(counts > 1, counts)
+    edges = coordinates[measures.successors(offsets)] - coordinates
+    angles = np.arctan2(edges[has_edge, 1], edges[has_edge, 0])
+    angles[angles < 0] += 2 * np.pi
+    return angles, has_edge
+
+
+def minkowski_sums(coordinates, offsets, kernel):
+    """
+    Calcule la somme de Minkowski de chaque polygone convexe avec un même noyau convexe, en
+    O(V + N m) à une recherche dichotomique dans le noyau près.
+
+    Args:
+        coordinates (numpy.ndarray):
+            Coordonnées des sommets des polygones, dans un sens quelconque. (V, 2)
+        offsets (numpy.ndarray):
+            Indices de début de chaque polygone, suivis de V. (N + 1)
+        kernel (numpy.ndarray):
+            Sommets du noyau, dans un sens quelconque. (m, 2)
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray):
+            Coordonnées des sommets des sommes (V', 2), parcourues dans le sens trigonométrique,
+            et indices de début de chaque somme (N + 1). La somme d'un polygone vide est vide.
+    Raises:
+        ValueError:
+            Si un polygone ou le noyau n'est pas convexe, ou si le noyau a moins de 3 sommets distincts.
+    """
+    coordinates = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    kernel = np.asarray(kernel, dtype=np.float64).reshape(-1, 2)
+    kernel_offsets = np.array([0, len(kernel)])
+    if not collision.convex_mask(coordinates, offsets).all() or not collision.convex_mask(kernel, kernel_offsets)[0]:
+        raise ValueError("La somme de Minkowski n'est calculée que pour des polygones convexes !")
+
+    kernel, kernel_offsets = normalize(kernel, kernel_offsets)
+    if len(kernel) < 3:
+        raise ValueError("Nombre de sommets distincts minimal du noyau : 3 !")
+    kernel_angles, _ = edge_angles(kernel, kernel_offsets)
+    kernel_count = len(kernel)
+
+    coordinates, offsets = normalize(coordinates, offsets)
+    counts = np.diff(offsets)
+    angles, has_edge = edge_angles(coordinates, offsets)
+    edge_owners = np.repeat(np.arange(len(counts)), counts)[has_edge]
+    edge_local = (np.arange(len(coordinates)) - offsets[:-1].repeat(counts))[has_edge]
+
+    # Rangs dans la fusion : les arêtes du polygone passent avant les arêtes du noyau de même angle.
+    ranks = np.searchsorted(kernel_angles, angles, side='left')
+    histogram = np.bincount(edge_owners * (kernel_count + 1) + ranks, minlength=len(counts) * (kernel_count + 1))
+    preceding = np.cumsum(histogram.reshape(-1, kernel_count + 1), axis=1)[:, :kernel_count]
+
+    sums_counts = np.where(counts > 0, np.where(counts > 1, counts, 0) + kernel_count, 0)
+    sums_offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(sums_counts, out=sums_offsets[1:])
+
+    from_polygon = np.zeros(sums_offsets[-1], dtype=bool)
+    merged_angles = np.empty(sums_offsets[-1])
+    positions = sums_offsets[edge_owners] + edge_local + ranks
+    from_polygon[positions] = True
+    merged_angles[positions] = angles
+    non_empty = np.flatnonzero(counts > 0)
+    kernel_positions = (sums_offsets[non_empty, None] + np.arange(kernel_count) + preceding[non_empty]).ravel()
+    merged_angles[kernel_positions] = np.tile(kernel_angles, len(non_empty))
+
+    # Le sommet k est P[i] + Q[j], i et j étant les nombres d'arêtes de P et de Q qui le précèdent.
+    sums_owners = np.repeat(np.arange(len(counts)), sums_counts)
+    polygon_before = np.cumsum(from_polygon) - from_polygon
+    polygon_before -= polygon_before[sums_offsets[:-1]][sums_owners]
+    kernel_before = np.arange(sums_offsets[-1]) - sums_offsets[sums_owners] - polygon_before
+    vertices = (coordinates[offsets[sums_owners] + polygon_before % counts[sums_owners]]
+                + kernel[kernel_before % kernel_count])
+
+    # Les arêtes parallèles sont fusionnées : le sommet qui les sépare est retiré.
+    keep = np.ones(len(vertices), dtype=bool)
+    keep[1:] = merged_angles[1:] != merged_angles[:-1]
+    keep[sums_offsets[:-1][non_empty]] = True
+    sums_offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sums_owners[keep], minlength=len(counts)), out=sums_offsets[1:])
+    return vertices[keep], sums_offsets
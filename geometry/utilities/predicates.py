@@ -0,0 +1,251 @@
+"""
+Implémentation de prédicats géométriques robustes.
+
+Les prédicats d'orientation et d'inclusion dans un cercle sont d'abord évalués
+en arithmétique flottante. Si le résultat est trop proche de zéro pour que son
+signe soit certain, compte tenu d'une borne d'erreur a priori (Shewchuk), il
+est recalculé en arithmétique exacte à l'aide de fractions. Le signe retourné
+est donc toujours exact, pour des coordonnées flottantes finies.
+
+Les coordonnées entières inférieures à INTEGER_COORDINATE_LIMIT en valeur absolue
+sont traitées directement en arithmétique entière 64 bits, exacte à ces tailles.
+"""
+
+from fractions import Fraction
+
+from geometry.utilities.lazy import lazy_import
+from geometry.utilities.utils import sign
+
+np = lazy_import("numpy")
+
+# Epsilon machine de Shewchuk : 2^-53 pour des flottants double précision.
+EPSILON = 2. ** -53
+
+# Bornes d'erreur relatives des évaluations flottantes.
+ORIENTATION_ERROR_BOUND = (3. + 16. * EPSILON) * EPSILON
+INCIRCLE_ERROR_BOUND = (10. + 96. * EPSILON) * EPSILON
+
+# Borne des coordonnées entières : les produits de différences tiennent alors exactement dans un int64.
+INTEGER_COORDINATE_LIMIT = 2 ** 30
+
+
+def widen(coordinates):
+    """
+    Retourne des coordonnées dans le type de calcul des noyaux vectorisés : int64 pour des
+    coordonnées entières, dont les produits de différences sont alors exacts (si elles
+    restent sous INTEGER_COORDINATE_LIMIT), float64 sinon.
+
+    Args:
+        coordinates (numpy.ndarray):
+            Coordonnées. (..., 2)
+    Returns:
+        numpy.ndarray:
+            Coordonnées, copiées seulement si leur type change.
+    """
+    coordinates = np.asarray(coordinates)
+    if np.issubdtype(coordinates.dtype, np.integer):
+        return coordinates.astype(np.int64, copy=False)
+    return coordinates.astype(np.float64, copy=False)
+
+
+def within_integer_limit(*arrays):
+    """
+    Vérifie que des tableaux sont entiers et bornés par INTEGER_COORDINATE_LIMIT en valeur absolue.
+
+    Args:
+        arrays (numpy.ndarray):
+            Tableaux à vérifier.
+    Returns:
+        bool:
+            True si les calculs entiers 64 bits sur ces tableaux sont exacts.
+    """
+    limit = INTEGER_COORDINATE_LIMIT
+    return all(np.issubdtype(array.dtype, np.integer)
+               and (array.size == 0 or -limit < array.min() <= array.max() < limit) for array in arrays)
+
+
+def exact_orientation(ax, ay, bx, by, cx, cy):
+    """
+    Retourne le signe exact de l'orientation du triplet de points (a, b, c).
+
+    Args:
+        ax, ay, bx, by, cx, cy (float):
+            Coordonnées des points a, b et c.
+    Returns:
+        int:
+            1 si le tournant est à gauche, -1 s'il est à droite, 0 si les points sont alignés.
+    """
+    ax, ay, bx, by, cx, cy = map(Fraction, (ax, ay, bx, by, cx, cy))
+    return sign((ax - cx) * (by - cy) - (ay - cy) * (bx - cx))
+
+
+def orientation(ax, ay, bx, by, cx, cy):
+    """
+    Retourne le signe de l'orientation du triplet de points (a, b, c).
+    Le calcul flottant est filtré et repris en arithmétique exacte si nécessaire.
+
+    Args:
+        ax, ay, bx, by, cx, cy (float):
+            Coordonnées des points a, b et c.
+    Returns:
+        int:
+            1 si le tournant est à gauche, -1 s'il est à droite, 0 si les points sont alignés.
+    """
+    acx, bcy = ax - cx, by - cy
+    acy, bcx = ay - cy, bx - cx
+    left = acx * bcy
+    right = acy * bcx
+    determinant = left - right
+
+    if abs(determinant) > ORIENTATION_ERROR_BOUND * (abs(left) + abs(right)):
+        return sign(determinant)
+
+    # Une différence nulle est exacte : les deux produits le sont alors aussi.
+    if (acx == 0 or bcy == 0) and (acy == 0 or bcx == 0):
+        return 0
+
+    return exact_orientation(ax, ay, bx, by, cx, cy)
+
+
+def exact_incircle(ax, ay, bx, by, cx, cy, dx, dy):
+    """
+    Retourne le signe exact du prédicat d'inclusion du point d dans le cercle
+    passant par a, b et c.
+
+    Args:
+        ax, ay, bx, by, cx, cy, dx, dy (float):
+            Coordonnées des points a, b, c et d.
+    Returns:
+        int:
+            Si (a, b, c) est orienté à gauche : 1 si d est dans le cercle,
+            -1 s'il est à l'extérieur, 0 s'il est sur le cercle.
+            Les signes sont inversés si (a, b, c) est orienté à droite.
+    """
+    ax, ay, bx, by, cx, cy, dx, dy = map(Fraction, (ax, ay, bx, by, cx, cy, dx, dy))
+    adx, ady = ax - dx, ay - dy
+    bdx, bdy = bx - dx, by - dy
+    cdx, cdy = cx - dx, cy - dy
+
+    return sign((adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+                + (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy)
+                + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady))
+
+
+def incircle(ax, ay, bx, by, cx, cy, dx, dy):
+    """
+    Retourne le signe du prédicat d'inclusion du point d dans le cercle
+    passant par a, b et c.
+    Le calcul flottant est filtré et repris en arithmétique exacte si nécessaire.
+
+    Args:
+        ax, ay, bx, by, cx, cy, dx, dy (float):
+            Coordonnées des points a, b, c et d.
+    Returns:
+        int:
+            Si (a, b, c) est orienté à gauche : 1 si d est dans le cercle,
+            -1 s'il est à l'extérieur, 0 s'il est sur le cercle.
+            Les signes sont inversés si (a, b, c) est orienté à droite.
+    """
+    adx, ady = ax - dx, ay - dy
+    bdx, bdy = bx - dx, by - dy
+    cdx, cdy = cx - dx, cy - dy
+
+    alift = adx * adx + ady * ady
+    blift = bdx * bdx + bdy * bdy
+    clift = cdx * cdx + cdy * cdy
+
+    bdxcdy, cdxbdy = bdx * cdy, cdx * bdy
+    cdxady, adxcdy = cdx * ady, adx * cdy
+    adxbdy, bdxady = adx * bdy, bdx * ady
+
+    determinant = alift * (bdxcdy - cdxbdy) + blift * (cdxady - adxcdy) + clift * (adxbdy - bdxady)
+    permanent = (alift * (abs(bdxcdy) + abs(cdxbdy)) + blift * (abs(cdxady) + abs(adxcdy))
+                 + clift * (abs(adxbdy) + abs(bdxady)))
+
+    if abs(determinant) > INCIRCLE_ERROR_BOUND * permanent:
+        return sign(determinant)
+
+    return exact_incircle(ax, ay, bx, by, cx, cy, dx, dy)
+
+
+def orientations(a, b, c):
+    """
+    Retourne, élément par élément, le signe de l'orientation des triplets de points (a, b, c).
+    Seuls les éléments dont le signe flottant est incertain sont recalculés exactement ;
+    les coordonnées entières bornées sont traitées exactement en int64.
+
+    Args:
+        a, b, c (numpy.ndarray):
+            Coordonnées des points, diffusables entre elles. (..., 2)
+    Returns:
+        numpy.ndarray:
+            Signes (int8) : 1 si le tournant est à gauche, -1 s'il est à droite, 0 si les points sont alignés.
+    """
+    a, b, c = (np.asarray(points) for points in (a, b, c))
+    if within_integer_limit(a, b, c):
+        # Coordonnées entières : le déterminant est exact en int64.
+        a, b, c = np.broadcast_arrays(*(points.astype(np.int64, copy=False) for points in (a, b, c)))
+        determinant = ((a[..., 0] - c[..., 0]) * (b[..., 1] - c[..., 1])
+                       - (a[..., 1] - c[..., 1]) * (b[..., 0] - c[..., 0]))
+        return np.sign(determinant).astype(np.int8)
+
+    a, b, c = np.broadcast_arrays(*(points.astype(np.float64, copy=False) for points in (a, b, c)))
+    shape = a.shape[:-1]
+    a, b, c = (points.reshape(-1, 2) for points in (a, b, c))
+
+    acx, bcy = a[:, 0] - c[:, 0], b[:, 1] - c[:, 1]
+    acy, bcx = a[:, 1] - c[:, 1], b[:, 0] - c[:, 0]
+    left = acx * bcy
+    right = acy * bcx
+    determinant = left - right
+
+    signs = np.sign(determinant).astype(np.int8)
+    uncertain = np.abs(determinant) <= ORIENTATION_ERROR_BOUND * (np.abs(left) + np.abs(right))
+    # Une différence nulle est exacte : les deux produits le sont alors aussi.
+    uncertain &= ~(((acx == 0) | (bcy == 0)) & ((acy == 0) | (bcx == 0)))
+    for index in np.flatnonzero(uncertain):
+        signs[index] = exact_orientation(*a[index].tolist(), *b[index].tolist(), *c[index].tolist())
+
+    return signs.reshape(shape)
+
+
+def incircles(a, b, c, d):
+    """
+    Retourne, élément par élément, le signe du prédicat d'inclusion des points d
+    dans les cercles passant par a, b et c.
+    Seuls les éléments dont le signe flottant est incertain sont recalculés exactement.
+
+    Args:
+        a, b, c, d (numpy.ndarray):
+            Coordonnées des points, diffusables entre elles. (..., 2)
+    Returns:
+        numpy.ndarray:
+            Signes (int8), avec la même convention que incircle().
+    """
+    a, b, c, d = np.broadcast_arrays(*(np.asarray(points, dtype=np.float64) for points in (a, b, c, d)))
+    shape = a.shape[:-1]
+    a, b, c, d = (points.reshape(-1, 2) for points in (a, b, c, d))
+
+    adx, ady = a[:, 0] - d[:, 0], a[:, 1] - d[:, 1]
+    bdx, bdy = b[:, 0] - d[:, 0], b[:, 1] - d[:, 1]
+    cdx, cdy = c[:, 0] - d[:, 0], c[:, 1] - d[:, 1]
+
+    alift = adx * adx + ady * ady
+    blift = bdx * bdx + bdy * bdy
+    clift = cdx * cdx + cdy * cdy
+
+    bdxcdy, cdxbdy = bdx * cdy, cdx * bdy
+    cdxady, adxcdy = cdx * ady, adx * cdy
+    adxbdy, bdxady = adx * bdy, bdx * ady
+
+    determinant = alift * (bdxcdy - cdxbdy) + blift * (cdxady - adxcdy) + clift * (adxbdy - bdxady)
+    permanent = (alift * (np.abs(bdxcdy) + np.abs(cdxbdy)) + blift * (np.abs(cdxady) + np.abs(adxcdy))
+                 + clift * (np.abs(adxbdy) + np.abs(bdxady)))
+
+    signs = np.sign(determinant).astype(np.int8)
+    uncertain = np.abs(determinant) <= INCIRCLE_ERROR_BOUND * permanent
+    for index in np.flatnonzero(uncertain):
+        signs[index] = exact_incircle(*a[index].tolist(), *b[index].tolist(),
+                                      *c[index].tolist(), *d[index].tolist())
+
+    return signs.reshape(shape)
@@ -0,0 +1,203 @@
+"""
+Implémentation des transformations affines vectorisées sur des tampons de coordonnées.
+
+Une transformation affine est représentée par une matrice homogène (3, 3) (ou par
+ses deux premières lignes, (2, 3)) : un point (x, y) devient M @ (x, y, 1). Les
+constructeurs acceptent des paramètres scalaires ou des tableaux, et retournent
+alors une pile de matrices (N, 3, 3), une par polygone. Les matrices se composent
+par produit matriciel : (B @ A) applique A puis B.
+"""
+
+from geometry.utilities.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+def identities(shape):
+    """
+    Retourne une pile de matrices identité.
+
+    Args:
+        shape (tuple):
+            Forme de la pile.
+    Returns:
+        numpy.ndarray:
+            Matrices identité. (*shape, 3, 3)
+    """
+    matrices = np.zeros(tuple(shape) + (3, 3))
+    matrices[..., [0, 1, 2], [0, 1, 2]] = 1.
+    return matrices
+
+
+def centers_array(center, shape):
+    """
+    Retourne les centres des transformations, diffusés à la forme des autres paramètres.
+
+    Args:
+        center (tuple(float, float) | numpy.ndarray):
+            Centre, ou centres (..., 2). (None pour l'origine)
+        shape (tuple):
+            Forme des autres paramètres.
+    Returns:
+        tuple(tuple, numpy.ndarray, numpy.ndarray):
+            Forme commune, abscisses et ordonnées des centres.
+    """
+    center = np.zeros(2) if center is None else np.asarray(center, dtype=np.float64)
+    if center.shape[-1:] != (2,):
+        raise ValueError("Un centre doit être un couple de coordonnées !")
+    shape = np.broadcast_shapes(tuple(shape), center.shape[:-1])
+    return shape, np.broadcast_to(center[..., 0], shape), np.broadcast_to(center[..., 1], shape)
+
+
+def translation(dx, dy):
+    """
+    Retourne la matrice d'une translation.
+
+    Args:
+        dx (float | numpy.ndarray):
+            Déplacement horizontal, ou un par polygone.
+        dy (float | numpy.ndarray):
+            Déplacement vertical, ou un par polygone.
+    Returns:
+        numpy.ndarray:
+            Matrice (3, 3), ou pile de matrices (N, 3, 3).
+    """
+    dx, dy = np.broadcast_arrays(np.asarray(dx, dtype=np.float64), np.asarray(dy, dtype=np.float64))
+    matrices = identities(dx.shape)
+    matrices[..., 0, 2] = dx
+    matrices[..., 1, 2] = dy
+    return matrices
+
+
+def rotation(angle, center=None):
+    """
+    Retourne la matrice d'une rotation.
+
+    Args:
+        angle (float | numpy.ndarray):
+            Angle en radians, dans le sens trigonométrique, ou un par polygone.
+        center (tuple(float, float) | numpy.ndarray):
+            Centre de la rotation, ou un par polygone (N, 2). (par défaut à l'origine)
+    Returns:
+        numpy.ndarray:
+            Matrice (3, 3), ou pile de matrices (N, 3, 3).
+    Raises:
+        ValueError:
+            Si un centre n'est pas un couple de coordonnées.
+    """
+    angle = np.asarray(angle, dtype=np.float64)
+    shape, x, y = centers_array(center, angle.shape)
+    cosines, sines = np.broadcast_to(np.cos(angle), shape), np.broadcast_to(np.sin(angle), shape)
+
+    matrices = identities(shape)
+    matrices[..., 0, 0], matrices[..., 0, 1] = cosines, -sines
+    matrices[..., 1, 0], matrices[..., 1, 1] = sines, cosines
+    # Le centre est un point fixe de la rotation.
+    matrices[..., 0, 2] = x - cosines * x + sines * y
+    matrices[..., 1, 2] = y - sines * x - cosines * y
+    return matrices
+
+
+def scaling(sx, sy=None, center=None):
+    """
+    Retourne la matrice d'une mise à l'échelle.
+
+    Args:
+        sx (float | numpy.ndarray):
+            Facteur horizontal, ou un par polygone.
+        sy (float | numpy.ndarray):
+            Facteur vertical, ou un par polygone. (par défaut à sx)
+        center (tuple(float, float) | numpy.ndarray):
+            Centre de la mise à l'échelle, ou un par polygone (N, 2). (par défaut à l'origine)
+    Returns:
+        numpy.ndarray:
+            Matrice (3, 3), ou pile de matrices (N, 3, 3).
+    Raises:
+        ValueError:
+            Si un centre n'est pas un couple de coordonnées.
+    """
+    sx, sy = np.broadcast_arrays(np.asarray(sx, dtype=np.float64),
+                                 np.asarray(sx if sy is None else sy, dtype=np.float64))
+    shape, x, y = centers_array(center, sx.shape)
+    sx, sy = np.broadcast_to(sx, shape), np.broadcast_to(sy, shape)
+
+    matrices = identities(shape)
+    matrices[..., 0, 0], matrices[..., 1, 1] = sx, sy
+    matrices[..., 0, 2] = x - sx * x
+    matrices[..., 1, 2] = y - sy * y
+    return matrices
+
+
+def affine_part(matrices):
+    """
+    Vérifie des matrices de transformation et retourne leurs deux premières lignes.
+
+    Args:
+        matrices (numpy.ndarray):
+            Matrice (2, 3) ou (3, 3), ou pile de matrices (N, 2, 3) ou (N, 3, 3).
+    Returns:
+        numpy.ndarray:
+            Parties affines des matrices (float64). (2, 3) ou (N, 2, 3)
+    Raises:
+        ValueError:
+            Si les matrices n'ont pas une forme prise en charge, ou si une matrice (3, 3)
+            n'est pas affine (dernière ligne différente de (0, 0, 1)).
+    """
+    matrices = np.asarray(matrices, dtype=np.float64)
+    if matrices.ndim not in (2, 3) or matrices.shape[-2:] not in ((2, 3), (3, 3)):
+        raise ValueError("Les matrices doivent être de forme (2, 3) ou (3, 3), éventuellement empilées !")
+    if matrices.shape[-2] == 3 and np.any(matrices[..., 2, :] != (0., 0., 1.)):
+        raise ValueError("Seules les transformations affines sont prises en charge !")
+    return matrices[..., :2, :]
+
+
+def axis_aligned(matrices):
+    """
+    Vérifie quelles transformations conservent les rectangles alignés sur les axes et l'ordre
+    de leurs sommets : translations et mises à l'échelle de facteurs strictement positifs.
+
+    Args:
+        matrices (numpy.ndarray):
+            Parties affines des matrices. (2, 3) ou (N, 2, 3)
+    Returns:
+        bool | numpy.ndarray:
+            Vrai pour chaque transformation qui conserve les rectangles.
+    """
+    return ((matrices[..., 0, 1] == 0) & (matrices[..., 1, 0] == 0)
+            & (matrices[..., 0, 0] > 0) & (matrices[..., 1, 1] > 0))
+
+
+def apply(coordinates, matrices, offsets=None):
+    """
+    Applique des transformations affines à des coordonnées, en un seul produit matriciel.
+
+    Args:
+        coordinates (numpy.ndarray):
+            Coordonnées des sommets. (V, 2)
+        matrices (numpy.ndarray):
+            Matrice (2, 3) ou (3, 3) appliquée à tous les sommets, ou une matrice par polygone
+            (N, 2, 3) ou (N, 3, 3).
+        offsets (numpy.ndarray):
+            Indices de début de chaque polygone, suivis de V. (N + 1)
+            (obligatoire avec une matrice par polygone)
+    Returns:
+        numpy.ndarray:
+            Nouvelles coordonnées. (V, 2)
+    Raises:
+        ValueError:
+            Si les matrices ne sont pas valides, ou si leur nombre ne correspond pas aux polygones.
+    """
+    coordinates = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+    matrices = affine_part(matrices)
+
+    if matrices.ndim == 2:
+        transformed = coordinates @ matrices[:, :2].T
+        transformed += matrices[:, 2]
+        return transformed
+
+    if offsets is None or len(matrices) != len(offsets) - 1:
+        raise ValueError("Il faut une matrice par polygone !")
+    per_vertex = np.repeat(matrices, np.diff(offsets), axis=0)
+    transformed = np.einsum('vij,vj->vi', per_vertex[:, :, :2], coordinates)
+    transformed += per_vertex[:, :, 2]
+    return transformed
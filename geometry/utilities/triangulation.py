@@ -0,0 +1,182 @@
+"""
+Implémentation de la triangulation de polygones simples par découpage d'oreilles.
+
+Une oreille est un triangle formé de trois sommets consécutifs, tourné à gauche
+et ne contenant aucun autre sommet du polygone. Tout polygone simple d'au moins
+quatre sommets possède au moins deux oreilles : les retirer une à une produit
+une triangulation de n - 2 triangles.
+
+Un polygone qui se recoupe peut lui aussi présenter des oreilles : sa simplicité
+est donc vérifiée avant le découpage.
+"""
+
+from geometry.segment import SegmentArray
+from geometry.utilities import predicates
+from geometry.utilities.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# Nombre d'arêtes comparées à toutes les autres à la fois lors du test de simplicité
+SIMPLICITY_BLOCK_SIZE = 256
+
+
+def is_simple(coordinates, block_size=SIMPLICITY_BLOCK_SIZE):
+    """
+    Vérifie qu'un polygone est simple : deux arêtes non consécutives ne se touchent pas.
+    Les sommets répétés consécutivement sont ignorés. Les arêtes sont comparées par blocs,
+    en O(n²) opérations et O(block_size x n) mémoire.
+
+    Args:
+        coordinates (numpy.ndarray):
+            Sommets du polygone. (n, 2)
+        block_size (int):
+            Nombre d'arêtes comparées à la fois. (par défaut à SIMPLICITY_BLOCK_SIZE)
+    Returns:
+        bool:
+            True si le polygone est simple, False sinon.
+    """
+    points = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+    points = points[(points != np.roll(points, 1, axis=0)).any(axis=1)]
+    vertices_count = len(points)
+    if vertices_count < 4:
+        return True
+
+    edges = SegmentArray.from_polygon(points)
+    positions = np.arange(vertices_count)
+    for start in range(0, vertices_count, block_size):
+        touching = edges[start:start + block_size].intersects(edges)
+        # Écart entre les indices des arêtes : les arêtes consécutives partagent un sommet.
+        gaps = (positions[None, :] - positions[start:start + block_size, None]) % vertices_count
+        if (touching & (gaps > 1) & (gaps < vertices_count - 1)).any():
+            return False
+    return True
+
+
+def triangulate(coordinates):
+    """
+    Triangule un polygone simple par découpage d'oreilles.
+    Les sommets alignés sont retirés sans produire de triangle.
+
+    Args:
+        coordinates (numpy.ndarray):
+            Sommets du polygone, dans un sens quelconque. (n, 2)
+    Returns:
+        numpy.ndarray:
+            Indices des sommets de chaque triangle, dans le sens trigonométrique. (T, 3)
+    Raises:
+        ValueError:
+            Si le polygone n'est pas simple (voir is_simple()).
+    """
+    if not is_simple(coordinates):
+        raise ValueError("Le polygone n'est pas simple : triangulation impossible !")
+
+    points = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2).tolist()
+    remaining = list(range(len(points)))
+
+    # Les sommets sont parcourus dans le sens trigonométrique.
+    doubled_area = sum(x1 * y2 - x2 * y1 for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1]))
+    if doubled_area < 0:
+        remaining.reverse()
+
+    def turn(first, second, third):
+        return predicates.orientation(*points[first], *points[second], *points[third])
+
+    def is_ear(position):
+        previous, current, following = (remaining[(position + offset) % len(remaining)] for offset in (-1, 0, 1))
+        corners = {tuple(points[previous]), tuple(points[current]), tuple(points[following])}
+        for other in remaining:
+            if tuple(points[other]) in corners:
+                continue
+            if turn(previous, current, other) >= 0 and turn(current, following, other) >= 0 \
+                    and turn(following, previous, other) >= 0:
+                return False
+        return True
+
+    triangles = []
+    position = 0
+    attempts = 0
+    while len(remaining) >= 3:
+        if attempts > len(remaining):
+            raise ValueError("Le polygone n'est pas simple : triangulation impossible !")
+
+        previous, current, following = (remaining[(position + offset) % len(remaining)] for offset in (-1, 0, 1))
+        orientation = turn(previous, current, following)
+
+        if orientation == 0:
+            # Sommet aligné (ou doublon) : retiré sans triangle.
+            del remaining[position]
+        elif orientation > 0 and is_ear(position):
+            triangles.append((previous, current, following))
+            del remaining[position]
+        else:
+            position += 1
+            attempts += 1
+            position %= len(remaining)
+            continue
+
+        attempts = 0
+        position %= max(len(remaining), 1)
+
+    return np.array(triangles, dtype=np.int64).reshape(-1, 3)
+
+
+def triangle_areas(triangles):
+    """
+    Retourne l'aire de chaque triangle.
+
+    Args:
+        triangles (numpy.ndarray):
+            Sommets de chaque triangle. (T, 3, 2)
+    Returns:
+        numpy.ndarray:
+            Aires non signées. (T)
+    """
+    first = triangles[:, 1] - triangles[:, 0]
+    second = triangles[:, 2] - triangles[:, 0]
+    return np.abs(first[:, 0] * second[:, 1] - first[:, 1] * second[:, 0]) / 2
+
+
+def sample_triangles(triangles, count, rng=None, cumulative=None):
+    """
+    Tire des points uniformément répartis dans une union de triangles.
+    Chaque point tombe dans un triangle choisi proportionnellement à son aire,
+    puis est placé par coordonnées barycentriques uniformes.
+
+    Args:
+        triangles (numpy.ndarray):
+            Sommets de chaque triangle. (T, 3, 2)
+        count (int):
+            Nombre de points à tirer. (≥ 0)
+        rng (numpy.random.Generator | int, optional):
+            Générateur aléatoire, ou graine. (par défaut à None)
+        cumulative (numpy.ndarray, optional):
+            Aires cumulées des triangles, si elles ont déjà été calculées. (T)
+    Returns:
+        numpy.ndarray:
+            Points tirés. (count, 2)
+    Raises:
+        ValueError:
+            Si le nombre de points est négatif, ou si l'aire totale est nulle.
+    """
+    if count < 0:
+        raise ValueError("Le nombre de points doit être positif !")
+    if cumulative is None:
+        cumulative = np.cumsum(triangle_areas(triangles))
+    if len(cumulative) == 0 or cumulative[-1] <= 0:
+        raise ValueError("Aire nulle : aucun point ne peut être tiré !")
+
+    rng = np.random.default_rng(rng)
+
+    # Choix des triangles, pondéré par leur aire
+    chosen = np.searchsorted(cumulative, rng.random(count) * cumulative[-1], side='right')
+    np.minimum(chosen, len(cumulative) - 1, out=chosen)
+
+    # Coordonnées barycentriques : les tirages hors du triangle sont repliés à l'intérieur.
+    weights = rng.random((count, 2))
+    outside = weights.sum(axis=1) > 1
+    weights[outside] = 1 - weights[outside]
+
+    origins = triangles[chosen, 0]
+    return (origins
+            + weights[:, :1] * (triangles[chosen, 1] - origins)
+            + weights[:, 1:] * (triangles[chosen, 2] - origins))
@@ -16,4 +16,4 @@ def sign(value):
             1 si la valeur est supérieure à 0.
             -1 si la valeur est inférieure à 0.
     """
-    return (value > 0) - (value < 0)
+    return int(value > 0) - int(value < 0)
@@ -2,7 +2,6 @@
 Implémentation de l'objet Point dans un espace à deux dimensions.
 """
 
-import importlib
 import random
 from math import sqrt, atan2
 
@@ -112,8 +111,9 @@ class Vertice:
             return self.x * other.y - self.y * other.x
 
         # Produit vectoriel avec un segment
-        segment = importlib.import_module("geometry.segment").Segment
-        if isinstance(other, segment):
+        # Import local : le module segment importe lui-même ce module.
+        from geometry.segment import Segment
+        if isinstance(other, Segment):
             return self * other.vector()
 
         # Autre opérande non autorisé
@@ -268,14 +268,13 @@ class Vertice:
         Returns:
             float:
                 Distance euclidienne entre les deux points.
+
+        Voir aussi geometry.utilities.distances pour le calcul par lots.
         """
         if other is None:
-            other = Vertice()
-
-        # Rend la fonction symétrique
-        if self < other:
-            return other.distance_to(self)
+            return sqrt(self.x ** 2 + self.y ** 2)
 
+        # Les carrés des différences sont exactement symétriques.
         return sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2)
 
     def angle(self, center=None):
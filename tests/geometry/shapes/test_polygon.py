@@ -1,10 +1,15 @@
+import pickle
 import unittest
 
 import sys
 
 print(sys.path)
 
+import numpy as np
+
 from geometry.shapes.polygon import Polygon
+from geometry.shapes.rectangle import Rectangle
+from geometry.utilities import collision
 from geometry.vertice import Vertice
 
 
@@ -66,6 +71,122 @@ class PolygonTests(unittest.TestCase):
         convex_hull = self.polygon2.convex_hull()
         self.assertEqual(convex_hull.vertices, self.polygon2.vertices)
 
+    def test_polygon_convex_hull_removes_interior_and_collinear_vertices(self):
+        polygon = Polygon([Vertice(1, 1), Vertice(2, 0), Vertice(0, 2), Vertice(2, 2), Vertice(1, 0),
+                           Vertice(0, 0), Vertice(1, 1.5)])
+        convex_hull = polygon.convex_hull()
+        self.assertEqual(convex_hull.vertices, [Vertice(0, 0), Vertice(2, 0), Vertice(2, 2), Vertice(0, 2)])
+
+    def test_polygon_convex_hull_is_convex(self):
+        convex_hull = Polygon.random(vertices_count=50).convex_hull()
+        self.assertTrue(convex_hull.is_convex())
+
+    def test_polygon_diameter_and_width(self):
+        polygon = Polygon([Vertice(0, 0), Vertice(4, 0), Vertice(4, 3), Vertice(0, 3), Vertice(1, 1)])
+        self.assertEqual(polygon.diameter(), 5.)
+        self.assertEqual(polygon.width(), 3.)
+        self.assertEqual(Polygon().diameter(), 0.)
+
+    def test_polygon_min_area_rect_contains_polygon(self):
+        polygon = Polygon.random(vertices_count=30)
+        rectangle = polygon.min_area_rect()
+        self.assertEqual(len(rectangle), 4)
+        self.assertTrue(rectangle.is_convex())
+
+        # Chaque sommet de l'enveloppe est dans le rectangle, ou sur l'un de ses bords.
+        hull = polygon.convex_hull().coordinates()
+        corners = rectangle.coordinates()
+        edges = np.roll(corners, -1, axis=0) - corners
+        relative = hull[:, None, :] - corners[None, :, :]
+        ratios = np.clip((relative * edges).sum(axis=2) / (edges * edges).sum(axis=1), 0, 1)
+        boundary_distances = np.linalg.norm(relative - ratios[:, :, None] * edges, axis=2).min(axis=1)
+        inside = collision.points_in_polygon(hull, corners) | (boundary_distances < 1e-6)
+        self.assertTrue(inside.all())
+
+        # L'aire est minimale parmi les rectangles ayant un côté porté par une arête de l'enveloppe.
+        hull_edges = np.roll(hull, -1, axis=0) - hull
+        directions = hull_edges / np.linalg.norm(hull_edges, axis=1)[:, None]
+        normals = directions @ np.array([[0., 1.], [-1., 0.]])
+        expected = min(np.ptp(hull @ direction) * np.ptp(hull @ normal) for direction, normal in zip(directions, normals))
+        self.assertAlmostEqual(abs(rectangle.area()), expected, delta=expected * 1e-9)
+
+    def test_polygon_build_locator(self):
+        polygon = Polygon.random(vertices_count=12, simplify=True)
+        points = polygon.sample_points(500, rng=1)
+        self.assertTrue(polygon.build_locator().contains(points, boundary=True).all())
+        with self.assertRaises(ValueError):
+            Polygon().build_locator()
+
+    def test_polygon_sample_points_are_reproducible_and_inside(self):
+        polygon = Polygon.random(vertices_count=12, simplify=True)
+        points = polygon.sample_points(1000, rng=3)
+        np.testing.assert_array_equal(points, polygon.sample_points(1000, rng=3))
+        self.assertTrue(collision.points_in_polygon(points, polygon.coordinates()).all())
+
+    def test_polygon_triangulation_is_refreshed_when_vertices_change(self):
+        polygon = Polygon([Vertice(0, 0), Vertice(2, 0), Vertice(0, 2)])
+        self.assertEqual(len(polygon.triangulate()), 1)
+        polygon.add_vertice(Vertice(2, 2), simplify=True)
+        self.assertEqual(len(polygon.triangulate()), 2)
+        self.assertNotIn('_triangulation', pickle.loads(pickle.dumps(polygon)).__dict__)
+
+    def test_polygon_transforms(self):
+        translated = self.polygon2.translate(1, 2)
+        self.assertEqual(translated.vertices, [Vertice(1, 2), Vertice(2, 2), Vertice(1, 3)])
+        self.assertEqual(self.polygon2.vertices, [Vertice(0, 0), Vertice(1, 0), Vertice(0, 1)])
+        np.testing.assert_allclose(self.polygon2.rotate(np.pi, center=(0.5, 0.5)).coordinates(),
+                                   [[1, 1], [0, 1], [1, 0]], atol=1e-12)
+        self.assertEqual(self.polygon2.scale(2, 3).vertices, [Vertice(0, 0), Vertice(2, 0), Vertice(0, 3)])
+
+        self.assertIs(self.polygon2.scale(2, inplace=True), self.polygon2)
+        self.assertEqual(self.polygon2.area(), 2)
+        with self.assertRaises(ValueError):
+            self.polygon2.transform(np.stack([np.eye(3), np.eye(3)]))
+
+    def test_polygon_centroid_is_weighted_by_area(self):
+        # Les sommets sont concentrés sur un bord : leur moyenne n'est pas le centre de gravité.
+        polygon = Polygon([Vertice(0, 0), Vertice(1, 0), Vertice(2, 0), Vertice(3, 0), Vertice(4, 0),
+                           Vertice(4, 4), Vertice(0, 4)])
+        self.assertEqual(polygon.center(), Vertice(2, 8 / 7))
+        self.assertEqual(polygon.centroid(), Vertice(2, 2))
+        area, _, second_moments, orientation = polygon.moments()
+        self.assertEqual(area, 16)
+        np.testing.assert_allclose(second_moments, [256 / 12, 256 / 12, 0], atol=1e-12)
+
+    def test_polygon_minkowski_sum(self):
+        square = Polygon([Vertice(0, 0), Vertice(0, 1), Vertice(1, 1), Vertice(1, 0)])
+        result = square.minkowski_sum(self.polygon2)
+        self.assertEqual(result.vertices, [Vertice(0, 0), Vertice(2, 0), Vertice(2, 1), Vertice(1, 2), Vertice(0, 2)])
+        with self.assertRaises(ValueError):
+            self.complex_non_convex_polygon.minkowski_sum(square)
+        with self.assertRaises(TypeError):
+            square.minkowski_sum(Vertice(0, 0))
+
+    def test_polygon_random_convex_has_exact_vertices_count(self):
+        polygon = Polygon.random(vertices_count=25, convex=True)
+        self.assertEqual(len(polygon), 25)
+        self.assertTrue(polygon.is_convex())
+        self.assertEqual(len(polygon.convex_hull()), 25)
+
+    def test_polygon_random_convex_has_integer_vertices_in_space(self):
+        space = Rectangle(Vertice(0.5, 2.5), 10.2, 20.7)
+        polygon = Polygon.random(space, 6, convex=True)
+        for vertice in polygon.vertices:
+            self.assertEqual((vertice.x, vertice.y), (round(vertice.x), round(vertice.y)))
+            self.assertTrue(1 <= vertice.x <= 21 and 3 <= vertice.y <= 12)
+        self.assertEqual(len(polygon.convex_hull()), 6)
+        with self.assertRaises(ValueError):
+            Polygon.random(Rectangle(Vertice(), 2, 2), 8, convex=True)
+
+    def test_is_convex_with_nearly_collinear_vertices(self):
+        polygon = Polygon([Vertice(0.5, 0.5), Vertice(12, 12), Vertice(24, 24 - 2 ** -48), Vertice(0, 24)])
+        self.assertFalse(polygon.is_convex())
+
+    def test_polygon_pickle_round_trip(self):
+        restored = pickle.loads(pickle.dumps(self.polygon))
+        self.assertIsInstance(restored, Polygon)
+        self.assertEqual(restored.vertices, self.polygon.vertices)
+
     def test_polygon_random_creates_polygon_with_correct_number_of_vertices(self):
         random_polygon = Polygon.random(vertices_count=5)
         self.assertEqual(len(random_polygon.vertices), 5)
@@ -74,6 +195,12 @@ class PolygonTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             Polygon.random(vertices_count=2)
 
+    def test_coordinates_with_integer_type(self):
+        polygon = Polygon([Vertice(0, 0), Vertice(3.7, 0), Vertice(0, -2.5)])
+        coordinates = polygon.coordinates(np.int32)
+        self.assertEqual(coordinates.dtype, np.int32)
+        self.assertEqual(coordinates.tolist(), [[0, 0], [3, 0], [0, -2]])
+
     def test_largest_interior_rectangle_with_square_polygon4(self):
         rectangle = self.polygon4.largestinteriorrectangle()
         self.assertEqual(rectangle[0], Vertice(0, 0))
@@ -1,6 +1,10 @@
 import unittest
 
-from geometry.shapes.rectangle import Rectangle
+import numpy as np
+
+from geometry.collection import Collection
+from geometry.shapes.polygon import Polygon
+from geometry.shapes.rectangle import Rectangle, RectangleArray
 from geometry.vertice import Vertice
 
 
@@ -80,5 +84,87 @@ class RectangleTests(unittest.TestCase):
             Rectangle.random(space="not a rectangle")
 
 
+    def test_rectangle_transforms_keep_axis_aligned_rectangles(self):
+        scaled = self.rectangle.scale(2, 0.5, center=(1, 2))
+        self.assertIsInstance(scaled, Rectangle)
+        self.assertEqual(repr(scaled), "Rectangle(Vertice(1.0, 2.0), 1.5, 8.0)")
+        self.assertEqual(scaled.vertices[2], Vertice(9, 3.5))
+
+        rotated = self.rectangle.rotate(np.pi / 4)
+        self.assertIs(type(rotated), Polygon)
+        self.assertAlmostEqual(rotated.area(), self.length * self.width)
+
+        self.rectangle.translate(-1, -2, inplace=True)
+        self.assertEqual(repr(self.rectangle), "Rectangle(Vertice(0.0, 0.0), 3.0, 4.0)")
+        with self.assertRaises(ValueError):
+            self.rectangle.rotate(1., inplace=True)
+
+    def test_rectangle_scaled_by_zero_is_a_polygon(self):
+        flattened = self.rectangle.scale(0, 1)
+        self.assertIs(type(flattened), Polygon)
+        self.assertEqual(flattened.area(), 0)
+        with self.assertRaises(ValueError):
+            self.rectangle.scale(0, inplace=True)
+
+
+
+class RectangleArrayTests(unittest.TestCase):
+
+    def setUp(self):
+        self.rectangles = RectangleArray.from_bounds([[0, 0, 2, 2], [1, 1, 3, 4], [5, 5, 6, 6], [2, 0, 3, 1]])
+
+    def test_rectangle_array_rejects_invalid_arrays(self):
+        with self.assertRaises(ValueError):
+            RectangleArray([0, 1], [0], [1, 1], [1, 1])
+        with self.assertRaises(ValueError):
+            RectangleArray([0], [0], [-1], [1])
+
+    def test_rectangle_array_areas_and_contains(self):
+        self.assertEqual(self.rectangles.areas().tolist(), [4, 6, 1, 1])
+        contains = self.rectangles.contains([[2, 2], [5.5, 5.5], [10, 10]])
+        self.assertEqual(contains.tolist(), [[True, False, False], [True, False, False],
+                                             [False, True, False], [False, False, False]])
+
+    def test_rectangle_array_sparse_contains_and_intersection_areas(self):
+        rng = np.random.default_rng(1)
+        points = rng.uniform(0, 7, (50, 2))
+        dense = self.rectangles.contains(points)
+        for block_size in (1, 60, 10 ** 6):
+            self.assertEqual(self.rectangles.contains(points, block_size=block_size).tolist(),
+                             np.argwhere(dense).tolist())
+
+        others = RectangleArray.from_bounds([[1, 1, 2, 2], [4, 4, 8, 8], [10, 10, 11, 11]])
+        dense = self.rectangles.intersection_areas(others)
+        pairs, areas = self.rectangles.intersection_areas(others, block_size=2)
+        self.assertEqual(pairs.tolist(), np.argwhere(dense > 0).tolist())
+        np.testing.assert_allclose(areas, dense[dense > 0])
+
+    def test_rectangle_array_overlaps_match_intersection_areas(self):
+        rng = np.random.default_rng(0)
+        corners = rng.uniform(0, 100, (300, 2))
+        rectangles = RectangleArray(corners[:, 0], corners[:, 1], *rng.uniform(0, 10, (2, 300)))
+        expected = np.triu(rectangles.intersection_areas(rectangles), 1)
+
+        pairs, areas = rectangles.overlaps()
+        self.assertEqual(pairs.tolist(), np.argwhere(expected > 0).tolist())
+        np.testing.assert_allclose(areas, expected[expected > 0])
+
+        pairs, areas = self.rectangles.overlaps(rectangles, block_size=500)
+        dense = self.rectangles.intersection_areas(rectangles)
+        self.assertEqual(pairs.tolist(), np.argwhere(dense > 0).tolist())
+        np.testing.assert_allclose(areas, dense[dense > 0])
+
+    def test_rectangle_array_collection_round_trip(self):
+        collection = self.rectangles.to_collection()
+        self.assertEqual(repr(collection[1]), "Rectangle(Vertice(1.0, 1.0), 3.0, 2.0)")
+        self.assertEqual(repr(self.rectangles[1]), repr(collection[1]))
+        np.testing.assert_array_equal(collection.bounds(), self.rectangles.bounds())
+
+        rectangles = RectangleArray.from_collection(Collection([Rectangle(Vertice(1, 2), 3, 4)]))
+        self.assertEqual(repr(rectangles), "RectangleArray([1.0], [2.0], [4.0], [3.0])")
+        with self.assertRaises(ValueError):
+            RectangleArray.from_collection(Collection([Polygon([Vertice(0, 0), Vertice(1, 0), Vertice(0, 1)])]))
+
+
 if __name__ == '__main__':
     unittest.main()
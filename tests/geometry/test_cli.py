@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from io import StringIO
+
+from geometry import cli, formats
+
+
+class CliTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.text = os.path.join(self.directory.name, "shapes.poly")
+        self.binary = os.path.join(self.directory.name, "shapes.polyb")
+        cli.main(["generate", "--count", "20", "--type", "convex", "--placement", "grid", "--seed", "1",
+                  "-o", self.text])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def read(self, path):
+        with open(path, "rb") as file:
+            return file.read()
+
+    def test_generate_is_reproducible(self):
+        cli.main(["generate", "--count", "20", "--type", "convex", "--placement", "grid", "--seed", "1",
+                  "-o", self.path("again.poly")])
+        self.assertEqual(self.read(self.text), self.read(self.path("again.poly")))
+
+    def test_convert_round_trip(self):
+        cli.main(["convert", self.text, "-o", self.binary])
+        self.assertTrue(self.read(self.binary).startswith(formats.MAGIC))
+        cli.main(["convert", self.binary, "-o", self.path("back.poly"), "--chunk-size", "3"])
+        self.assertEqual(self.read(self.text), self.read(self.path("back.poly")))
+
+    def test_stats_summary_counts_polygons(self):
+        cli.main(["stats", self.text, "--summary", "-o", self.path("stats.txt")])
+        lines = self.read(self.path("stats.txt")).decode().splitlines()
+        self.assertEqual(lines[0], "polygons 20")
+        self.assertEqual(lines[3], "convex 20")
+
+    def test_stats_with_workers_matches_serial(self):
+        cli.main(["stats", self.text, "--chunk-size", "4", "-o", self.path("serial.txt")])
+        cli.main(["stats", self.text, "--chunk-size", "4", "--workers", "2", "-o", self.path("parallel.txt")])
+        self.assertEqual(self.read(self.path("serial.txt")), self.read(self.path("parallel.txt")))
+        self.assertEqual(len(self.read(self.path("serial.txt")).splitlines()), 21)
+
+    def test_clip_keeps_polygons_inside_window(self):
+        cli.main(["clip", self.text, "--window", "0", "0", "640", "360", "-o", self.path("clipped.polyb")])
+        with open(self.path("clipped.polyb"), "rb") as file:
+            for coordinates, _ in formats.read_binary(file):
+                self.assertTrue((coordinates >= 0).all())
+                self.assertTrue((coordinates <= [640, 360]).all())
+
+    def test_profile_prints_phases(self):
+        errors = StringIO()
+        with redirect_stderr(errors):
+            cli.main(["convert", self.text, "-o", self.binary, "--profile"])
+        self.assertIn("lecture", errors.getvalue())
+        self.assertIn("total", errors.getvalue())
+
+    def test_missing_input_exits_with_error(self):
+        with redirect_stderr(StringIO()), self.assertRaises(SystemExit) as context:
+            cli.main(["stats", self.path("missing.poly")])
+        self.assertEqual(context.exception.code, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,22 @@
+import pickle
+import subprocess
+import sys
+import threading
 import unittest
 
-from geometry.collection import Collection
+import numpy as np
+
+from geometry.collection import Collection, CollectionBuilder
 from geometry.shapes.polygon import Polygon
 from geometry.shapes.rectangle import Rectangle
+from geometry.utilities import collision
 from geometry.vertice import Vertice
 
 
+class LabelledCollection(Collection):
+    label = None
+
+
 class TestCollection(unittest.TestCase):
     def setUp(self):
         self.polygon1 = Polygon([Vertice(0, 0), Vertice(1, 0), Vertice(0, 1)])
@@ -23,6 +34,8 @@ class TestCollection(unittest.TestCase):
                 'divisions': (2, 2)
             }
         }
+        # Espace réduit : les collections aléatoires y sont générées rapidement.
+        self.small_space = {'space': Rectangle(Vertice(), 200, 200), 'divisions': (2, 2)}
 
     def test_random_collection_with_default_options(self):
         collection = Collection.random()
@@ -96,6 +109,53 @@ class TestCollection(unittest.TestCase):
         with self.assertRaises(IndexError):
             _ = self.collection[2]
 
+    def test_getitem_slice_returns_view_sharing_coordinates(self):
+        collection = Collection.from_buffers([[0, 0], [1, 0], [0, 1], [5, 5], [6, 5], [6, 6], [8, 8], [9, 8], [9, 9]],
+                                             [0, 3, 6, 9])
+        view = collection[1:]
+        self.assertEqual(len(view), 2)
+        self.assertTrue(np.shares_memory(view.buffers()[0], collection.buffers()[0]))
+        self.assertEqual(view.buffers()[1].tolist(), [0, 3, 6])
+        self.assertEqual(view[0].vertices, [Vertice(5, 5), Vertice(6, 5), Vertice(6, 6)])
+        self.assertIsNone(collection._polygons)
+
+    def test_getitem_mask_selects_polygons(self):
+        collection = Collection([self.polygon1, Rectangle(Vertice(2, 3), 4, 5), self.polygon2])
+        view = collection[collection.areas() > 1]
+        self.assertEqual(len(view), 2)
+        self.assertEqual(view.areas().tolist(), [20, 2])
+        self.assertEqual(view.bounds().tolist(), collection.bounds()[1:].tolist())
+        self.assertIsInstance(view[0], Rectangle)
+        self.assertIs(view[1], self.polygon2)
+        self.assertEqual(view.buffers()[0].tolist(), collection.buffers()[0][3:].tolist())
+
+    def test_getitem_index_array_composes_views(self):
+        collection = Collection([self.polygon1, self.polygon2, Rectangle(Vertice(2, 3), 4, 5)])
+        view = collection[[2, 0, -1]][1:]
+        self.assertEqual(len(view), 2)
+        self.assertIs(view[0], self.polygon1)
+        self.assertIs(view[np.int64(1)], collection[2])
+        self.assertEqual(view.rectangle_table()[0].tolist(), [1])
+        self.assertEqual(pickle.loads(pickle.dumps(view))[1].length, 4)
+
+    def test_getitem_view_detaches_on_append(self):
+        view = self.collection[:1]
+        view.append(self.polygon2)
+        self.assertEqual(len(view), 2)
+        self.assertEqual(len(self.collection), 2)
+
+    def test_getitem_raises_error_for_invalid_selection(self):
+        with self.assertRaises(IndexError):
+            _ = self.collection[np.array([True])]
+        with self.assertRaises(IndexError):
+            _ = self.collection[[0, 2]]
+        with self.assertRaises(TypeError):
+            _ = self.collection['0']
+
+    def test_areas_returns_unsigned_areas(self):
+        clockwise = Polygon([Vertice(0, 0), Vertice(0, 2), Vertice(2, 0)])
+        self.assertEqual(Collection([self.polygon1, clockwise]).areas().tolist(), [0.5, 2])
+
     def test_str_returns_correct_representation(self):
         self.assertEqual(str(self.collection), f"{str(self.polygon1)}\n\n{str(self.polygon2)}")
 
@@ -122,6 +182,411 @@ class TestCollection(unittest.TestCase):
         with self.assertRaises(TypeError):
             _ = self.collection + "invalid"
 
+    def test_iadd_adds_polygon_in_place(self):
+        collection = self.collection
+        polygon3 = Polygon([Vertice(0, 0), Vertice(3, 0), Vertice(0, 3)])
+        collection += polygon3
+        self.assertIs(collection, self.collection)
+        self.assertEqual(collection[2], polygon3)
+
+    def test_iadd_raises_error_for_invalid_type(self):
+        with self.assertRaises(TypeError):
+            self.collection += "invalid"
+
+    def test_append_invalidates_buffers(self):
+        _ = self.collection.bounds()
+        self.collection.append(Polygon([Vertice(0, 0), Vertice(3, 0), Vertice(0, 3)]))
+        self.assertEqual(self.collection.bounds().tolist()[-1], [0, 0, 3, 3])
+
+    def test_extend_adds_collection_in_place(self):
+        self.collection.extend(Collection([self.polygon1]))
+        self.assertEqual(len(self.collection), 3)
+
+    def test_extend_raises_error_for_invalid_type(self):
+        with self.assertRaises(TypeError):
+            self.collection.extend(["invalid"])
+
+    def test_builder_builds_collection_with_buffers(self):
+        builder = CollectionBuilder(capacity=1, vertices_capacity=1)
+        builder.extend([self.polygon1, self.polygon2, Rectangle(Vertice(5, 5), 1, 2)])
+        collection = builder.build()
+
+        self.assertEqual(len(builder), 3)
+        self.assertEqual(collection[2].width, 2)
+        coordinates, offsets = collection.buffers()
+        expected_coordinates, expected_offsets = Collection(collection.polygons).buffers()
+        self.assertTrue(np.array_equal(coordinates, expected_coordinates))
+        self.assertTrue(np.array_equal(offsets, expected_offsets))
+
+    def test_builder_raises_error_for_invalid_type(self):
+        with self.assertRaises(TypeError):
+            CollectionBuilder().append("invalid")
+
+    def test_random_collection_has_exactly_count_polygons(self):
+        for count in (1, 2, 17, 100):
+            self.assertEqual(len(Collection.random({'type': 'rectangle', 'count': count})), count)
+
+    def test_random_grid_placement_has_count_polygons_without_overlap(self):
+        collection = Collection.random({'type': 'simple', 'count': 500, 'placement': 'grid', 'density': 0.7})
+        self.assertEqual(len(collection), 500)
+
+        bounds = collection.bounds()
+        overlaps = ((bounds[:, None, 0] < bounds[None, :, 2]) & (bounds[None, :, 0] < bounds[:, None, 2])
+                    & (bounds[:, None, 1] < bounds[None, :, 3]) & (bounds[None, :, 1] < bounds[:, None, 3]))
+        np.fill_diagonal(overlaps, False)
+        self.assertFalse(overlaps.any())
+
+    def test_random_convex_collection_has_exact_vertices_counts(self):
+        form = {'min_vertices_count': 5, 'max_vertices_count': 9}
+        space = {'space': Rectangle(Vertice(), 400, 400), 'divisions': (2, 2)}
+        for placement in ('subdivision', 'grid'):
+            collection = Collection.random({'type': 'convex', 'count': 20, 'form': form, 'space': space,
+                                            'placement': placement})
+            self.assertEqual(len(collection), 20)
+            for polygon in collection.polygons:
+                self.assertTrue(5 <= len(polygon) <= 9)
+                self.assertEqual(len(polygon.convex_hull()), len(polygon))
+
+    def test_random_convex_collection_has_integer_coordinates(self):
+        collection = Collection.random({'type': 'convex', 'count': 50, 'space': self.small_space, 'placement': 'grid'})
+        coordinates, _ = collection.buffers()
+        self.assertTrue((coordinates == np.rint(coordinates)).all())
+        self.assertEqual(collection.astype(np.int32).dtype, np.int32)
+
+    def test_random_convex_collection_raises_error_when_space_is_too_small(self):
+        form = {'min_vertices_count': 9, 'max_vertices_count': 9}
+        with self.assertRaises(ValueError):
+            Collection.random({'type': 'convex', 'count': 5, 'form': form,
+                               'space': {'space': Rectangle(Vertice(), 3, 3), 'divisions': (2, 2)}})
+
+    def test_random_grid_placement_stays_in_space(self):
+        space = Rectangle(Vertice(100, 50), 200, 300)
+        collection = Collection.random({'count': 50, 'placement': 'grid', 'space': {'space': space}})
+        bounds = collection.bounds()
+        self.assertTrue((bounds[:, :2] >= [100, 50]).all() and (bounds[:, 2:] <= [400, 250]).all())
+
+    def test_random_grid_placement_raises_error_when_space_is_full(self):
+        space = Rectangle(Vertice(), 10, 10)
+        with self.assertRaises(ValueError):
+            Collection.random({'count': 1000, 'placement': 'grid', 'space': {'space': space}})
+
+    def test_random_collection_with_invalid_placement(self):
+        with self.assertRaises(ValueError):
+            Collection.random({'placement': 'spiral'})
+        with self.assertRaises(ValueError):
+            Collection.random({'placement': 'grid', 'density': 1.5})
+
+    def test_pickle_round_trip_preserves_polygons(self):
+        collection = Collection([self.polygon1, Rectangle(Vertice(2, 3), 4, 5)])
+        restored = pickle.loads(pickle.dumps(collection))
+        self.assertEqual([polygon.vertices for polygon in restored], [polygon.vertices for polygon in collection])
+        self.assertIsInstance(restored[1], Rectangle)
+        self.assertEqual(restored[1].length, 4)
+
+    def test_pickle_round_trip_keeps_polygons_modified_in_place(self):
+        collection = Collection.random({'count': 3, 'placement': 'grid'})
+        collection.polygons[0].vertices.append(Vertice(1, 1))
+        collection.polygons[0].translate(100, 0, inplace=True)
+        collection.polygons[1].simplify()
+        restored = pickle.loads(pickle.dumps(collection))
+        self.assertEqual([polygon.vertices for polygon in restored], [polygon.vertices for polygon in collection])
+
+    def test_pickle_round_trip_keeps_subclass_and_attributes(self):
+        collection = LabelledCollection([self.polygon1, Rectangle(Vertice(2, 3), 4, 5)])
+        collection.label = "parcelles"
+        restored = pickle.loads(pickle.dumps(collection))
+        self.assertIsInstance(restored, LabelledCollection)
+        self.assertEqual(restored.label, "parcelles")
+        self.assertIsInstance(restored[1], Rectangle)
+
+    def test_pickle_does_not_create_polygons(self):
+        restored = pickle.loads(pickle.dumps(self.collection))
+        self.assertEqual(len(restored), 2)
+        self.assertEqual(restored.bounds().tolist(), self.collection.bounds().tolist())
+        self.assertIsNone(restored._polygons)
+
+    def test_from_buffers_creates_polygons_on_access(self):
+        collection = Collection.from_buffers([[0, 0], [1, 0], [0, 1], [5, 5], [6, 5], [6, 6]], [0, 3, 6])
+        self.assertEqual(len(collection), 2)
+        self.assertEqual(collection[1].vertices, [Vertice(5, 5), Vertice(6, 5), Vertice(6, 6)])
+
+    def test_from_buffers_raises_error_for_invalid_offsets(self):
+        with self.assertRaises(ValueError):
+            Collection.from_buffers([[0, 0], [1, 0], [0, 1]], [0, 2])
+
+    def test_from_buffers_keeps_integer_coordinates(self):
+        collection = Collection.from_buffers(np.array([[0, 0], [4, 0], [0, 4]], dtype=np.int32), [0, 3])
+        self.assertEqual(collection.dtype, np.int32)
+        self.assertEqual(collection.astype(np.float64).dtype, np.float64)
+        self.assertEqual(Collection.from_buffers([[0, 0], [4, 0], [0, 4]], [0, 3]).dtype, np.float64)
+
+    def test_astype_int32_halves_memory_and_keeps_results(self):
+        collection = Collection.random({'type': 'simple', 'count': 12, 'space': self.small_space})
+        collection = Collection.from_buffers(np.round(collection.buffers()[0]), collection.buffers()[1])
+        integer = collection.astype(np.int32)
+        self.assertEqual(integer.dtype, np.int32)
+        self.assertEqual(2 * integer.buffers()[0].nbytes, collection.buffers()[0].nbytes)
+        self.assertEqual(integer.bounds().tolist(), collection.bounds().tolist())
+        self.assertEqual(integer.areas().tolist(), collection.areas().tolist())
+        self.assertEqual(integer.overlapping_pairs().tolist(), collection.overlapping_pairs().tolist())
+        self.assertEqual(integer.largest_interior_rectangles().tolist(),
+                         collection.largest_interior_rectangles().tolist())
+        self.assertEqual(integer[[0, 2]].dtype, np.int32)
+        self.assertEqual(integer[3].vertices, collection[3].vertices)
+
+    def test_astype_int32_keeps_rectangles_through_pickle(self):
+        collection = Collection([self.polygon1, Rectangle(Vertice(2, 3), 4, 5)]).astype(np.int32)
+        restored = pickle.loads(pickle.dumps(collection))
+        self.assertEqual(restored.dtype, np.int32)
+        self.assertIsInstance(restored[1], Rectangle)
+
+    def test_astype_raises_error_for_invalid_coordinates(self):
+        with self.assertRaises(ValueError):
+            Collection([Polygon([Vertice(0, 0), Vertice(1.5, 0), Vertice(0, 1)])]).astype(np.int32)
+        with self.assertRaises(ValueError):
+            Collection.from_buffers([[0, 0], [2 ** 31, 0], [0, 1]], [0, 3], dtype=np.int32)
+        with self.assertRaises(ValueError):
+            self.collection.astype(np.float32)
+
+    def test_from_mask_creates_one_polygon_per_region(self):
+        mask = np.zeros((30, 40), dtype=bool)
+        mask[2:8, 3:9] = True
+        mask[10:25, 20:35] = True
+        mask[15:20, 25:30] = False
+        collection = Collection.from_mask(mask)
+        self.assertEqual(len(collection), 2)
+        self.assertIsNone(collection._polygons)
+        self.assertEqual(sorted(collection.bounds().tolist()), [[3, 2, 8, 7], [20, 10, 34, 24]])
+        self.assertEqual(len(Collection.from_mask(mask, holes=True)), 3)
+
+    def test_from_contours_simplifies_contours(self):
+        rows, columns = np.mgrid[:100, :100]
+        disk = (rows - 50) ** 2 + (columns - 50) ** 2 <= 40 ** 2
+        exact = Collection.from_mask(disk)
+        simplified = Collection.from_mask(disk, epsilon=1.5)
+        self.assertLess(len(simplified.buffers()[0]), len(exact.buffers()[0]) / 2)
+        self.assertAlmostEqual(simplified.areas()[0], exact.areas()[0], delta=exact.areas()[0] * 0.02)
+
+    def test_from_contours_accepts_flat_arrays_and_skips_degenerate_contours(self):
+        collection = Collection.from_contours([np.array([[0., 0.], [4., 0.], [0., 3.]]), np.array([[[1, 1]]])])
+        self.assertEqual(len(collection), 1)
+        self.assertEqual(collection[0].vertices, [Vertice(0, 0), Vertice(4, 0), Vertice(0, 3)])
+        self.assertEqual(len(Collection.from_contours([])), 0)
+
+    def test_from_mask_raises_error_for_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            Collection.from_mask(np.zeros(5))
+        with self.assertRaises(ValueError):
+            Collection.from_mask(np.ones((5, 5)), epsilon=-1)
+
+    def test_bounds_returns_bounding_boxes(self):
+        self.assertEqual(self.collection.bounds().tolist(), [[0, 0, 1, 1], [0, 0, 2, 2]])
+
+    def test_buffers_are_invalidated_when_polygons_change(self):
+        _ = self.collection.bounds()
+        self.collection.polygons = [self.polygon2]
+        self.assertEqual(self.collection.bounds().tolist(), [[0, 0, 2, 2]])
+
+    def test_sort_spatially_reorders_buffers_and_polygons(self):
+        far_rectangle, empty = Rectangle(Vertice(50, 50), 2, 2), Polygon()
+        collection = Collection([far_rectangle, empty, self.polygon2, self.polygon1])
+        expected_areas = collection.areas()[[3, 2, 0, 1]]
+        order = collection.sort_spatially()
+        self.assertEqual(order.tolist(), [3, 2, 0, 1])
+        for polygon, expected in zip(collection.polygons, [self.polygon1, self.polygon2, far_rectangle, empty]):
+            self.assertIs(polygon, expected)
+        self.assertEqual(collection.areas().tolist(), expected_areas.tolist())
+        self.assertEqual(collection.rectangle_table()[0].tolist(), [2])
+        self.assertEqual(collection.buffers()[1].tolist(), [0, 3, 6, 10, 10])
+
+    def test_sort_spatially_keeps_buffer_backed_collections_lazy(self):
+        collection = Collection.random({'count': 30, 'placement': 'grid'})
+        expected = collection.buffers()
+        lazy = Collection.from_buffers(*expected)
+        order = lazy.sort_spatially('morton')
+        self.assertIsNone(lazy._polygons)
+        self.assertEqual(sorted(order.tolist()), list(range(30)))
+        coordinates, offsets = lazy.buffers()
+        for position, index in enumerate(order.tolist()):
+            np.testing.assert_array_equal(coordinates[offsets[position]:offsets[position + 1]],
+                                          expected[0][expected[1][index]:expected[1][index + 1]])
+        with self.assertRaises(ValueError):
+            lazy.sort_spatially('peano')
+
+    def test_overlapping_pairs_returns_overlapping_polygons(self):
+        far_polygon = Polygon([Vertice(10, 10), Vertice(11, 10), Vertice(10, 11)])
+        concave_polygon = Polygon([Vertice(-1, -1), Vertice(3, -1), Vertice(3, 3), Vertice(2.5, 3),
+                                   Vertice(2.5, 0), Vertice(-1, 0)])
+        collection = Collection([self.polygon1, far_polygon, self.polygon2, concave_polygon])
+        self.assertEqual(collection.overlapping_pairs().tolist(), [[0, 2], [0, 3], [2, 3]])
+
+    def test_overlapping_pairs_matches_brute_force(self):
+        collection = Collection([Polygon.random(Rectangle(Vertice(x, y), 100, 100), 5, simplify=True)
+                                 for x in range(0, 500, 60) for y in range(0, 500, 60)])
+        coordinates, offsets = collection.buffers()
+        polygons = [coordinates[offsets[i]:offsets[i + 1]] for i in range(len(collection))]
+        expected = [[i, j] for i in range(len(collection)) for j in range(i + 1, len(collection))
+                    if collision.polygons_overlap(polygons[i], polygons[j])]
+        self.assertEqual(collection.overlapping_pairs().tolist(), expected)
+
+    def test_overlapping_pairs_chunks_stream_the_same_pairs(self):
+        collection = Collection([Polygon.random(Rectangle(Vertice(x, y), 100, 100), 5, simplify=True)
+                                 for x in range(0, 500, 60) for y in range(0, 500, 60)])
+        chunks = list(collection.overlapping_pairs_chunks(chunk_size=8))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(sorted(map(tuple, np.concatenate(chunks).tolist())),
+                         list(map(tuple, collection.overlapping_pairs().tolist())))
+        self.assertEqual(collection.overlapping_pairs(chunk_size=8).tolist(), collection.overlapping_pairs().tolist())
+
+    def test_queries_see_polygons_modified_in_place(self):
+        collection = Collection.random({'count': 4, 'placement': 'grid'})
+        bounds = collection.bounds().copy()
+        collection.polygons[0].translate(100, 0, inplace=True)
+        collection.polygons[1].vertices.append(Vertice(0, 0))
+        collection.polygons[2].vertices[0].x += 1
+
+        coordinates, offsets = collection.buffers()
+        self.assertEqual(len(coordinates), sum(len(polygon) for polygon in collection.polygons))
+        self.assertEqual(collection.bounds()[0].tolist(), (bounds[0] + [100, 0, 100, 0]).tolist())
+        self.assertEqual(collection.bounds()[1, :2].tolist(), [0, 0])
+        self.assertEqual(collection.bounds().tolist(), Collection(collection.polygons).bounds().tolist())
+        np.testing.assert_allclose(collection.areas(), [abs(polygon.area()) for polygon in collection.polygons])
+
+    def test_union_area_sees_rectangles_transformed_in_place(self):
+        collection = Collection([Rectangle(Vertice(0, 0), 2, 2), Rectangle(Vertice(1, 1), 2, 2)])
+        self.assertEqual(collection.union_area(), 7)
+        collection.polygons[0].translate(10, 0, inplace=True)
+        self.assertEqual(collection.union_area(), 8)
+        collection.polygons[1].scale(2, inplace=True)
+        self.assertEqual(collection.union_area(), 20)
+
+    def test_rectangle_table_follows_replaced_polygons(self):
+        collection = Collection([Rectangle(Vertice(0, 0), 2, 2), Rectangle(Vertice(1, 1), 2, 2)])
+        self.assertEqual(collection.union_area(), 7)
+        collection.polygons[0] = Polygon(collection.polygons[0].vertices)
+        self.assertEqual(collection.rectangle_table()[0].tolist(), [1])
+        with self.assertRaises(ValueError):
+            collection.union_area()
+
+    def test_overlapping_pairs_with_empty_collection(self):
+        self.assertEqual(Collection().overlapping_pairs().shape, (0, 2))
+
+    def test_locate_points_returns_containing_polygons(self):
+        collection = Collection([self.polygon2, Polygon(), Rectangle(Vertice(5, 5), 2, 2), self.polygon1])
+        points = np.array([[0.25, 0.25], [1.2, 0.5], [6, 6], [3, 3], [np.nan, 0.]])
+        self.assertEqual(collection.locate_points(points).tolist(), [0, 0, 2, -1, -1])
+        self.assertEqual(collection[[3, 2]].locate_points(points, chunk_size=2).tolist(), [0, -1, 1, -1, -1])
+
+    def test_locate_points_with_empty_collection(self):
+        self.assertEqual(Collection().locate_points(np.zeros((3, 2))).tolist(), [-1, -1, -1])
+
+    def test_transform_matches_polygons(self):
+        collection = Collection([self.polygon1, Rectangle(Vertice(1, 1), 2, 3), Polygon(), self.polygon2])
+        angles = np.array([0.5, 0., 1., -2.])
+        rotated = collection.rotate(angles, centers=[[1, 1], [0, 0], [0, 0], [2, 0]])
+        self.assertIsNone(rotated._polygons)
+        self.assertIs(type(rotated[1]), Rectangle)
+        for polygon, angle, center, result in zip(collection.polygons, angles, [(1, 1), (0, 0), (0, 0), (2, 0)],
+                                                  rotated.polygons):
+            np.testing.assert_allclose(result.coordinates(), polygon.rotate(angle, center).coordinates())
+
+        scaled = collection.scale(2)
+        self.assertEqual(repr(scaled[1]), "Rectangle(Vertice(2.0, 2.0), 4.0, 6.0)")
+        self.assertIs(type(collection.scale(-1)[1]), Polygon)
+        with self.assertRaises(ValueError):
+            collection.translate([1, 2], 0)
+
+    def test_transform_in_place_replaces_buffers(self):
+        collection = Collection([self.polygon1, self.polygon2])
+        self.assertIs(collection.translate(1, 2, inplace=True), collection)
+        self.assertEqual(collection[0].vertices, [Vertice(1, 2), Vertice(2, 2), Vertice(1, 3)])
+        self.assertEqual(self.polygon1.vertices, [Vertice(0, 0), Vertice(1, 0), Vertice(0, 1)])
+        self.assertEqual(collection.bounds().tolist(), [[1, 2, 2, 3], [1, 2, 3, 4]])
+
+        view = collection[1:]
+        view.scale(2, inplace=True)
+        self.assertEqual(view.bounds().tolist(), [[2, 4, 6, 8]])
+        self.assertEqual(collection.bounds().tolist(), [[1, 2, 2, 3], [1, 2, 3, 4]])
+
+    def test_moments_match_polygons(self):
+        collection = Collection([self.polygon1, Rectangle(Vertice(1, 1), 2, 3), self.polygon2])
+        areas, centers, second_moments, orientations = collection.moments()
+        np.testing.assert_allclose(areas, collection.areas())
+        np.testing.assert_allclose(centers, [[1 / 3, 1 / 3], [2.5, 2], [2 / 3, 2 / 3]])
+        for index, polygon in enumerate(collection.polygons):
+            expected = polygon.moments()
+            np.testing.assert_allclose(second_moments[index], expected[2])
+            self.assertAlmostEqual(orientations[index], expected[3])
+
+    def test_union_area_of_rectangles(self):
+        collection = Collection([Rectangle(Vertice(0, 0), 2, 2), Rectangle(Vertice(1, 1), 2, 2),
+                                 Rectangle(Vertice(10, 0), 1, 3)])
+        self.assertEqual(collection.union_area(), 10.)
+        self.assertEqual(collection.covered_mask((3, 11)).sum(), 10)
+        self.assertEqual(Collection().union_area(), 0.)
+        with self.assertRaises(ValueError):
+            self.collection.union_area()
+
+    def test_minkowski_sum_inflates_every_polygon(self):
+        kernel = Rectangle(Vertice(-1, -1), 2, 2)
+        collection = Collection([self.polygon1, Polygon(), Rectangle(Vertice(5, 5), 1, 3)])
+        inflated = collection.minkowski_sum(kernel)
+        self.assertEqual(len(inflated), 3)
+        self.assertEqual(inflated[0].vertices, self.polygon1.minkowski_sum(kernel).vertices)
+        self.assertEqual(len(inflated[1]), 0)
+        self.assertEqual(inflated.bounds()[2].tolist(), [4, 4, 9, 7])
+        # Aire de la somme : aire du triangle, aire du carré et deux fois leur aire mixte (2)
+        np.testing.assert_allclose(inflated.areas()[[0, 2]], [0.5 + 4 + 2 * 2, 3 * 5])
+
+    def test_delaunay_triangulates_all_vertices(self):
+        collection = Collection([Rectangle(Vertice(0, 0), 2, 2), Rectangle(Vertice(2, 0), 2, 2), self.polygon2])
+        triangulation = collection.delaunay(np.random.default_rng(0))
+        coordinates = collection.buffers()[0]
+        self.assertEqual(triangulation.points.tolist(), coordinates.tolist())
+        # Sommets distincts : (0, 0), (2, 0), (2, 2), (0, 2), (4, 0), (4, 2), le sommet (0, 2) du triangle étant partagé.
+        self.assertEqual(len(np.unique(triangulation.representatives)), 6)
+        self.assertEqual(len(triangulation), 4)
+        self.assertTrue(np.isin(triangulation.edges(), np.unique(triangulation.representatives)).all())
+
+    def test_calipers_batches_match_polygons(self):
+        collection = Collection.random({'type': 'simple', 'count': 8, 'space': self.small_space})
+        np.testing.assert_allclose(collection.diameters(), [polygon.diameter() for polygon in collection.polygons])
+        np.testing.assert_allclose(collection.widths(), [polygon.width() for polygon in collection.polygons])
+        np.testing.assert_allclose(collection.min_area_rects(),
+                                   [polygon.min_area_rect().coordinates() for polygon in collection.polygons])
+
+    def test_largest_interior_rectangles_matches_polygons(self):
+        collection = Collection.random({'type': 'simple', 'count': 12, 'space': self.small_space})
+        expected = [[rectangle.vertices[0].x, rectangle.vertices[0].y, rectangle.vertices[2].x, rectangle.vertices[2].y]
+                    for rectangle in (polygon.largestinteriorrectangle() for polygon in collection.polygons)]
+        rectangles = collection.largest_interior_rectangles(workers=2, chunk_size=5)
+        self.assertEqual(rectangles.tolist(), expected)
+
+    def test_largest_interior_rectangles_with_threads_in_new_interpreter(self):
+        # Aucun module n'est chargé avant le démarrage des fils d'exécution.
+        script = ("from geometry.collection import Collection\n"
+                  "collection = Collection.from_buffers([[0, 0], [9, 0], [9, 9], [0, 9]] * 4, [0, 4, 8, 12, 16])\n"
+                  "print(collection.largest_interior_rectangles(workers=4, chunk_size=1).tolist())\n")
+        output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=120,
+                                check=True).stdout
+        self.assertEqual(output.strip(), str([[0.0, 0.0, 9.0, 9.0]] * 4))
+
+    def test_largest_interior_rectangles_with_processes(self):
+        collection = Collection.random({'type': 'simple', 'count': 4, 'space': self.small_space})
+        self.assertEqual(collection.largest_interior_rectangles(workers=2, executor='process', chunk_size=2).tolist(),
+                         collection.largest_interior_rectangles().tolist())
+
+    def test_largest_interior_rectangles_cancelled_returns_nan(self):
+        cancel = threading.Event()
+        cancel.set()
+        collection = Collection.random({'type': 'simple', 'count': 4, 'space': self.small_space})
+        rectangles = collection.largest_interior_rectangles(cancel=cancel)
+        self.assertTrue(np.isnan(rectangles).all())
+
+    def test_largest_interior_rectangles_raises_error_for_invalid_executor(self):
+        with self.assertRaises(ValueError):
+            self.collection.largest_interior_rectangles(executor='gpu')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,69 @@
+import io
+import unittest
+
+import numpy as np
+
+from geometry import formats
+from geometry.collection import Collection
+
+
+class FormatsTests(unittest.TestCase):
+
+    def setUp(self):
+        self.collection = Collection.random({'type': 'simple', 'count': 10, 'placement': 'grid'})
+        self.coordinates, self.offsets = self.collection.buffers()
+
+    def read_all(self, stream, file_format, chunk_size=formats.CHUNK_SIZE):
+        chunks = list(formats.read_chunks(stream, file_format, chunk_size))
+        coordinates = np.concatenate([coordinates for coordinates, _ in chunks])
+        counts = np.concatenate([np.diff(offsets) for _, offsets in chunks])
+        return chunks, coordinates, counts
+
+    def test_text_matches_poly_file_print(self):
+        stream = io.StringIO()
+        self.collection.poly_file_print(stream)
+        _, coordinates, counts = self.read_all(io.BytesIO(stream.getvalue().encode()), 'text')
+        np.testing.assert_array_equal(coordinates, self.coordinates)
+        np.testing.assert_array_equal(counts, np.diff(self.offsets))
+
+    def test_text_round_trip_in_small_chunks(self):
+        data = formats.encode_text(self.coordinates, self.offsets)
+        chunks, coordinates, counts = self.read_all(io.BytesIO(data), 'text', chunk_size=3)
+        self.assertEqual([len(offsets) - 1 for _, offsets in chunks], [3, 3, 3, 1])
+        np.testing.assert_array_equal(coordinates, self.coordinates)
+        np.testing.assert_array_equal(counts, np.diff(self.offsets))
+
+    def test_text_polygons_spanning_blocks(self):
+        original = formats.TEXT_BLOCK_LINES
+        formats.TEXT_BLOCK_LINES = 4
+        try:
+            data = formats.encode_text(self.coordinates, self.offsets)
+            _, coordinates, counts = self.read_all(io.BytesIO(data), 'text', chunk_size=2)
+        finally:
+            formats.TEXT_BLOCK_LINES = original
+        np.testing.assert_array_equal(coordinates, self.coordinates)
+        np.testing.assert_array_equal(counts, np.diff(self.offsets))
+
+    def test_binary_round_trip(self):
+        data = formats.MAGIC + formats.encode_binary(self.coordinates, self.offsets) \
+            + formats.encode_binary(self.coordinates[:0], np.zeros(1, dtype=np.int64))
+        chunks, coordinates, counts = self.read_all(io.BytesIO(data), 'binary')
+        self.assertEqual(len(chunks), 2)
+        np.testing.assert_array_equal(coordinates, self.coordinates)
+        np.testing.assert_array_equal(counts, np.diff(self.offsets))
+
+    def test_binary_raises_error_for_invalid_data(self):
+        with self.assertRaises(ValueError):
+            list(formats.read_binary(io.BytesIO(b"not a polygon file")))
+        truncated = formats.MAGIC + formats.encode_binary(self.coordinates, self.offsets)[:-8]
+        with self.assertRaises(ValueError):
+            list(formats.read_binary(io.BytesIO(truncated)))
+
+    def test_format_from_path(self):
+        self.assertEqual(formats.format_from_path("shapes.polyb"), 'binary')
+        self.assertEqual(formats.format_from_path("shapes.poly"), 'text')
+        self.assertEqual(formats.format_from_path("-"), 'text')
+
+
+if __name__ == '__main__':
+    unittest.main()
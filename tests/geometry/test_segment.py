@@ -1,8 +1,11 @@
 import unittest
 from copy import copy
 
+import numpy as np
+
 import geometry.vertice
-from geometry.segment import Segment
+from geometry.segment import Segment, SegmentArray
+from geometry.utilities import collision
 from geometry.vertice import Vertice
 
 
@@ -54,6 +57,70 @@ class SegmentTests(unittest.TestCase):
     def test_segment_is_not_horizontal(self):
         self.assertFalse(self.segment.is_horizontal())
 
+    def test_segment_intersects_crossing_segment(self):
+        other = Segment([Vertice(1, 4), Vertice(3, 2)])
+        self.assertTrue(self.segment.intersects(other))
+
+    def test_segment_does_not_intersect_parallel_segment(self):
+        other = Segment([Vertice(1, 3), Vertice(3, 5)])
+        self.assertFalse(self.segment.intersects(other))
+
+
+class SegmentArrayTests(unittest.TestCase):
+
+    def setUp(self):
+        self.segments = SegmentArray([[[0, 0], [3, 4]], [[1, 1], [1, 5]], [[0, 2], [4, 2]]])
+
+    def test_segment_array_rejects_invalid_shape(self):
+        with self.assertRaises(ValueError):
+            SegmentArray([[0, 0], [1, 1]])
+
+    def test_lengths_are_calculated_correctly(self):
+        self.assertEqual(self.segments.lengths().tolist(), [5, 4, 4])
+
+    def test_vectors_are_calculated_correctly(self):
+        self.assertEqual(self.segments.vectors().tolist(), [[3, 4], [0, 4], [4, 0]])
+
+    def test_is_vertical_and_is_horizontal_masks(self):
+        self.assertEqual(self.segments.is_vertical().tolist(), [False, True, False])
+        self.assertEqual(self.segments.is_horizontal().tolist(), [False, False, True])
+
+    def test_getitem_returns_segment_or_segment_array(self):
+        self.assertEqual(self.segments[1], Segment([Vertice(1, 1), Vertice(1, 5)]))
+        self.assertEqual(len(self.segments[self.segments.is_vertical()]), 1)
+
+    def test_intersects_returns_pairwise_matrix(self):
+        others = SegmentArray([[[0, 3], [4, 3]], [[2, 0], [4, 0]], [[1, 5], [1, 7]], [[1.5, 2], [6, 8]]])
+        self.assertEqual(self.segments.intersects(others).tolist(), [
+            [True, False, False, True],
+            [True, False, True, False],
+            [False, False, False, True],
+        ])
+
+    def test_intersecting_pairs_match_pairwise_test(self):
+        rng = np.random.default_rng(0)
+        ends = rng.integers(0, 30, (200, 2, 2)).astype(np.float64)
+        segments, others = SegmentArray(ends[:120]), SegmentArray(ends[120:])
+        expected = collision.segments_intersect(segments.ends[:, None, 0], segments.ends[:, None, 1],
+                                                others.ends[None, :, 0], others.ends[None, :, 1])
+        self.assertEqual(segments.intersecting_pairs(others).tolist(), np.argwhere(expected).tolist())
+        self.assertEqual(segments.intersects(others).tolist(), expected.tolist())
+
+        expected = collision.segments_intersect(segments.ends[:, None, 0], segments.ends[:, None, 1],
+                                                segments.ends[None, :, 0], segments.ends[None, :, 1])
+        self.assertEqual(segments.intersecting_pairs().tolist(), np.argwhere(np.triu(expected, 1)).tolist())
+        with self.assertRaises(TypeError):
+            segments.intersecting_pairs(Segment([Vertice(0, 0), Vertice(1, 1)]))
+
+    def test_from_segments_matches_segments(self):
+        segments = [Segment([Vertice(0, 0), Vertice(1, 1)]), Segment([Vertice(2, 2), Vertice(3, 1)])]
+        array = SegmentArray.from_segments(segments)
+        self.assertTrue(np.array_equal(array.lengths(), [segment.length() for segment in segments]))
+
+    def test_from_polygon_closes_the_polygon(self):
+        edges = SegmentArray.from_polygon([[0, 0], [1, 0], [0, 1]])
+        self.assertEqual(edges.ends[-1].tolist(), [[0, 1], [0, 0]])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,94 @@
+import multiprocessing
+import pickle
+import unittest
+
+import numpy as np
+
+from geometry.collection import Collection
+from geometry.shapes.polygon import Polygon
+from geometry.shapes.rectangle import Rectangle
+from geometry.shared import SharedCollection
+from geometry.vertice import Vertice
+
+
+def total_bounds(collection):
+    return collection.bounds().sum()
+
+
+class SharedCollectionTests(unittest.TestCase):
+
+    def setUp(self):
+        self.collection = Collection([
+            Polygon([Vertice(0, 0), Vertice(1, 0), Vertice(0, 1)]),
+            Rectangle(Vertice(2, 3), 4, 5),
+            Polygon([Vertice(0, 0), Vertice(2, 0), Vertice(2, 2), Vertice(0, 2)]),
+        ])
+        self.shared = SharedCollection.create(self.collection)
+
+    def tearDown(self):
+        self.shared.close()
+        self.shared.unlink()
+
+    def test_direct_instantiation_raises_error(self):
+        with self.assertRaises(TypeError):
+            SharedCollection()
+
+    def test_shared_collection_has_same_buffers(self):
+        coordinates, offsets = self.shared.buffers()
+        expected_coordinates, expected_offsets = self.collection.buffers()
+        self.assertTrue(np.array_equal(coordinates, expected_coordinates))
+        self.assertTrue(np.array_equal(offsets, expected_offsets))
+        self.assertEqual(len(self.shared), 3)
+
+    def test_shared_collection_recreates_polygons_and_rectangles(self):
+        self.assertEqual([polygon.vertices for polygon in self.shared],
+                         [polygon.vertices for polygon in self.collection])
+        self.assertIsInstance(self.shared[1], Rectangle)
+
+    def test_pickled_shared_collection_attaches_to_same_memory(self):
+        data = pickle.dumps(self.shared)
+        self.assertLess(len(data), 200)
+
+        attached = pickle.loads(data)
+        coordinates, _ = attached.buffers()
+        coordinates[0, 0] = 42.
+        self.assertEqual(self.shared.buffers()[0][0, 0], 42.)
+        del coordinates
+        attached.close()
+
+    def test_pickled_modified_shared_collection_keeps_local_contents(self):
+        self.shared.extend(Collection([Polygon([Vertice(5, 5), Vertice(6, 5), Vertice(5, 6)])]))
+        restored = pickle.loads(pickle.dumps(self.shared))
+        self.assertNotIsInstance(restored, SharedCollection)
+        self.assertEqual(len(restored), 4)
+        self.assertEqual(restored[3].vertices, [Vertice(5, 5), Vertice(6, 5), Vertice(5, 6)])
+        self.assertIsInstance(restored[1], Rectangle)
+
+    def test_pickled_shared_collection_keeps_polygons_modified_in_place(self):
+        self.shared.polygons[0].translate(10, 0, inplace=True)
+        self.shared.polygons[2].add_vertice(Vertice(1, 3))
+        restored = pickle.loads(pickle.dumps(self.shared))
+        self.assertNotIsInstance(restored, SharedCollection)
+        self.assertEqual([polygon.vertices for polygon in restored], [polygon.vertices for polygon in self.shared])
+        self.assertIsInstance(restored[1], Rectangle)
+
+    def test_pickled_closed_shared_collection_keeps_created_polygons(self):
+        with SharedCollection.create(self.collection) as shared:
+            _ = shared.polygons
+        restored = pickle.loads(pickle.dumps(shared))
+        self.assertEqual([polygon.vertices for polygon in restored], [polygon.vertices for polygon in self.collection])
+
+    def test_shared_collection_in_worker_processes(self):
+        with multiprocessing.get_context("spawn").Pool(2) as pool:
+            results = pool.map(total_bounds, [self.shared] * 2)
+        self.assertEqual(results, [self.collection.bounds().sum()] * 2)
+
+    def test_context_manager_releases_memory(self):
+        with SharedCollection.create(self.collection) as shared:
+            name = shared.name
+        with self.assertRaises(FileNotFoundError):
+            SharedCollection.attach(name, 0, 0, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
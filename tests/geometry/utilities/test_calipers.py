@@ -0,0 +1,54 @@
+import math
+import unittest
+
+import numpy as np
+
+from geometry.shapes.polygon import convex_hull_points
+from geometry.utilities import calipers
+
+
+class CalipersTests(unittest.TestCase):
+
+    def setUp(self):
+        self.points = np.random.default_rng(0).random((200, 2)) * 100
+        self.hull = np.array(convex_hull_points(self.points))
+
+    def brute_force_rectangle_area(self):
+        best = math.inf
+        for index in range(len(self.hull)):
+            edge = self.hull[(index + 1) % len(self.hull)] - self.hull[index]
+            along = edge / np.linalg.norm(edge)
+            normal = np.array([-along[1], along[0]])
+            along_projections, normal_projections = self.hull @ along, self.hull @ normal
+            best = min(best, np.ptp(along_projections) * np.ptp(normal_projections))
+        return best
+
+    def test_antipodal_pairs_cover_every_edge(self):
+        pairs = list(calipers.antipodal_pairs(self.hull))
+        self.assertEqual([index for index, _ in pairs], list(range(len(self.hull))))
+
+    def test_diameter_matches_brute_force(self):
+        expected = max(math.dist(first, second) for first in self.points.tolist() for second in self.points.tolist())
+        self.assertAlmostEqual(calipers.diameter(self.hull), expected)
+
+    def test_diameter_of_degenerate_hulls(self):
+        self.assertEqual(calipers.diameter([(1., 1.)]), 0.)
+        self.assertEqual(calipers.diameter([(0., 0.), (3., 4.)]), 5.)
+
+    def test_width_of_square(self):
+        self.assertAlmostEqual(calipers.width([(0., 0.), (2., 0.), (2., 2.), (0., 2.)]), 2.)
+        self.assertEqual(calipers.width([(0., 0.), (3., 4.)]), 0.)
+
+    def test_min_area_rect_matches_brute_force(self):
+        rectangle = calipers.min_area_rect(self.hull)
+        area = np.linalg.norm(rectangle[1] - rectangle[0]) * np.linalg.norm(rectangle[2] - rectangle[1])
+        self.assertAlmostEqual(area, self.brute_force_rectangle_area())
+
+    def test_min_area_rect_of_rotated_square(self):
+        square = [(1., 0.), (2., 1.), (1., 2.), (0., 1.)]
+        rectangle = calipers.min_area_rect(square)
+        np.testing.assert_allclose(sorted(map(tuple, rectangle.tolist())), sorted(square), atol=1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
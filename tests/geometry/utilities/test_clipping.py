@@ -0,0 +1,33 @@
+import unittest
+
+import numpy as np
+
+from geometry.utilities import clipping
+
+
+class ClippingTests(unittest.TestCase):
+
+    def setUp(self):
+        self.square = np.array([(0, 0), (10, 0), (10, 10), (0, 10)], dtype=np.float64)
+
+    def test_clip_to_rectangle_overlapping_corner(self):
+        clipped = clipping.clip_to_rectangle(self.square, (5, 5, 20, 20))
+        self.assertEqual(sorted(map(tuple, clipped.tolist())), [(5, 5), (5, 10), (10, 5), (10, 10)])
+
+    def test_clip_to_rectangle_triangle_crossing_window(self):
+        triangle = np.array([(-5, 0), (5, 0), (0, 10)], dtype=np.float64)
+        clipped = clipping.clip_to_rectangle(triangle, (0, 0, 10, 10))
+        self.assertEqual(len(clipped), 4)
+        self.assertTrue((clipped[:, 0] >= 0).all())
+
+    def test_clip_buffers_drops_outside_polygons_and_keeps_indices(self):
+        coordinates = np.concatenate([self.square + 100, self.square, self.square + 2])
+        offsets = np.array([0, 4, 8, 12])
+        clipped, new_offsets, kept = clipping.clip_buffers(coordinates, offsets, (1, 1, 13, 13))
+        self.assertEqual(kept.tolist(), [1, 2])
+        self.assertEqual(new_offsets.tolist(), [0, 4, 8])
+        np.testing.assert_array_equal(clipped[4:], self.square + 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+
+import numpy as np
+
+from geometry.utilities import collision
+
+
+class CollisionTests(unittest.TestCase):
+
+    def setUp(self):
+        self.square = np.array([[0., 0.], [2., 0.], [2., 2.], [0., 2.]])
+        self.shifted_square = self.square + 1
+        self.far_square = self.square + 10
+        self.inner_square = self.square / 4 + 0.5
+        self.concave = np.array([[0., 0.], [4., 0.], [4., 4.], [3., 4.], [3., 1.], [1., 1.], [1., 4.], [0., 4.]])
+
+    def test_segments_intersect_with_crossing_segments(self):
+        self.assertTrue(collision.segments_intersect(
+            np.array([0., 0.]), np.array([2., 2.]), np.array([0., 2.]), np.array([2., 0.])))
+
+    def test_segments_intersect_with_collinear_overlapping_segments(self):
+        self.assertTrue(collision.segments_intersect(
+            np.array([0., 0.]), np.array([2., 0.]), np.array([1., 0.]), np.array([3., 0.])))
+
+    def test_segments_intersect_with_collinear_disjoint_segments(self):
+        self.assertFalse(collision.segments_intersect(
+            np.array([0., 0.]), np.array([1., 0.]), np.array([2., 0.]), np.array([3., 0.])))
+
+    def test_points_in_polygon(self):
+        points = np.array([[1., 1.], [3., 3.]])
+        self.assertEqual(collision.points_in_polygon(points, self.square).tolist(), [True, False])
+
+    def test_convex_polygons_overlap(self):
+        self.assertTrue(collision.convex_polygons_overlap(self.square, self.shifted_square))
+        self.assertTrue(collision.convex_polygons_overlap(self.square, self.inner_square))
+        self.assertFalse(collision.convex_polygons_overlap(self.square, self.far_square))
+
+    def test_polygons_overlap_with_concave_polygon(self):
+        # Carré logé dans le creux du polygone concave, sans le toucher.
+        hollow = np.array([[1.5, 2.], [2.5, 2.], [2.5, 3.], [1.5, 3.]])
+        self.assertFalse(collision.polygons_overlap(self.concave, hollow))
+        self.assertTrue(collision.polygons_overlap(self.concave, hollow + [1., 0.]))
+        self.assertTrue(collision.polygons_overlap(self.square * 4 - 1, hollow))
+
+    def test_convex_mask(self):
+        coordinates = np.concatenate([self.square, self.concave])
+        offsets = np.array([0, 4, 12])
+        self.assertEqual(collision.convex_mask(coordinates, offsets).tolist(), [True, False])
+
+    def test_sweep_and_prune_matches_brute_force(self):
+        rng = np.random.default_rng(0)
+        corners = rng.uniform(0, 100, (200, 2))
+        bounds = np.concatenate([corners, corners + rng.uniform(0, 10, (200, 2))], axis=1)
+
+        expected = [(i, j) for i in range(200) for j in range(i + 1, 200)
+                    if bounds[i, 0] <= bounds[j, 2] and bounds[j, 0] <= bounds[i, 2]
+                    and bounds[i, 1] <= bounds[j, 3] and bounds[j, 1] <= bounds[i, 3]]
+        self.assertEqual(collision.sweep_and_prune(bounds).tolist(), [list(pair) for pair in expected])
+
+        # Paquets de quelques paires : mêmes paires, produites par morceaux
+        chunks = list(collision.sweep_and_prune_chunks(bounds, chunk_size=16))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(sorted(map(tuple, np.concatenate(chunks).tolist())), expected)
+        self.assertEqual(collision.sweep_and_prune(bounds, chunk_size=16).tolist(), [list(pair) for pair in expected])
+
+
+    def test_grid_index_lists_boxes_of_each_cell(self):
+        bounds = np.array([[0., 0., 1.5, 0.5], [np.nan] * 4, [1.2, 1.2, 1.8, 1.8]])
+        origin, shape, cell_offsets, cell_boxes = collision.grid_index(bounds, 1.)
+        self.assertEqual(origin.tolist(), [0., 0.])
+        self.assertEqual(shape, (2, 2))
+        self.assertEqual(cell_offsets.tolist(), [0, 1, 2, 2, 3])
+        self.assertEqual(cell_boxes.tolist(), [0, 0, 2])
+
+    def test_locate_points_matches_brute_force(self):
+        rng = np.random.default_rng(0)
+        polygons = [self.square, self.concave + 5, self.inner_square, self.far_square, self.concave * 3 + 20]
+        coordinates = np.concatenate(polygons)
+        offsets = np.cumsum([0] + [len(polygon) for polygon in polygons])
+        bounds = np.array([[*polygon.min(axis=0), *polygon.max(axis=0)] for polygon in polygons])
+        points = rng.uniform(-2, 35, (3000, 2))
+
+        expected = np.full(len(points), -1)
+        for index in reversed(range(len(polygons))):
+            expected[collision.points_in_polygon(points, polygons[index])] = index
+        for cell_size in (None, 0.5, 100.):
+            located = collision.locate_points(points, coordinates, offsets, bounds, cell_size, chunk_size=700)
+            self.assertEqual(located.tolist(), expected.tolist())
+
+    def test_locate_points_without_polygons(self):
+        points = np.array([[0., 0.], [np.nan, 1.]])
+        located = collision.locate_points(points, np.empty((0, 2)), np.zeros(1, dtype=np.int64), np.empty((0, 4)))
+        self.assertEqual(located.tolist(), [-1, -1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+
+import numpy as np
+
+from geometry.utilities import coverage
+
+
+class CoverageTests(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        corners = rng.integers(0, 50, (300, 2)).astype(np.float64)
+        self.bounds = np.hstack([corners, corners + rng.integers(0, 20, (300, 2))])
+        # Couverture de référence sur la grille des pixels unité
+        self.expected = np.zeros((80, 80), dtype=bool)
+        for x_min, y_min, x_max, y_max in self.bounds.astype(int):
+            self.expected[y_min:y_max, x_min:x_max] = True
+
+    def test_union_area_matches_brute_force(self):
+        self.assertEqual(coverage.union_area(self.bounds), self.expected.sum())
+
+    def test_union_area_ignores_empty_boxes(self):
+        bounds = np.array([[0., 0., 2., 2.], [1., 1., 3., 3.], [np.nan] * 4, [5., 5., 5., 9.]])
+        self.assertEqual(coverage.union_area(bounds), 7.)
+        self.assertEqual(coverage.union_area(np.empty((0, 4))), 0.)
+
+    def test_covered_mask_matches_brute_force(self):
+        mask = coverage.covered_mask(self.bounds, (80, 80), (0., 0., 80., 80.))
+        np.testing.assert_array_equal(mask, self.expected)
+        half = coverage.covered_mask(self.bounds, (40, 160), (0., 0., 80., 80.))
+        np.testing.assert_array_equal(half, self.expected[1::2].repeat(2, axis=1))
+        with self.assertRaises(ValueError):
+            coverage.covered_mask(self.bounds, (0, 10), (0., 0., 80., 80.))
+
+
+if __name__ == '__main__':
+    unittest.main()
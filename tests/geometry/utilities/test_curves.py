@@ -0,0 +1,45 @@
+import unittest
+
+import numpy as np
+
+from geometry.utilities import curves
+
+
+class CurvesTests(unittest.TestCase):
+
+    def setUp(self):
+        x, y = np.meshgrid(np.arange(8), np.arange(8))
+        self.x, self.y = x.ravel(), y.ravel()
+
+    def test_morton_keys_interleave_bits(self):
+        keys = curves.morton_keys(np.array([1, 0, 3, 5]), np.array([0, 1, 3, 2]))
+        self.assertEqual(keys.tolist(), [1, 2, 15, 25])
+
+    def test_hilbert_keys_of_first_order(self):
+        self.assertEqual(curves.hilbert_keys([0, 0, 1, 1], [0, 1, 1, 0], 1).tolist(), [0, 1, 2, 3])
+
+    def test_hilbert_keys_visit_each_cell_once_through_neighbors(self):
+        keys = curves.hilbert_keys(self.x, self.y, 3)
+        self.assertEqual(sorted(keys.tolist()), list(range(64)))
+        order = np.argsort(keys)
+        steps = np.abs(np.diff(self.x[order])) + np.abs(np.diff(self.y[order]))
+        self.assertTrue((steps == 1).all())
+
+    def test_curve_keys_place_missing_points_last(self):
+        points = np.array([[5., 5.], [np.nan, np.nan], [0., 0.], [10., 10.]])
+        for curve in curves.CURVES:
+            keys = curves.curve_keys(points, curve)
+            self.assertEqual(np.argsort(keys)[-1], 1)
+            self.assertEqual(keys[2], 0)
+
+    def test_curve_keys_with_degenerate_points(self):
+        self.assertEqual(curves.curve_keys(np.array([[1., 2.], [1., 2.]])).tolist(), [0, 0])
+        self.assertEqual(curves.curve_keys(np.empty((0, 2))).shape, (0,))
+
+    def test_curve_keys_raises_error_for_unknown_curve(self):
+        with self.assertRaises(ValueError):
+            curves.curve_keys(np.zeros((1, 2)), 'peano')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+
+import numpy as np
+
+from geometry.utilities import predicates
+from geometry.utilities.delaunay import DelaunayTriangulation
+
+
+class DelaunayTests(unittest.TestCase):
+
+    def assertDelaunay(self, triangulation):
+        points, triangles, neighbors = triangulation.points, triangulation.triangles, triangulation.neighbors
+        a, b, c = (points[triangles[:, k]] for k in range(3))
+        self.assertTrue((predicates.orientations(a, b, c) > 0).all())
+
+        # Aucun point n'est strictement dans le cercle circonscrit d'un triangle.
+        signs = predicates.incircles(a[:, None], b[:, None], c[:, None], points[None, :])
+        self.assertFalse((signs > 0).any())
+
+        # Deux voisins partagent l'arête opposée au sommet correspondant.
+        for triangle, vertices in enumerate(triangles.tolist()):
+            for position, neighbor in enumerate(neighbors[triangle].tolist()):
+                if neighbor >= 0:
+                    edge = {vertices[(position + 1) % 3], vertices[(position + 2) % 3]}
+                    self.assertLessEqual(edge, set(triangles[neighbor].tolist()))
+                    self.assertIn(triangle, neighbors[neighbor].tolist())
+
+        # Formule d'Euler : T = 2 n - 2 - h, h étant le nombre d'arêtes de l'enveloppe convexe.
+        inserted = len(np.unique(triangulation.representatives))
+        self.assertEqual(len(triangles), 2 * inserted - 2 - (neighbors < 0).sum())
+
+    def test_random_points(self):
+        rng = np.random.default_rng(0)
+        triangulation = DelaunayTriangulation(rng.random((300, 2)), rng)
+        self.assertDelaunay(triangulation)
+        self.assertEqual(triangulation.triangles.dtype, np.int64)
+
+    def test_square(self):
+        triangulation = DelaunayTriangulation([(0, 0), (1, 0), (1, 1), (0, 1)], np.random.default_rng(0))
+        self.assertEqual(len(triangulation), 2)
+        self.assertEqual(sorted(np.sum(triangulation.neighbors >= 0, axis=1).tolist()), [1, 1])
+        self.assertEqual(len(triangulation.edges()), 5)
+
+    def test_grid_with_cocircular_and_duplicate_points(self):
+        grid = np.stack(np.meshgrid(np.arange(12.), np.arange(9.)), axis=-1).reshape(-1, 2)
+        triangulation = DelaunayTriangulation(np.concatenate([grid, grid[:20]]), np.random.default_rng(1))
+        self.assertDelaunay(triangulation)
+        self.assertEqual(len(triangulation), 2 * 11 * 8)
+        self.assertEqual(triangulation.representatives[-20:], list(range(20)))
+
+    def test_collinear_points_wait_for_first_triangle(self):
+        triangulation = DelaunayTriangulation([(0, 0), (1, 1), (3, 3), (2, 2)], np.random.default_rng(0))
+        self.assertEqual(triangulation.triangles.shape, (0, 3))
+        self.assertEqual(triangulation.edges().shape, (0, 2))
+
+        triangulation.add([(0, 3)])
+        self.assertDelaunay(triangulation)
+        self.assertEqual(len(triangulation), 3)
+
+    def test_add_points_without_rebuilding(self):
+        rng = np.random.default_rng(2)
+        points = rng.random((400, 2))
+        triangulation = DelaunayTriangulation(points[:200], rng)
+        nodes = len(triangulation.vertices)
+        indices = triangulation.add(points[200:], rng)
+        self.assertEqual(indices.tolist(), list(range(200, 400)))
+        self.assertGreater(len(triangulation.vertices), nodes)
+        self.assertDelaunay(triangulation)
+
+        # En position générale, la triangulation de Delaunay ne dépend pas de l'ordre d'insertion.
+        rebuilt = DelaunayTriangulation(points, rng)
+        self.assertEqual(np.sort(np.sort(triangulation.triangles, axis=1), axis=0).tolist(),
+                         np.sort(np.sort(rebuilt.triangles, axis=1), axis=0).tolist())
+
+    def test_points_outside_hull_and_on_hull_edges(self):
+        triangulation = DelaunayTriangulation([(0, 0), (4, 0), (0, 4)], np.random.default_rng(0))
+        triangulation.add([(2, 0), (2, 2), (8, 0), (-3, -3), (0, 2)])
+        self.assertDelaunay(triangulation)
+
+    def test_raises_error_for_non_finite_points(self):
+        with self.assertRaises(ValueError):
+            DelaunayTriangulation([(0, 0), (1, np.nan), (0, 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
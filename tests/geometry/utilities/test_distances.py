@@ -0,0 +1,55 @@
+import unittest
+
+import numpy as np
+
+from geometry.utilities import distances
+from geometry.vertice import Vertice
+
+
+class DistancesTests(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.points1 = rng.uniform(0, 100, (37, 2))
+        self.points2 = rng.uniform(0, 100, (23, 2))
+        self.expected = np.hypot(self.points1[:, None, 0] - self.points2[None, :, 0],
+                                 self.points1[:, None, 1] - self.points2[None, :, 1])
+
+    def test_as_coordinates_accepts_vertices(self):
+        coordinates = distances.as_coordinates([Vertice(1, 2), Vertice(3, 4)])
+        self.assertEqual(coordinates.tolist(), [[1, 2], [3, 4]])
+
+    def test_as_coordinates_rejects_invalid_shape(self):
+        with self.assertRaises(ValueError):
+            distances.as_coordinates([1, 2, 3])
+
+    def test_pairwise_distances_matches_vertice_distance(self):
+        result = distances.pairwise_distances([Vertice(0, 0), Vertice(3, 4)], [Vertice(3, 0)])
+        self.assertEqual(result.tolist(), [[Vertice(0, 0).distance_to(Vertice(3, 0))],
+                                           [Vertice(3, 4).distance_to(Vertice(3, 0))]])
+
+    def test_pairwise_distances_with_small_blocks(self):
+        result = distances.pairwise_distances(self.points1, self.points2, block_size=5)
+        self.assertTrue(np.allclose(result, self.expected))
+
+    def test_nearest_with_small_blocks(self):
+        minimums, indices = distances.nearest(self.points1, self.points2, block_size=5)
+        self.assertTrue(np.allclose(minimums, self.expected.min(axis=1)))
+        self.assertEqual(indices.tolist(), self.expected.argmin(axis=1).tolist())
+
+    def test_nearest_raises_error_for_empty_set(self):
+        with self.assertRaises(ValueError):
+            distances.nearest(self.points1, np.empty((0, 2)))
+
+    def test_min_and_argmin_distances(self):
+        self.assertTrue(np.allclose(distances.min_distances(self.points1, self.points2), self.expected.min(axis=1)))
+        self.assertEqual(distances.argmin_distances(self.points1, self.points2).tolist(),
+                         self.expected.argmin(axis=1).tolist())
+
+    def test_count_within_with_small_blocks(self):
+        counts = distances.count_within(self.points1, self.points2, 30., block_size=7)
+        self.assertEqual(counts.tolist(), (self.expected <= 30.).sum(axis=1).tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+
+from geometry.shapes.polygon import convex_hull_points
+from geometry.utilities import generation
+
+
+class GenerationTests(unittest.TestCase):
+
+    def test_random_convex_coordinates_have_exact_vertices_count(self):
+        for vertices_count in (3, 4, 7, 32):
+            batch = generation.random_convex_coordinates(200, vertices_count, rng=vertices_count)
+            self.assertEqual(batch.shape, (200, vertices_count, 2))
+            for coordinates in batch:
+                self.assertEqual(len(convex_hull_points(coordinates)), vertices_count)
+
+    def test_random_convex_coordinates_are_counterclockwise_in_unit_square(self):
+        batch = generation.random_convex_coordinates(100, 12, rng=0)
+        np.testing.assert_allclose(batch.min(axis=1), 0, atol=1e-12)
+        np.testing.assert_allclose(batch.max(axis=1), 1)
+
+        x, y = batch[..., 0], batch[..., 1]
+        doubled_areas = (x * np.roll(y, -1, axis=1) - np.roll(x, -1, axis=1) * y).sum(axis=1)
+        self.assertTrue((doubled_areas > 0).all())
+
+    def test_random_convex_coordinates_are_reproducible(self):
+        np.testing.assert_array_equal(generation.random_convex_coordinates(5, 6, rng=42),
+                                      generation.random_convex_coordinates(5, 6, rng=42))
+
+    def test_random_convex_coordinates_raises_error_for_invalid_counts(self):
+        with self.assertRaises(ValueError):
+            generation.random_convex_coordinates(1, 2)
+        with self.assertRaises(ValueError):
+            generation.random_convex_coordinates(-1, 5)
+
+    def test_complete_lattice_polygon_keeps_strict_convexity_in_bounds(self):
+        rng = np.random.default_rng(0)
+        diamond = [(6, 0), (12, 6), (6, 12), (0, 6)]
+        for vertices_count in (4, 7, 10):
+            coordinates = generation.complete_lattice_polygon(diamond, vertices_count, (0, 0, 12, 12), rng)
+            self.assertEqual(coordinates.shape, (vertices_count, 2))
+            self.assertTrue(((coordinates >= 0) & (coordinates <= 12)).all())
+            self.assertEqual(len(convex_hull_points(coordinates)), vertices_count)
+
+        # Un carré de côté 1 ne compte que quatre points entiers.
+        self.assertIsNone(generation.complete_lattice_polygon([(0, 0), (1, 0), (0, 1)], 5, (0, 0, 1, 1), rng))
+
+
+if __name__ == '__main__':
+    unittest.main()
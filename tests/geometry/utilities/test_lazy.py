@@ -0,0 +1,59 @@
+import subprocess
+import sys
+import unittest
+
+from geometry.utilities.lazy import is_loaded, lazy_import, load
+
+
+class LazyTests(unittest.TestCase):
+
+    def test_lazy_import_returns_already_loaded_module(self):
+        self.assertIs(lazy_import("unittest"), unittest)
+
+    def test_lazy_import_raises_error_for_unknown_module(self):
+        with self.assertRaises(ModuleNotFoundError):
+            lazy_import("geometry.unknown_module")
+
+    def test_lazy_import_defers_loading_until_attribute_access(self):
+        script = ("from geometry.utilities.lazy import is_loaded, lazy_import, load\n"
+                  "module = lazy_import('json')\n"
+                  "print(is_loaded(module))\n"
+                  "module.dumps([])\n"
+                  "print(is_loaded(module))\n")
+        output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.split(), ["False", "True"])
+
+    def test_importing_collection_does_not_load_heavy_dependencies(self):
+        script = ("import sys\n"
+                  "from geometry.collection import Collection\n"
+                  "from geometry.shapes.rectangle import Rectangle\n"
+                  "from geometry.vertice import Vertice\n"
+                  "Collection([Rectangle(Vertice(), 2, 3)])[0].area()\n"
+                  "from geometry.utilities.lazy import is_loaded\n"
+                  "print([name for name in ('numpy', 'largestinteriorrectangle')\n"
+                  "       if name in sys.modules and is_loaded(sys.modules[name])])\n")
+        output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "[]")
+
+    def test_package_attributes_give_access_to_submodules(self):
+        script = ("import geometry.vertice\n"
+                  "import geometry.shapes.polygon\n"
+                  "import geometry.segment\n"
+                  "import geometry.shapes.rectangle\n"
+                  "print(geometry.segment.Segment.__name__, geometry.shapes.rectangle.Rectangle.__name__)\n")
+        output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.split(), ["Segment", "Rectangle"])
+
+    def test_load_loads_lazy_module(self):
+        script = ("from geometry.utilities.lazy import is_loaded, lazy_import, load\n"
+                  "module = load(lazy_import('json'))\n"
+                  "print(is_loaded(module), hasattr(module, 'dumps'))\n")
+        output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.split(), ["True", "True"])
+
+    def test_is_loaded_with_regular_module(self):
+        self.assertTrue(is_loaded(sys))
+
+
+if __name__ == '__main__':
+    unittest.main()
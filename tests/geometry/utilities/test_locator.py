@@ -0,0 +1,49 @@
+import unittest
+
+import numpy as np
+
+from geometry.utilities import collision
+from geometry.utilities.locator import BOUNDARY, INSIDE, OUTSIDE, SlabLocator
+
+
+class LocatorTests(unittest.TestCase):
+
+    def setUp(self):
+        # Peigne concave, dont les arêtes verticales partagent leurs abscisses
+        self.comb = np.array([(0, 0), (10, 0), (10, 10), (8, 10), (8, 2), (6, 2), (6, 10), (4, 10), (4, 2),
+                              (2, 2), (2, 10), (0, 10)], dtype=np.float64)
+        self.locator = SlabLocator(self.comb)
+
+    def test_locate_inside_and_outside(self):
+        points = [(1, 5), (5, 9), (5, 1), (3, 5), (7, 9), (11, 5), (-1, 0), (5, 11)]
+        self.assertEqual(self.locator.locate(points).tolist(), [INSIDE] * 3 + [OUTSIDE] * 5)
+
+    def test_locate_boundary(self):
+        points = np.vstack([self.comb, (self.comb + np.roll(self.comb, -1, axis=0)) / 2, [(0, 5), (10, 3), (4, 6)]])
+        self.assertTrue((self.locator.locate(points) == BOUNDARY).all())
+
+    def test_locate_matches_crossing_test(self):
+        rng = np.random.default_rng(0)
+        angles = np.sort(rng.random(200)) * 2 * np.pi
+        radii = 50 + 40 * rng.random(200)
+        star = np.stack([radii * np.cos(angles), radii * np.sin(angles)], axis=1)
+        points = rng.random((5000, 2)) * 200 - 100
+        locations = SlabLocator(star).locate(points, chunk_size=333)
+        np.testing.assert_array_equal(locations == INSIDE, collision.points_in_polygon(points, star))
+
+    def test_contains(self):
+        self.assertEqual(self.locator.contains([(1, 5), (0, 5), (3, 5)]).tolist(), [True, False, False])
+        self.assertEqual(self.locator.contains([(1, 5), (0, 5), (3, 5)], boundary=True).tolist(), [True, True, False])
+
+    def test_structure_size(self):
+        self.assertEqual(len(self.locator.slab_bounds), 6)
+        self.assertEqual(len(self.locator.verticals), 6)
+        self.assertGreater(self.locator.nbytes, 0)
+
+    def test_locator_raises_error_for_degenerate_polygon(self):
+        with self.assertRaises(ValueError):
+            SlabLocator([(0, 0), (1, 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+import numpy as np
+
+from geometry.collection import Collection
+from geometry.utilities import measures
+
+
+class MeasuresTests(unittest.TestCase):
+
+    def test_measures_match_polygons(self):
+        collection = Collection.random({'count': 10, 'placement': 'grid'})
+        coordinates, offsets = collection.buffers()
+        np.testing.assert_allclose(measures.signed_areas(coordinates, offsets),
+                                   [polygon.area() for polygon in collection.polygons])
+        np.testing.assert_allclose(measures.perimeters(coordinates, offsets),
+                                   [polygon.perimeter() for polygon in collection.polygons])
+
+    def test_measures_with_empty_polygons(self):
+        coordinates = np.array([(0, 0), (2, 0), (2, 2), (0, 2)], dtype=np.float64)
+        offsets = np.array([0, 0, 4, 4])
+        self.assertEqual(measures.signed_areas(coordinates, offsets).tolist(), [0., 4., 0.])
+        self.assertEqual(measures.perimeters(coordinates, offsets).tolist(), [0., 8., 0.])
+        self.assertEqual(measures.successors(offsets).tolist(), [1, 2, 3, 0])
+
+    def test_measures_of_integer_coordinates_do_not_overflow(self):
+        square = np.array([(0, 0), (50000, 0), (50000, 50000), (0, 50000)], dtype=np.int32)
+        offsets = np.array([0, 4])
+        self.assertEqual(measures.signed_areas(square, offsets).tolist(), [2.5e9])
+        self.assertEqual(measures.perimeters(square, offsets).tolist(), [2e5])
+
+
+    def test_moments_of_rotated_rectangle(self):
+        rectangle = np.array([(-2, -1), (2, -1), (2, 1), (-2, 1)], dtype=np.float64)
+        angle = np.pi / 6
+        rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+        coordinates = np.concatenate([rectangle, (rectangle @ rotation.T)[::-1] + 1e6])
+        areas, centers, second_moments, orientations = measures.moments(coordinates, np.array([0, 4, 8]))
+
+        np.testing.assert_allclose(areas, [8., 8.])
+        np.testing.assert_allclose(centers, [[0., 0.], [1e6, 1e6]], atol=1e-9)
+        np.testing.assert_allclose(second_moments[0], [32 / 3, 8 / 3, 0.])
+        # Les valeurs propres des moments ne dépendent pas de la rotation.
+        mu20, mu02, mu11 = second_moments[1]
+        np.testing.assert_allclose(np.linalg.eigvalsh([[mu20, mu11], [mu11, mu02]]), [8 / 3, 32 / 3], rtol=1e-6)
+        np.testing.assert_allclose(orientations, [0., angle], atol=1e-9)
+
+    def test_moments_centroid_of_concave_polygon(self):
+        # Union d'un carré 2 x 2 et d'un rectangle 2 x 1 posé à sa droite
+        coordinates = np.array([(0, 0), (4, 0), (4, 1), (2, 1), (2, 2), (0, 2)], dtype=np.float64)
+        areas, centers, _, _ = measures.moments(coordinates, np.array([0, 0, 6]))
+        self.assertEqual(areas[0], 0.)
+        self.assertTrue(np.isnan(centers[0]).all())
+        np.testing.assert_allclose(centers[1], [(4 * 1 + 2 * 3) / 6, (4 * 1 + 2 * 0.5) / 6])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+
+import numpy as np
+
+from geometry.shapes.polygon import convex_hull_points
+from geometry.utilities import minkowski
+
+
+class MinkowskiTests(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        self.kernel = self.random_convex(12)[::-1]
+
+    def random_convex(self, count):
+        return np.array(convex_hull_points(self.rng.normal(size=(count, 2)) * self.rng.uniform(1, 5)))
+
+    def test_minkowski_sums_match_convex_hull_of_vertex_sums(self):
+        polygons = [self.random_convex(self.rng.integers(3, 30)) for _ in range(30)]
+        # Point isolé, polygone vide, carré horaire avec un sommet répété et segment
+        polygons += [np.array([[1., 1.]]), np.empty((0, 2)),
+                     np.array([[0., 2.], [0., 2.], [2., 2.], [2., 0.], [0., 0.]]), np.array([[0., 0.], [3., 3.]])]
+        coordinates = np.concatenate(polygons)
+        offsets = np.cumsum([0] + [len(polygon) for polygon in polygons])
+
+        sums, sums_offsets = minkowski.minkowski_sums(coordinates, offsets, self.kernel)
+        self.assertEqual(len(sums_offsets), len(polygons) + 1)
+        for index, polygon in enumerate(polygons):
+            expected = convex_hull_points((polygon[:, None] + self.kernel[None]).reshape(-1, 2))
+            np.testing.assert_allclose(sums[sums_offsets[index]:sums_offsets[index + 1]],
+                                       np.array(expected).reshape(-1, 2))
+
+    def test_minkowski_sums_reject_non_convex_inputs(self):
+        concave = np.array([[0., 0.], [4., 0.], [4., 4.], [2., 1.], [0., 4.]])
+        with self.assertRaises(ValueError):
+            minkowski.minkowski_sums(concave, np.array([0, 5]), self.kernel)
+        with self.assertRaises(ValueError):
+            minkowski.minkowski_sums(self.kernel, np.array([0, len(self.kernel)]), concave)
+        with self.assertRaises(ValueError):
+            minkowski.minkowski_sums(self.kernel, np.array([0, len(self.kernel)]), [[0., 0.], [1., 1.]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+import numpy as np
+
+from geometry.utilities import predicates
+
+
+class PredicatesTests(unittest.TestCase):
+
+    def setUp(self):
+        # Triplets presque alignés, autour de la droite y = x.
+        steps = np.arange(64) * 2. ** -53
+        self.a = np.stack([0.5 + steps, 0.5 + steps[::-1]], axis=1)
+        self.b = np.full((64, 2), 12.)
+        self.c = np.full((64, 2), 24.)
+
+    def test_orientation_with_clear_turns(self):
+        self.assertEqual(predicates.orientation(0, 0, 1, 0, 0, 1), 1)
+        self.assertEqual(predicates.orientation(0, 0, 0, 1, 1, 0), -1)
+        self.assertEqual(predicates.orientation(0, 0, 1, 1, 2, 2), 0)
+
+    def test_orientation_matches_exact_arithmetic_on_near_collinear_points(self):
+        for a in self.a:
+            self.assertEqual(predicates.orientation(*a, *self.b[0], *self.c[0]),
+                             predicates.exact_orientation(*a, *self.b[0], *self.c[0]))
+
+    def test_orientations_matches_scalar_predicate(self):
+        expected = [predicates.exact_orientation(*a, *b, *c) for a, b, c in zip(self.a, self.b, self.c)]
+        self.assertEqual(predicates.orientations(self.a, self.b, self.c).tolist(), expected)
+        self.assertIn(1, expected)
+        self.assertIn(-1, expected)
+
+    def test_orientations_with_broadcasting(self):
+        signs = predicates.orientations(np.array([0., 0.]), np.array([1., 0.]), np.array([[0., 1.], [0., -1.]]))
+        self.assertEqual(signs.tolist(), [1, -1])
+
+    def test_orientations_of_integer_points_match_exact_arithmetic(self):
+        rng = np.random.default_rng(0)
+        limit = predicates.INTEGER_COORDINATE_LIMIT
+        # Points alignés sur de grandes coordonnées, puis décalés d'une unité
+        a = rng.integers(-limit // 4, limit // 4, (200, 2))
+        b = rng.integers(-limit // 4, limit // 4, (200, 2))
+        c = 2 * b - a + rng.integers(-1, 2, (200, 2))
+        expected = [predicates.exact_orientation(*p, *q, *r) for p, q, r in zip(a.tolist(), b.tolist(), c.tolist())]
+        self.assertEqual(predicates.orientations(a.astype(np.int32), b.astype(np.int32), c).tolist(), expected)
+        self.assertEqual(predicates.orientations(a, b, c).tolist(), expected)
+        self.assertIn(0, expected)
+
+    def test_orientations_of_integers_beyond_limit_use_exact_fallback(self):
+        limit = predicates.INTEGER_COORDINATE_LIMIT
+        a, b, c = np.array([-4 * limit, 0]), np.array([0, 1]), np.array([4 * limit, 2])
+        self.assertFalse(predicates.within_integer_limit(a, b, c))
+        self.assertEqual(predicates.orientations(a, b, c).tolist(), 0)
+
+    def test_incircle_with_clear_cases(self):
+        # Cercle unité parcouru dans le sens trigonométrique
+        circle = (1., 0., 0., 1., -1., 0.)
+        self.assertEqual(predicates.incircle(*circle, 0., 0.), 1)
+        self.assertEqual(predicates.incircle(*circle, 2., 0.), -1)
+        self.assertEqual(predicates.incircle(*circle, 0., -1.), 0)
+
+    def test_incircles_matches_exact_arithmetic_on_near_cocircular_points(self):
+        d = np.stack([np.zeros(64), -1. + np.arange(-32, 32) * 2. ** -52], axis=1)
+        a, b, c = np.array([1., 0.]), np.array([0., 1.]), np.array([-1., 0.])
+        expected = [predicates.exact_incircle(*a, *b, *c, *point) for point in d]
+        self.assertEqual(predicates.incircles(a, b, c, d).tolist(), expected)
+        self.assertEqual([predicates.incircle(*a, *b, *c, *point) for point in d], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
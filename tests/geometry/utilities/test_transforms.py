@@ -0,0 +1,47 @@
+import unittest
+
+import numpy as np
+
+from geometry.utilities import transforms
+
+
+class TransformsTests(unittest.TestCase):
+
+    def setUp(self):
+        self.square = np.array([[0., 0.], [1., 0.], [1., 1.], [0., 1.]])
+
+    def test_rotation_keeps_center_fixed(self):
+        matrix = transforms.rotation(np.pi / 2, (1., 1.))
+        np.testing.assert_allclose(transforms.apply(self.square, matrix), [[2., 0.], [2., 1.], [1., 1.], [1., 0.]],
+                                   atol=1e-12)
+
+    def test_matrices_compose_by_product(self):
+        composed = transforms.translation(1., 2.) @ transforms.scaling(2., 3.)
+        np.testing.assert_allclose(transforms.apply(self.square, composed),
+                                   self.square * [2., 3.] + [1., 2.])
+
+    def test_apply_with_one_matrix_per_polygon(self):
+        coordinates = np.concatenate([self.square, self.square[:3]])
+        offsets = np.array([0, 4, 4, 7])
+        matrices = transforms.scaling([1., 5., 2.], center=[[0., 0.], [0., 0.], [1., 1.]])
+        expected = np.concatenate([self.square, self.square[:3] * 2 - 1])
+        np.testing.assert_allclose(transforms.apply(coordinates, matrices, offsets), expected)
+        with self.assertRaises(ValueError):
+            transforms.apply(coordinates, matrices[:2], offsets)
+
+    def test_affine_part_rejects_invalid_matrices(self):
+        with self.assertRaises(ValueError):
+            transforms.affine_part(np.eye(2))
+        with self.assertRaises(ValueError):
+            transforms.affine_part([[1., 0., 0.], [0., 1., 0.], [1., 0., 1.]])
+        self.assertEqual(transforms.affine_part(transforms.translation([1., 2.], 0.)).shape, (2, 2, 3))
+
+    def test_axis_aligned(self):
+        matrices = np.stack([transforms.translation(1., 1.), transforms.scaling(2., 0.5),
+                             transforms.scaling(-1., 1.), transforms.rotation(0.1), transforms.scaling(0., 1.)])
+        self.assertEqual(transforms.axis_aligned(transforms.affine_part(matrices)).tolist(),
+                         [True, True, False, False, False])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+
+from geometry.utilities import collision, triangulation
+
+
+class TriangulationTests(unittest.TestCase):
+
+    def setUp(self):
+        # Peigne concave, parcouru dans le sens trigonométrique
+        self.comb = np.array([(0, 0), (10, 0), (10, 10), (8, 10), (8, 2), (6, 2), (6, 10), (4, 10), (4, 2),
+                              (2, 2), (2, 10), (0, 10)], dtype=np.float64)
+
+    def test_triangulate_covers_polygon_area(self):
+        triangles = self.comb[triangulation.triangulate(self.comb)]
+        self.assertAlmostEqual(triangulation.triangle_areas(triangles).sum(), 68.)
+
+    def test_triangulate_accepts_clockwise_polygons(self):
+        indices = triangulation.triangulate(self.comb[::-1])
+        self.assertAlmostEqual(triangulation.triangle_areas(self.comb[::-1][indices]).sum(), 68.)
+
+    def test_triangulate_skips_collinear_vertices(self):
+        square = np.array([(0, 0), (1, 0), (2, 0), (2, 2), (0, 2)], dtype=np.float64)
+        areas = triangulation.triangle_areas(square[triangulation.triangulate(square)])
+        self.assertTrue((areas > 0).all())
+        self.assertAlmostEqual(areas.sum(), 4.)
+
+    def test_triangulate_raises_error_for_self_intersecting_polygon(self):
+        bowtie = np.array([(0, 0), (2, 2), (2, 0), (0, 2)], dtype=np.float64)
+        with self.assertRaises(ValueError):
+            triangulation.triangulate(bowtie)
+
+    def test_triangulate_raises_error_for_polygon_with_ears_crossing_itself(self):
+        crossing = np.array([(0, 0), (10, 0), (10, 10), (3, 10), (3, -5), (6, -5), (6, 5), (0, 5)],
+                            dtype=np.float64)
+        with self.assertRaises(ValueError):
+            triangulation.triangulate(crossing)
+
+    def test_is_simple(self):
+        self.assertTrue(triangulation.is_simple(self.comb, block_size=5))
+        self.assertTrue(triangulation.is_simple(np.array([(0, 0), (1, 0), (1, 0), (1, 1), (0, 1)])))
+        # Sommet posé sur une arête non consécutive
+        self.assertFalse(triangulation.is_simple(np.array([(0, 0), (4, 0), (4, 4), (2, 0), (0, 4)]), block_size=2))
+
+    def test_sample_triangles_stays_inside_and_is_uniform(self):
+        triangles = self.comb[triangulation.triangulate(self.comb)]
+        points = triangulation.sample_triangles(triangles, 100000, rng=0)
+        self.assertEqual(points.shape, (100000, 2))
+        self.assertTrue(collision.points_in_polygon(points, self.comb).all())
+        # La première dent couvre 20 / 68 de l'aire.
+        self.assertAlmostEqual((points[:, 0] < 2).mean(), 20 / 68, delta=0.01)
+
+    def test_sample_triangles_raises_error_for_invalid_input(self):
+        triangles = self.comb[triangulation.triangulate(self.comb)]
+        with self.assertRaises(ValueError):
+            triangulation.sample_triangles(triangles, -1)
+        with self.assertRaises(ValueError):
+            triangulation.sample_triangles(np.empty((0, 3, 2)), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()